@@ -9,16 +9,32 @@ user login tracking, and log-based alerts
 import os
 import sys
 import argparse
-from rich.console import Console
+import importlib
+import importlib.util
+from typing import Dict, Tuple
 
-# Try to import Textual, but fall back to Rich-only if it's not available
-try:
-    from textual.app import App
-    TEXTUAL_AVAILABLE = True
-except ImportError:
-    TEXTUAL_AVAILABLE = False
+# Standalone components: name -> (module path, banner label).
+# Modules are only imported when their component is selected.
+COMPONENTS: Dict[str, Tuple[str, str]] = {
+    "cpu": ("netdash.cpu_monitor", "CPU Monitor"),
+    "memory": ("netdash.memory_monitor", "Memory Monitor"),
+    "network": ("netdash.network_stats", "Network Statistics"),
+    "login": ("netdash.login_tracker", "Login Tracker"),
+    "log": ("netdash.log_monitor", "Log Monitor"),
+    "disk": ("netdash.disk_usage", "Disk Usage Monitor"),
+    "socket": ("netdash.socket_tracker", "Socket Tracker"),
+    "ports": ("netdash.ports_monitor", "Ports Monitor"),
+    "system": ("netdash.system_health", "System Health Monitor"),
+    "service": ("netdash.service_manager", "Service Manager"),
+    "container": ("netdash.container_monitor", "Container Monitor"),
+    "vm": ("netdash.vm_monitor", "VM Monitor"),
+    "security": ("netdash.security_monitor", "Security Monitor"),
+}
 
-from netdash.dashboard import main as run_dashboard
+
+def _textual_available() -> bool:
+    """Check whether Textual is installed without importing it"""
+    return importlib.util.find_spec("textual") is not None
 
 
 def parse_arguments():
@@ -47,8 +63,7 @@ def parse_arguments():
     
     parser.add_argument(
         "--component", 
-        choices=["cpu", "memory", "network", "login", "log", "disk", "socket", 
-                "ports", "system", "service", "container", "vm", "security"],
+        choices=list(COMPONENTS),
         help="Run only a specific component"
     )
     
@@ -58,14 +73,39 @@ def parse_arguments():
         help="Path to a custom log file to monitor"
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        "--panels",
+        type=lambda value: [name.strip() for name in value.split(",") if name.strip()],
+        help="Comma-separated dashboard panels to show. Panel names differ from "
+             "--component names: cpu, memory, system_health, network, sockets, ports, "
+             "disk, containers, vms, services, logins, security, log_monitor"
+    )
+    
+    args = parser.parse_args()
+    
+    # Checked against the dashboard's own panel names. It's only imported
+    # here when panels were selected, so --help stays fast.
+    if args.panels:
+        from netdash.dashboard import RichDashboard
+        names = [slot for _, slot, _, _ in RichDashboard.PANELS]
+        unknown = [name for name in args.panels if name not in names]
+        if unknown:
+            parser.error(
+                f"unknown panels: {', '.join(unknown)} (choose from {', '.join(names)})"
+            )
+    
+    return args
 
 
 def main():
     """Main entry point for the application"""
-    console = Console()
     args = parse_arguments()
     
+    # Rich is only imported once argv has been validated, so --help and
+    # argument errors don't pay for it
+    from rich.console import Console
+    console = Console()
+    
     # Set environment variables based on arguments
     if args.debug:
         os.environ["NETDASH_DEBUG"] = "1"
@@ -75,72 +115,26 @@ def main():
     
     # If a specific component is requested, run only that
     if args.component:
-        if args.component == "cpu":
-            console.print("[bold green]Running CPU Monitor component[/bold green]")
-            from netdash.cpu_monitor import main as run_cpu
-            run_cpu()
-        elif args.component == "memory":
-            console.print("[bold green]Running Memory Monitor component[/bold green]")
-            from netdash.memory_monitor import main as run_memory
-            run_memory()
-        elif args.component == "network":
-            console.print("[bold green]Running Network Statistics component[/bold green]")
-            from netdash.network_stats import main as run_network
-            run_network()
-        elif args.component == "login":
-            console.print("[bold green]Running Login Tracker component[/bold green]")
-            from netdash.login_tracker import main as run_login
-            run_login()
-        elif args.component == "log":
-            console.print("[bold green]Running Log Monitor component[/bold green]")
-            from netdash.log_monitor import main as run_log
-            if args.log_file:
-                run_log(args.log_file)
-            else:
-                run_log()
-        elif args.component == "disk":
-            console.print("[bold green]Running Disk Usage Monitor component[/bold green]")
-            from netdash.disk_usage import main as run_disk
-            run_disk()
-        elif args.component == "socket":
-            console.print("[bold green]Running Socket Tracker component[/bold green]")
-            from netdash.socket_tracker import main as run_socket
-            run_socket()
-        elif args.component == "ports":
-            console.print("[bold green]Running Ports Monitor component[/bold green]")
-            from netdash.ports_monitor import main as run_ports
-            run_ports()
-        elif args.component == "system":
-            console.print("[bold green]Running System Health Monitor component[/bold green]")
-            from netdash.system_health import main as run_system
-            run_system()
-        elif args.component == "service":
-            console.print("[bold green]Running Service Manager component[/bold green]")
-            from netdash.service_manager import main as run_service
-            run_service()
-        elif args.component == "container":
-            console.print("[bold green]Running Container Monitor component[/bold green]")
-            from netdash.container_monitor import main as run_container
-            run_container()
-        elif args.component == "vm":
-            console.print("[bold green]Running VM Monitor component[/bold green]")
-            from netdash.vm_monitor import main as run_vm
-            run_vm()
-        elif args.component == "security":
-            console.print("[bold green]Running Security Monitor component[/bold green]")
-            from netdash.security_monitor import main as run_security
-            run_security()
+        module_path, label = COMPONENTS[args.component]
+        console.print(f"[bold green]Running {label} component[/bold green]")
+        module = importlib.import_module(module_path)
+        if args.component == "log" and args.log_file:
+            module.main(args.log_file)
+        else:
+            module.main()
     
     # Run the full dashboard
-    use_textual = TEXTUAL_AVAILABLE and not args.rich_only
+    textual_available = _textual_available()
+    use_textual = textual_available and not args.rich_only
     
-    if not TEXTUAL_AVAILABLE and not args.rich_only:
+    if not textual_available and not args.rich_only:
         console.print("[yellow]Textual library not found. Falling back to Rich-only dashboard.[/yellow]")
         console.print("[yellow]Install Textual for the full experience: pip install textual[/yellow]")
         use_textual = False
     
     try:
-        run_dashboard(use_textual, args.log_file)
+        from netdash.dashboard import main as run_dashboard
+        run_dashboard(use_textual, args.log_file, args.panels)
     except KeyboardInterrupt:
         console.print("\n[yellow]NetDash terminated by user[/yellow]")
     except Exception as e:
@@ -0,0 +1,43 @@
+"""
+Numeric helpers shared by the monitors
+
+The monitors usually work on a handful of counters per device, where
+plain Python beats the cost of importing anything heavier. numpy is only
+loaded, if installed, for hosts with enough cores or devices to benefit.
+"""
+
+import functools
+from typing import List, Sequence
+
+
+@functools.lru_cache(maxsize=None)
+def load_numpy():
+    """
+    Import numpy on first use
+    
+    Returns:
+        The numpy module, or None if it isn't installed
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def rates(prev: Sequence[float], curr: Sequence[float], dt: float) -> List[float]:
+    """
+    Convert two samples of monotonic counters into per-second rates
+    
+    Args:
+        prev: Previous counter values
+        curr: Current counter values, in the same order
+        dt: Seconds elapsed between the two samples
+    
+    Returns:
+        List of per-second rates, one per counter
+    """
+    if dt <= 0:
+        return [0.0] * len(curr)
+    inv_dt = 1.0 / dt
+    return [(c - p) * inv_dt for p, c in zip(prev, curr)]
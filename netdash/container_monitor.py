@@ -11,12 +11,18 @@ Displays information about Docker/LXD containers:
 import os
 import sys
 import time
-import asyncio
 import subprocess
 import json
+import shutil
+import socket
+import functools
+import threading
+import http.client
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional, Any, Set
 from datetime import datetime
-from rich.console import Console
+from rich.console import Console, Group
 from rich.live import Live
 from rich.table import Table
 from rich.panel import Panel
@@ -39,6 +45,18 @@ STATUS_COLORS = {
     'unknown': 'white',
 }
 
+# Container status keyed by the leading word of `docker ps` status strings
+# ("Up 2 hours", "Exited (0) ...", "Created", "Restarting (1) ...", "Dead").
+# Anything else, such as "Removal In Progress", is left unknown.
+_STATUS_MAP = {
+    'Up': 'running',
+    'Exited': 'exited',
+    'Created': 'created',
+    'Restarting': 'restarting',
+    'Paused': 'paused',
+    'Dead': 'dead',
+}
+
 # Container type icons
 CONTAINER_ICONS = {
     'docker': '🐳',
@@ -47,6 +65,51 @@ CONTAINER_ICONS = {
     'kubernetes': '☸️',
 }
 
+# Prebuilt cells, so table rows don't rebuild (or re-parse markup) for every container
+_STATUS_TEXT = {k: Text(k, style=v) for k, v in STATUS_COLORS.items()}
+_TYPE_LABELS = {k: f"{v} {k}" for k, v in CONTAINER_ICONS.items()}
+
+# Docker Engine API, queried over its Unix socket instead of forking the CLI
+DOCKER_SOCKET = '/var/run/docker.sock'
+DOCKER_API_VERSION = 'v1.41'
+DOCKER_STATS_WORKERS = 8
+
+
+@functools.lru_cache(maxsize=None)
+def _has_binary(cmd: str) -> bool:
+    """
+    Check if a command is available on PATH (cached, never forks)
+    
+    Args:
+        cmd: Command to check
+        
+    Returns:
+        True if available, False otherwise
+    """
+    return shutil.which(cmd) is not None
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket"""
+    
+    def __init__(self, socket_path: str, timeout: float = 5.0):
+        """
+        Initialize the connection
+        
+        Args:
+            socket_path: Path of the Unix socket to connect to
+            timeout: Socket timeout in seconds
+        """
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = socket_path
+    
+    def connect(self) -> None:
+        """Connect to the Unix socket instead of a TCP host"""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
 
 class ContainerMonitor:
     """Monitor and display container resource usage and status"""
@@ -59,101 +122,299 @@ class ContainerMonitor:
             refresh_interval: How often to refresh the data (in seconds)
         """
         self.refresh_interval = refresh_interval
-        self.console = Console()
         self._last_update = 0
-        self._containers = []
-        self._has_docker = self._check_command('docker')
-        self._has_lxc = self._check_command('lxc')
+        self._reset_containers()
+        
+        # Container runtimes are probed on the first refresh, so monitors
+        # that are constructed but never displayed cost nothing
+        self._probed = False
+        self._docker_api = False
+        self._has_docker = False
+        self._has_lxc = False
         self._container_stats = {}
         
-    def _check_command(self, cmd: str) -> bool:
+        # Last rendered panel and the data fingerprint it was built from
+        self._cached_panel = None
+        self._cached_fingerprint = None
+        
+        # One persistent API connection per thread, reused across refreshes.
+        # Every connection is also listed, so stop() can close them all.
+        self._docker_local = threading.local()
+        self._docker_conns = []
+        self._stats_executor = None
+        
+    def update(self) -> None:
+        """Update container information"""
+        self._ensure_fresh()
+    
+    def _ensure_fresh(self) -> bool:
         """
-        Check if a command is available
+        Refresh container information if the refresh interval has passed
+        
+        Returns:
+            True if the data was refreshed, False otherwise
+        """
+        current_time = time.time()
+        if current_time - self._last_update < self.refresh_interval:
+            return False
+        self._last_update = current_time
+        
+        if not self._probed:
+            self._probe_runtimes()
+        
+        # Reset container columns
+        self._reset_containers()
+        
+        # Check Docker containers, falling back to the CLI if the API fails
+        if self._has_docker:
+            if not (self._docker_api and self._update_docker_containers_api()):
+                self._update_docker_containers()
+            
+        # Check LXD containers
+        if self._has_lxc:
+            self._update_lxc_containers()
+        
+        return True
+    
+    def _probe_runtimes(self) -> None:
+        """Detect the available container runtimes"""
+        # Prefer the Docker API socket; only look for the CLI when it is missing
+        self._docker_api = os.path.exists(DOCKER_SOCKET)
+        self._has_docker = self._docker_api or _has_binary('docker')
+        self._has_lxc = _has_binary('lxc')
+        self._probed = True
+    
+    def _reset_containers(self) -> None:
+        """Clear the container columns"""
+        # Container data is kept as parallel lists (one per field) rather than
+        # a list of dicts, so sorting and counting only touch the fields they need
+        self._ids = []
+        self._names = []
+        self._types = []
+        self._images = []
+        self._statuses = []
+        self._running_for = []
+        self._ports = []
+        self._stats_cpu = []
+        self._stats_mem = []
+        self._stats_net = []
+    
+    def _add_container(self, container: Dict[str, Any]) -> None:
+        """
+        Append a container to the container columns
+        
+        Args:
+            container: Container information dictionary
+        """
+        stats = container['stats'] or {}
+        self._ids.append(container['id'])
+        self._names.append(container['name'])
+        self._types.append(container['type'])
+        self._images.append(container['image'])
+        self._statuses.append(container['status'])
+        self._running_for.append(container['running_for'])
+        self._ports.append(container['ports'])
+        self._stats_cpu.append(stats.get('cpu', 'N/A'))
+        self._stats_mem.append(stats.get('memory', 'N/A'))
+        self._stats_net.append(stats.get('network', 'N/A'))
+    
+    def stop(self) -> None:
+        """Release the Docker stats workers and every Docker API connection"""
+        executor, self._stats_executor = self._stats_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        
+        conns, self._docker_conns = self._docker_conns, []
+        for conn in conns:
+            conn.close()
+        
+        # Connections are reopened if the monitor is used again
+        self._docker_local = threading.local()
+    
+    def _docker_api_get(self, path: str) -> Any:
+        """
+        Issue a GET request against the Docker Engine API
         
         Args:
-            cmd: Command to check
+            path: API path (without the version prefix)
             
         Returns:
-            True if available, False otherwise
+            Decoded JSON response
+        """
+        conn = getattr(self._docker_local, 'conn', None)
+        if conn is None:
+            conn = _UnixHTTPConnection(DOCKER_SOCKET)
+            self._docker_local.conn = conn
+            self._docker_conns.append(conn)
+        
+        try:
+            conn.request('GET', f'/{DOCKER_API_VERSION}{path}')
+            response = conn.getresponse()
+            body = response.read()
+        except (OSError, http.client.HTTPException):
+            # Drop the connection, it is reopened on the next request
+            conn.close()
+            raise
+        
+        if response.status != 200:
+            raise http.client.HTTPException(f"Docker API returned {response.status}")
+            
+        return json.loads(body)
+    
+    def _update_docker_containers_api(self) -> bool:
+        """
+        Update Docker container information via the Docker Engine API
+        
+        Returns:
+            True if the API could be queried, False otherwise
         """
         try:
-            subprocess.run([cmd, '--version'], 
-                          stdout=subprocess.PIPE, 
-                          stderr=subprocess.PIPE)
-            return True
-        except (subprocess.SubprocessError, FileNotFoundError):
+            entries = self._docker_api_get('/containers/json?all=1')
+        except PermissionError:
+            # Socket isn't accessible to this user, stick to the CLI from now on
+            self._docker_api = False
             return False
+        except (OSError, http.client.HTTPException, ValueError):
+            return False
+        
+        running_ids = [d['Id'] for d in entries if d.get('State') == 'running']
+        
+        # Stats requests block while Docker samples CPU usage, so run them in parallel
+        stats_by_id = {}
+        if running_ids:
+            if self._stats_executor is None:
+                self._stats_executor = ThreadPoolExecutor(
+                    max_workers=DOCKER_STATS_WORKERS,
+                    thread_name_prefix='netdash-docker'
+                )
+            stats_by_id = dict(zip(
+                running_ids,
+                self._stats_executor.map(self._get_docker_stats_api, running_ids)
+            ))
+        
+        now = time.time()
+        for d in entries:
+            names = d.get('Names') or ['']
+            ports = ", ".join(
+                f"{p['IP']}:{p['PublicPort']}->{p['PrivatePort']}/{p['Type']}"
+                if p.get('PublicPort') else f"{p['PrivatePort']}/{p['Type']}"
+                for p in d.get('Ports') or []
+            )
+            
+            container = {
+                'id': d['Id'][:12],
+                'name': names[0].lstrip('/'),
+                'type': 'docker',
+                'image': d.get('Image', 'N/A'),
+                'status': d.get('State', 'unknown'),
+                'running_for': self._format_age(now - d.get('Created', now)),
+                'ports': ports,
+                'stats': stats_by_id.get(d['Id'])
+            }
+            
+            self._add_container(container)
+        
+        return True
     
-    def update(self) -> None:
-        """Update container information"""
-        # Only update if the refresh interval has passed
-        current_time = time.time()
-        if current_time - self._last_update >= self.refresh_interval:
-            self._last_update = current_time
+    def _get_docker_stats_api(self, container_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get stats for a Docker container via the Docker Engine API
+        
+        Args:
+            container_id: Docker container ID
             
-            # Reset containers list
-            self._containers = []
+        Returns:
+            Dictionary with container stats or None
+        """
+        try:
+            stats = self._docker_api_get(f'/containers/{container_id}/stats?stream=false')
+        except (OSError, http.client.HTTPException, ValueError):
+            return None
+        
+        # CPU percentage, computed the same way as `docker stats`
+        cpu_stats = stats.get('cpu_stats', {})
+        precpu_stats = stats.get('precpu_stats', {})
+        cpu_delta = (cpu_stats.get('cpu_usage', {}).get('total_usage', 0)
+                     - precpu_stats.get('cpu_usage', {}).get('total_usage', 0))
+        system_delta = cpu_stats.get('system_cpu_usage', 0) - precpu_stats.get('system_cpu_usage', 0)
+        online_cpus = cpu_stats.get('online_cpus') or len(cpu_stats.get('cpu_usage', {}).get('percpu_usage') or []) or 1
+        cpu_percent = cpu_delta / system_delta * online_cpus * 100 if system_delta > 0 and cpu_delta > 0 else 0.0
+        
+        # Memory usage excluding page cache
+        memory = stats.get('memory_stats', {})
+        memory_details = memory.get('stats', {})
+        memory_used = memory.get('usage', 0) - memory_details.get('inactive_file', memory_details.get('cache', 0))
+        memory_limit = memory.get('limit', 0)
+        
+        # Network and block I/O totals
+        total_rx = sum(n.get('rx_bytes', 0) for n in (stats.get('networks') or {}).values())
+        total_tx = sum(n.get('tx_bytes', 0) for n in (stats.get('networks') or {}).values())
+        io_entries = stats.get('blkio_stats', {}).get('io_service_bytes_recursive') or []
+        total_read = sum(e.get('value', 0) for e in io_entries if e.get('op', '').lower() == 'read')
+        total_write = sum(e.get('value', 0) for e in io_entries if e.get('op', '').lower() == 'write')
+        
+        return {
+            'cpu': f"{cpu_percent:.2f}%",
+            'memory': f"{memory_used / (1024 * 1024):.1f}MB",
+            'memory_perc': f"{memory_used / max(1, memory_limit) * 100:.1f}%",
+            'network': f"{total_rx / (1024 * 1024):.1f}MB / {total_tx / (1024 * 1024):.1f}MB",
+            'block_io': f"{total_read / (1024 * 1024):.1f}MB / {total_write / (1024 * 1024):.1f}MB"
+        }
+    
+    def _format_age(self, seconds: float) -> str:
+        """
+        Format a container age in seconds to a human-readable string
+        
+        Args:
+            seconds: Age in seconds
             
-            # Check Docker containers
-            if self._has_docker:
-                self._update_docker_containers()
-                
-            # Check LXD containers
-            if self._has_lxc:
-                self._update_lxc_containers()
+        Returns:
+            Formatted age string (e.g., "3 hours ago")
+        """
+        seconds = max(0, int(seconds))
+        for unit, size in (('day', 86400), ('hour', 3600), ('minute', 60)):
+            if seconds >= size:
+                count = seconds // size
+                return f"{count} {unit}{'s' if count != 1 else ''} ago"
+        return f"{seconds} seconds ago"
     
     def _update_docker_containers(self) -> None:
         """Update Docker container information"""
         try:
-            # Get container list
-            cmd = ['docker', 'ps', '--all', '--format', '{{.ID}}|{{.Names}}|{{.Image}}|{{.Status}}|{{.RunningFor}}|{{.Ports}}']
+            # Get container list, one JSON object per line
+            cmd = ['docker', 'ps', '--all', '--format', '{{json .}}']
             output = subprocess.check_output(cmd, text=True)
             
-            for line in output.strip().split('\n'):
+            for line in output.splitlines():
                 if not line:
                     continue
                     
-                parts = line.split('|')
-                if len(parts) >= 4:
-                    container_id = parts[0]
-                    name = parts[1]
-                    image = parts[2]
-                    status_str = parts[3]
-                    running_for = parts[4] if len(parts) > 4 else ""
-                    ports = parts[5] if len(parts) > 5 else ""
-                    
-                    # Parse status
-                    status = "unknown"
-                    if "Up" in status_str:
-                        status = "running"
-                    elif "Exited" in status_str:
-                        status = "exited"
-                    elif "Created" in status_str:
-                        status = "created"
-                    elif "Restarting" in status_str:
-                        status = "restarting"
-                    elif "Paused" in status_str:
-                        status = "paused"
-                    
-                    # Get container stats if running
-                    stats = None
-                    if status == "running":
-                        stats = self._get_docker_stats(container_id)
-                    
-                    container = {
-                        'id': container_id,
-                        'name': name,
-                        'type': 'docker',
-                        'image': image,
-                        'status': status,
-                        'running_for': running_for,
-                        'ports': ports,
-                        'stats': stats
-                    }
-                    
-                    self._containers.append(container)
+                d = json.loads(line)
+                container_id = d['ID']
+                status_str = d.get('Status', '')
+                
+                # Parse status from the leading word of the status string
+                status = _STATUS_MAP.get(status_str.partition(' ')[0], 'unknown')
+                
+                # Get container stats if running
+                stats = None
+                if status == "running":
+                    stats = self._get_docker_stats(container_id)
+                
+                container = {
+                    'id': container_id,
+                    'name': d.get('Names', ''),
+                    'type': 'docker',
+                    'image': d.get('Image', ''),
+                    'status': status,
+                    'running_for': d.get('RunningFor', ''),
+                    'ports': d.get('Ports', ''),
+                    'stats': stats
+                }
+                
+                self._add_container(container)
                     
-        except (subprocess.SubprocessError, FileNotFoundError):
+        except (subprocess.SubprocessError, FileNotFoundError, json.JSONDecodeError, KeyError):
             pass
     
     def _get_docker_stats(self, container_id: str) -> Optional[Dict[str, Any]]:
@@ -189,7 +450,8 @@ class ContainerMonitor:
     def _update_lxc_containers(self) -> None:
         """Update LXC container information"""
         try:
-            # Get container list with basic info
+            # The list output already carries config and state for every
+            # container, so no per-container `lxc info` call is needed
             cmd = ['lxc', 'list', '--format=json']
             output = subprocess.check_output(cmd, text=True)
             
@@ -201,71 +463,66 @@ class ContainerMonitor:
                 container_name = container.get('name', 'unknown')
                 status = container.get('status', 'unknown').lower()
                 
-                # Get container info
-                try:
-                    info_cmd = ['lxc', 'info', container_name, '--format=json']
-                    info_output = subprocess.check_output(info_cmd, text=True)
-                    info = json.loads(info_output)
-                    
-                    # Extract image info
-                    config = info.get('config', {})
-                    image = config.get('image.description', 'N/A')
-                    
-                    # Extract resource usage if running
-                    stats = None
-                    if status == "running":
-                        state = info.get('state', {})
-                        memory = state.get('memory', {})
-                        network = state.get('network', {})
-                        
-                        # Create stats object
-                        stats = {
-                            'cpu': f"{state.get('cpu', {}).get('usage', 0)}%",
-                            'memory': f"{memory.get('usage', 0) / (1024 * 1024):.1f}MB",
-                            'memory_perc': f"{memory.get('usage', 0) / max(1, memory.get('total', 1)) * 100:.1f}%",
-                            'network': "N/A",
-                            'block_io': "N/A"
-                        }
-                        
-                        # Try to get network stats
-                        if network:
-                            total_rx = 0
-                            total_tx = 0
-                            for iface, iface_stats in network.items():
-                                if iface != 'lo':
-                                    counters = iface_stats.get('counters', {})
-                                    total_rx += counters.get('bytes_received', 0)
-                                    total_tx += counters.get('bytes_sent', 0)
-                            
-                            stats['network'] = f"{total_rx / (1024 * 1024):.1f}MB / {total_tx / (1024 * 1024):.1f}MB"
+                # Extract image info
+                config = container.get('config') or {}
+                image = config.get('image.description', 'N/A')
+                
+                # Extract resource usage if running
+                stats = None
+                if status == "running":
+                    state = container.get('state') or {}
+                    memory = state.get('memory') or {}
+                    network = state.get('network') or {}
                     
-                    container = {
-                        'id': container_name,
-                        'name': container_name,
-                        'type': 'lxd',
-                        'image': image,
-                        'status': status,
-                        'running_for': 'N/A',
-                        'ports': 'N/A',
-                        'stats': stats
+                    # Create stats object
+                    stats = {
+                        'cpu': f"{state.get('cpu', {}).get('usage', 0)}%",
+                        'memory': f"{memory.get('usage', 0) / (1024 * 1024):.1f}MB",
+                        'memory_perc': f"{memory.get('usage', 0) / max(1, memory.get('total', 1)) * 100:.1f}%",
+                        'network': "N/A",
+                        'block_io': "N/A"
                     }
                     
-                    self._containers.append(container)
-                    
-                except (subprocess.SubprocessError, json.JSONDecodeError):
-                    pass
+                    # Try to get network stats
+                    if network:
+                        total_rx = 0
+                        total_tx = 0
+                        for iface, iface_stats in network.items():
+                            if iface != 'lo':
+                                counters = iface_stats.get('counters', {})
+                                total_rx += counters.get('bytes_received', 0)
+                                total_tx += counters.get('bytes_sent', 0)
+                        
+                        stats['network'] = f"{total_rx / (1024 * 1024):.1f}MB / {total_tx / (1024 * 1024):.1f}MB"
+                
+                container = {
+                    'id': container_name,
+                    'name': container_name,
+                    'type': 'lxd',
+                    'image': image,
+                    'status': status,
+                    'running_for': 'N/A',
+                    'ports': 'N/A',
+                    'stats': stats
+                }
+                
+                self._add_container(container)
                 
         except (subprocess.SubprocessError, FileNotFoundError, json.JSONDecodeError):
             pass
     
-    def get_table(self) -> Table:
+    def get_table(self, refresh: bool = True) -> Table:
         """
         Generate a rich table with container information
         
+        Args:
+            refresh: Whether to refresh the container data first
+            
         Returns:
             Rich Table object with container data
         """
-        self.update()
+        if refresh:
+            self._ensure_fresh()
         
         # Create container table
         table = Table(
@@ -287,7 +544,7 @@ class ContainerMonitor:
         table.add_column("Network I/O", width=14)
         
         # Check if we have data to display
-        if not self._containers:
+        if not self._ids:
             if not self._has_docker and not self._has_lxc:
                 table.add_row(
                     "N/A", 
@@ -310,59 +567,56 @@ class ContainerMonitor:
                 )
             return table
             
-        # Sort containers by status (running first)
-        sorted_containers = sorted(
-            self._containers, 
-            key=lambda c: (0 if c['status'] == 'running' else 1, c['name'])
-        )
+        # Sort containers by status (running first), then by name
+        names = self._names
+        statuses = self._statuses
+        order = sorted(range(len(names)), key=lambda i: (statuses[i] != 'running', names[i]))
         
         # Add rows for each container
-        for container in sorted_containers:
-            # Get container icon
-            icon = CONTAINER_ICONS.get(container['type'], '?')
+        for i in order:
+            # Get container type label with icon
+            container_type = self._types[i]
+            type_display = _TYPE_LABELS.get(container_type) or f"? {container_type}"
             
             # Get status with color
-            status = container['status']
-            status_color = STATUS_COLORS.get(status, 'white')
-            status_display = f"[{status_color}]{status}[/{status_color}]"
-            
-            # Get stats if available
-            cpu = "N/A"
-            memory = "N/A"
-            network = "N/A"
-            
-            if container['stats']:
-                cpu = container['stats'].get('cpu', 'N/A')
-                memory = container['stats'].get('memory', 'N/A')
-                network = container['stats'].get('network', 'N/A')
+            status = statuses[i]
+            status_text = _STATUS_TEXT.get(status)
+            # Copy so per-row changes can't leak into the shared cell
+            status_display = status_text.copy() if status_text else Text(status, style='white')
                 
             # Add row
             table.add_row(
-                f"{icon} {container['type']}",
-                container['name'],
+                type_display,
+                names[i],
                 status_display,
-                container['image'],
-                cpu,
-                memory,
-                network
+                self._images[i],
+                self._stats_cpu[i],
+                self._stats_mem[i],
+                self._stats_net[i]
             )
             
         return table
     
-    def get_summary(self) -> Text:
+    def get_summary(self, refresh: bool = True) -> Text:
         """
         Generate a summary of container status
         
+        Args:
+            refresh: Whether to refresh the container data first
+            
         Returns:
             Rich Text object with container summary
         """
-        self.update()
+        if refresh:
+            self._ensure_fresh()
         
         # Count containers by type and status
-        total = len(self._containers)
-        running = sum(1 for c in self._containers if c['status'] == 'running')
-        docker_count = sum(1 for c in self._containers if c['type'] == 'docker')
-        lxd_count = sum(1 for c in self._containers if c['type'] == 'lxd')
+        status_counts = Counter(self._statuses)
+        type_counts = Counter(self._types)
+        total = len(self._ids)
+        running = status_counts['running']
+        docker_count = type_counts['docker']
+        lxd_count = type_counts['lxd']
         
         summary = Text()
         summary.append("Containers: ")
@@ -384,25 +638,40 @@ class ContainerMonitor:
         Returns:
             Rich Panel with table of containers
         """
-        table = self.get_table()
-        summary = self.get_summary()
+        self._ensure_fresh()
         
-        panel_content = Text()
-        panel_content.append(summary)
-        panel_content.append("\n\n")
-        panel_content.append(str(table))
+        # Reuse the previous panel when no container data changed
+        fingerprint = hash((
+            tuple(self._ids), tuple(self._names), tuple(self._types),
+            tuple(self._images), tuple(self._statuses), tuple(self._stats_cpu),
+            tuple(self._stats_mem), tuple(self._stats_net)
+        ))
+        if fingerprint == self._cached_fingerprint:
+            return self._cached_panel
         
-        return Panel(
-            panel_content,
+        table = self.get_table(refresh=False)
+        summary = self.get_summary(refresh=False)
+        
+        # Let Rich compose summary and table in a single render pass
+        panel = Panel(
+            Group(summary, Text(""), table),
             title="[bold]Container Monitor[/bold]",
             border_style="green",
             box=box.ROUNDED
         )
+        
+        self._cached_fingerprint = fingerprint
+        self._cached_panel = panel
+        return panel
 
 
-async def _display_container_info() -> None:
-    """Display container information in a live view"""
-    console = Console()
+def _display_container_info(console: Console) -> None:
+    """
+    Display container information in a live view
+    
+    Args:
+        console: Console to render the live view on
+    """
     monitor = ContainerMonitor(refresh_interval=2.0)
     
     with Live(console=console, screen=True, refresh_per_second=0.5) as live:
@@ -410,20 +679,21 @@ async def _display_container_info() -> None:
             while True:
                 panel = monitor.get_panel()
                 live.update(panel)
-                await asyncio.sleep(2.0)
+                time.sleep(monitor.refresh_interval)
         except KeyboardInterrupt:
             pass
 
 
 def main() -> None:
     """Run the container monitor as a standalone component"""
+    console = Console()
     try:
         if os.geteuid() != 0:
-            print("[bold yellow]WARNING: Running without root privileges. Container information may be limited.[/bold yellow]")
+            console.print("[bold yellow]WARNING: Running without root privileges. Container information may be limited.[/bold yellow]")
         
-        asyncio.run(_display_container_info())
+        _display_container_info(console)
     except KeyboardInterrupt:
-        print("\nExiting Container Monitor...")
+        console.print("\nExiting Container Monitor...")
 
 
 if __name__ == "__main__":
@@ -11,9 +11,11 @@ Monitors CPU usage and load averages:
 import os
 import sys
 import time
-import asyncio
+import bisect
+import threading
+from functools import cached_property
 import psutil
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 from datetime import datetime
 import platform
 from rich.console import Console
@@ -24,11 +26,31 @@ from rich.text import Text
 from rich.progress import BarColumn, Progress, TextColumn
 from rich import box
 
+from netdash._fastmath import load_numpy
+
 # Color thresholds for CPU utilization and load
 LOW_THRESHOLD = 30
 MEDIUM_THRESHOLD = 70
 HIGH_THRESHOLD = 90
 
+# Color for each threshold bucket, indexed by bisecting the thresholds
+_THRESHOLDS = (LOW_THRESHOLD, MEDIUM_THRESHOLD, HIGH_THRESHOLD)
+_COLOR_BUCKETS = ("green", "yellow", "dark_orange", "red")
+
+# Every possible usage bar, precomputed so rendering doesn't rebuild them
+_BAR_WIDTH = 50
+_BARS = tuple("█" * i + "░" * (_BAR_WIDTH - i) for i in range(_BAR_WIDTH + 1))
+
+# Header and options of each usage table column, applied to every new table
+_TABLE_COLUMNS = (
+    ("Core", {"justify": "right", "style": "cyan", "width": 6}),
+    ("Usage %", {"justify": "right", "width": 8}),
+    ("Usage", {"ratio": 1}),
+)
+
+# Core count from which per-core bars and colors are computed with numpy
+NUMPY_MIN_CORES = 16
+
 
 class CPUMonitor:
     """Monitor and display CPU usage and load information"""
@@ -41,38 +63,236 @@ class CPUMonitor:
             refresh_interval: How often to refresh the data (in seconds)
         """
         self.refresh_interval = refresh_interval
-        self.console = Console()
-        self._cpu_count = psutil.cpu_count(logical=True)
-        self._cpu_count_physical = psutil.cpu_count(logical=False)
-        self._last_update = 0
-        self._last_cpu_percent = [0.0] * self._cpu_count if self._cpu_count else []
+        self._last_cpu_percent = []
         self._last_load_avg = (0.0, 0.0, 0.0)
-        self._cpu_freq = {'current': 0, 'min': 0, 'max': 0}
-        self.update()
+        self._freq_line = None
+        
+        # On Linux, /proc/stat and /proc/loadavg are read directly through
+        # persistent descriptors instead of going through psutil per sample
+        self._stat_fd = self._open_proc_file('/proc/stat')
+        self._load_fd = self._open_proc_file('/proc/loadavg')
+        self._prev_ticks = None
+        
+        # Cadence (seconds) for load average and frequency sampling
+        self._slow_interval = 5.0
+        self._last_slow_update = float('-inf')
+        
+        # Last rendered panel and the snapshot it was built from
+        self._cached_panel = None
+        self._cached_fingerprint = None
+        
+        # Sampling runs on a background thread that publishes a snapshot dict;
+        # update() only reads the latest snapshot, so rendering never blocks on /proc.
+        # The first sample is taken by the thread, not the constructor.
+        self._snapshot = {
+            'cpu': self._last_cpu_percent,
+            'load': self._last_load_avg,
+            'freq_line': self._freq_line
+        }
+        self._applied_snapshot = None
+        self._stop_event = threading.Event()
+        self._sampler_thread = threading.Thread(
+            target=self._sample_loop,
+            name="netdash-cpu-sampler",
+            daemon=True
+        )
+        self._sampler_thread.start()
     
-    def update(self) -> None:
-        """Update CPU statistics"""
-        current_time = time.time()
+    @cached_property
+    def cpu_count(self) -> int:
+        """Number of logical CPUs (probed on first access)"""
+        return psutil.cpu_count(logical=True) or 1
+    
+    @cached_property
+    def cpu_count_physical(self) -> int:
+        """Number of physical CPU cores (probed on first access)"""
+        return psutil.cpu_count(logical=False) or self.cpu_count
+    
+    @cached_property
+    def _stat_read_size(self) -> int:
+        """Buffer size large enough for every per-CPU line of /proc/stat"""
+        return max(4096, 256 * (self.cpu_count + 2))
+    
+    def _sample(self) -> Dict[str, Any]:
+        """
+        Collect a fresh set of CPU statistics
         
-        # Only update if refresh interval has elapsed
-        if current_time - self._last_update >= self.refresh_interval:
-            # Get per-CPU usage percentages
-            self._last_cpu_percent = psutil.cpu_percent(percpu=True)
+        Returns:
+            Dictionary with per-CPU usage, load averages and the formatted
+            frequency line (None when frequency data is unavailable)
+        """
+        # Get per-CPU usage percentages
+        cpu_percent = self._read_cpu_percent()
+        
+        # Load averages and frequency change slowly (the kernel only recomputes
+        # /proc/loadavg every 5s), so they are re-read at a reduced cadence
+        current_time = time.monotonic()
+        if current_time - self._last_slow_update >= self._slow_interval:
+            load_avg = self._read_load_avg()
             
-            # Get load averages (Linux/macOS only)
-            try:
-                self._last_load_avg = os.getloadavg()
-            except (AttributeError, OSError):
-                # Windows or other OS without getloadavg
-                self._last_load_avg = (0.0, 0.0, 0.0)
+            freq_line = self._format_freq_line()
+            
+            self._last_slow_update = current_time
+        else:
+            load_avg = self._snapshot['load']
+            freq_line = self._snapshot['freq_line']
+        
+        return {'cpu': cpu_percent, 'load': load_avg, 'freq_line': freq_line}
+    
+    def _format_freq_line(self) -> Optional[str]:
+        """
+        Read the CPU frequency and format it for the summary
+        
+        Returns:
+            Formatted frequency line, or None if frequency data is unavailable
+        """
+        try:
+            freq = psutil.cpu_freq()
+        except Exception:
+            freq = None
+        
+        # Containers and VMs commonly expose no frequency data at all
+        if not freq or freq.current <= 0:
+            return None
+        
+        current_ghz = freq.current / 1000 if freq.current > 1000 else freq.current
+        line = f"Frequency: {current_ghz:.2f} GHz"
+        
+        if freq.max > 0:
+            max_ghz = freq.max / 1000 if freq.max > 1000 else freq.max
+            line += f" (Max: {max_ghz:.2f} GHz)"
+        
+        return line + "\n"
+    
+    def _open_proc_file(self, path: str) -> Optional[int]:
+        """
+        Open a /proc file for repeated reads
+        
+        Args:
+            path: Path of the file to open
             
-            # Get CPU frequency if available
+        Returns:
+            File descriptor, or None if the file isn't available
+        """
+        try:
+            return os.open(path, os.O_RDONLY)
+        except (AttributeError, OSError):
+            return None
+    
+    def _read_cpu_percent(self) -> List[float]:
+        """
+        Read per-CPU utilization since the previous read
+        
+        Returns:
+            List of CPU usage percentages, one per logical CPU
+        """
+        if self._stat_fd is None:
+            return psutil.cpu_percent(percpu=True)
+        
+        try:
+            data = os.pread(self._stat_fd, self._stat_read_size, 0)
+        except OSError:
+            self._stat_fd = None
+            return psutil.cpu_percent(percpu=True)
+        
+        # Per-CPU lines ("cpuN user nice system idle iowait irq softirq steal
+        # guest guest_nice") follow the aggregate "cpu" line
+        ticks = []
+        for line in data.split(b'\n')[1:]:
+            if not line.startswith(b'cpu'):
+                break
+            fields = [int(x) for x in line.split()[1:9]]
+            # guest time is already counted in user time, so it's left out
+            ticks.append((sum(fields), fields[3] + fields[4]))
+        
+        prev_ticks = self._prev_ticks
+        self._prev_ticks = ticks
+        if prev_ticks is None or len(prev_ticks) != len(ticks):
+            return [0.0] * len(ticks)
+        
+        cpu_percent = []
+        for (total, idle), (prev_total, prev_idle) in zip(ticks, prev_ticks):
+            total_delta = total - prev_total
+            if total_delta <= 0:
+                cpu_percent.append(0.0)
+                continue
+            busy_delta = total_delta - (idle - prev_idle)
+            cpu_percent.append(round(min(100.0, max(0.0, 100.0 * busy_delta / total_delta)), 1))
+        
+        return cpu_percent
+    
+    def _read_load_avg(self) -> Tuple[float, float, float]:
+        """
+        Read the system load averages
+        
+        Returns:
+            Tuple of 1, 5 and 15 minute load averages
+        """
+        if self._load_fd is not None:
             try:
-                self._cpu_freq = psutil.cpu_freq()._asdict()
-            except Exception:
-                self._cpu_freq = {'current': 0, 'min': 0, 'max': 0}
-                
-            self._last_update = current_time
+                fields = os.pread(self._load_fd, 128, 0).split()
+                return (float(fields[0]), float(fields[1]), float(fields[2]))
+            except (OSError, ValueError, IndexError):
+                self._load_fd = None
+        
+        # Get load averages (Linux/macOS only)
+        try:
+            return os.getloadavg()
+        except (AttributeError, OSError):
+            # Windows or other OS without getloadavg
+            return (0.0, 0.0, 0.0)
+    
+    def _close_proc_files(self) -> None:
+        """Close the persistent /proc file descriptors"""
+        for fd in (self._stat_fd, self._load_fd):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._stat_fd = None
+        self._load_fd = None
+    
+    def _sample_loop(self) -> None:
+        """Sample CPU statistics every refresh interval until stopped"""
+        try:
+            while True:
+                # Replacing the dict reference is atomic, readers never see a partial snapshot
+                self._snapshot = self._sample()
+                if self._stop_event.wait(self.refresh_interval):
+                    break
+        finally:
+            # Closed from the sampler thread itself, so a read can never race the close
+            self._close_proc_files()
+    
+    def stop(self) -> None:
+        """Stop the background sampler thread, waiting for an in-flight sample"""
+        self._stop_event.set()
+        
+        # No snapshot is published once stop() returns
+        if threading.current_thread() is not self._sampler_thread:
+            self._sampler_thread.join()
+    
+    def update(self) -> None:
+        """Update CPU statistics from the latest sampler snapshot"""
+        self._ensure_fresh()
+    
+    def _ensure_fresh(self) -> bool:
+        """
+        Apply the latest sampler snapshot if it hasn't been applied yet
+        
+        Returns:
+            True if a new snapshot was applied, False otherwise
+        """
+        snapshot = self._snapshot
+        if snapshot is self._applied_snapshot:
+            return False
+        
+        self._last_cpu_percent = snapshot['cpu']
+        self._last_load_avg = snapshot['load']
+        self._freq_line = snapshot['freq_line']
+        self._applied_snapshot = snapshot
+        return True
     
     def _get_color_for_percentage(self, percent: float) -> str:
         """
@@ -84,14 +304,7 @@ class CPUMonitor:
         Returns:
             Color string for rich
         """
-        if percent < LOW_THRESHOLD:
-            return "green"
-        elif percent < MEDIUM_THRESHOLD:
-            return "yellow"
-        elif percent < HIGH_THRESHOLD:
-            return "dark_orange"
-        else:
-            return "red"
+        return _COLOR_BUCKETS[bisect.bisect_right(_THRESHOLDS, percent)]
     
     def _get_color_for_load(self, load: float, core_count: int) -> str:
         """
@@ -116,59 +329,60 @@ class CPUMonitor:
         else:  # More than 150% load per core
             return "red"
     
-    def get_summary(self) -> Text:
+    def get_summary(self, refresh: bool = True) -> Text:
         """
         Get a summary of CPU information
         
+        Args:
+            refresh: Whether to apply the latest sample first
+            
         Returns:
             Rich Text object with CPU summary
         """
-        self.update()
+        if refresh:
+            self._ensure_fresh()
         
         text = Text()
         text.append(f"CPU: {platform.processor()}\n")
-        text.append(f"Cores: {self._cpu_count_physical} Physical, {self._cpu_count} Logical\n")
+        text.append(f"Cores: {self.cpu_count_physical} Physical, {self.cpu_count} Logical\n")
         
-        if self._cpu_freq['current'] > 0:
-            current_ghz = self._cpu_freq['current'] / 1000 if self._cpu_freq['current'] > 1000 else self._cpu_freq['current']
-            text.append(f"Frequency: {current_ghz:.2f} GHz")
-            
-            if self._cpu_freq['max'] > 0:
-                max_ghz = self._cpu_freq['max'] / 1000 if self._cpu_freq['max'] > 1000 else self._cpu_freq['max']
-                text.append(f" (Max: {max_ghz:.2f} GHz)")
-            
-            text.append("\n")
+        if self._freq_line:
+            text.append(self._freq_line)
         
         # System load averages
         if any(x > 0 for x in self._last_load_avg):
             text.append("Load Average: ")
             
             # 1 minute load
-            color = self._get_color_for_load(self._last_load_avg[0], self._cpu_count_physical)
+            color = self._get_color_for_load(self._last_load_avg[0], self.cpu_count_physical)
             text.append(f"{self._last_load_avg[0]:.2f}", style=f"bold {color}")
             
             # 5 minute load
             text.append(", ")
-            color = self._get_color_for_load(self._last_load_avg[1], self._cpu_count_physical)
+            color = self._get_color_for_load(self._last_load_avg[1], self.cpu_count_physical)
             text.append(f"{self._last_load_avg[1]:.2f}", style=f"bold {color}")
             
             # 15 minute load
             text.append(", ")
-            color = self._get_color_for_load(self._last_load_avg[2], self._cpu_count_physical)
+            color = self._get_color_for_load(self._last_load_avg[2], self.cpu_count_physical)
             text.append(f"{self._last_load_avg[2]:.2f}", style=f"bold {color}")
             
             text.append(" (1, 5, 15 min)")
         
         return text
     
-    def get_table(self) -> Table:
+    def get_table(self, refresh: bool = True) -> Table:
         """
         Get a table of CPU usage with bars
         
+        Args:
+            refresh: Whether to apply the latest sample first
+            
         Returns:
             Rich Table object with CPU usage
         """
-        self.update()
+        if refresh:
+            self._ensure_fresh()
         
         # Create table
         table = Table(
@@ -179,34 +393,35 @@ class CPUMonitor:
         )
         
         # Add columns
-        table.add_column("Core", justify="right", style="cyan", width=6)
-        table.add_column("Usage %", justify="right", width=8)
-        table.add_column("Usage", ratio=1)
+        for header, options in _TABLE_COLUMNS:
+            table.add_column(header, **options)
+        
+        percents = self._last_cpu_percent
+        np = load_numpy() if len(percents) >= NUMPY_MIN_CORES else None
+        
+        if np is not None:
+            # Many-core hosts: bucket colors and bar lengths in one vectorized pass
+            arr = np.asarray(percents, dtype=np.float64)
+            colors = [_COLOR_BUCKETS[i] for i in np.digitize(arr, _THRESHOLDS).tolist()]
+            filled = np.minimum((arr * (_BAR_WIDTH / 100)).astype(np.int32), _BAR_WIDTH).tolist()
+            avg = float(arr.mean())
+        else:
+            colors = [self._get_color_for_percentage(p) for p in percents]
+            filled = [min(_BAR_WIDTH, int(p * _BAR_WIDTH / 100)) for p in percents]
+            avg = sum(percents) / len(percents) if percents else 0.0
         
         # Add rows for each CPU core
-        for i, percent in enumerate(self._last_cpu_percent):
-            color = self._get_color_for_percentage(percent)
-            
-            # Create bar for CPU usage
-            bar_width = 50  # Fixed width for the bar
-            filled = int(percent / 100 * bar_width)
-            bar = "█" * filled + "░" * (bar_width - filled)
-            
+        for i, percent in enumerate(percents):
             table.add_row(
                 f"CPU {i}",
                 f"{percent:.1f}%",
-                Text(bar, style=color)
+                Text(_BARS[filled[i]], style=colors[i])
             )
         
         # Add system-wide average if we have cores
-        if self._last_cpu_percent:
-            avg = sum(self._last_cpu_percent) / len(self._last_cpu_percent)
+        if percents:
             color = self._get_color_for_percentage(avg)
-            
-            # Create bar for average CPU usage
-            bar_width = 50  # Fixed width for the bar
-            filled = int(avg / 100 * bar_width)
-            bar = "█" * filled + "░" * (bar_width - filled)
+            bar = _BARS[min(_BAR_WIDTH, int(avg * _BAR_WIDTH / 100))]
             
             table.add_section()
             table.add_row(
@@ -217,13 +432,13 @@ class CPUMonitor:
         
         return table
     
-    async def display_live(self) -> None:
+    def display_live(self) -> None:
         """Display CPU usage with live updates"""
         with Live(self.get_table(), refresh_per_second=4, screen=True) as live:
             try:
                 while True:
                     live.update(self.get_table())
-                    await asyncio.sleep(self.refresh_interval)
+                    time.sleep(self.refresh_interval)
             except KeyboardInterrupt:
                 pass
     
@@ -234,11 +449,20 @@ class CPUMonitor:
         Returns:
             Rich Panel containing CPU information
         """
+        self._ensure_fresh()
+        
+        # Reuse the previous panel until a new sample has been applied. The
+        # sampler publishes a new snapshot dict per sample, so its identity
+        # covers every value shown, at any precision.
+        fingerprint = self._applied_snapshot
+        if fingerprint == self._cached_fingerprint:
+            return self._cached_panel
+        
         # Create layout with summary and table
-        summary = self.get_summary()
-        table = self.get_table()
+        summary = self.get_summary(refresh=False)
+        table = self.get_table(refresh=False)
         
-        return Panel(
+        panel = Panel(
             table,
             title=summary,
             title_align="left",
@@ -246,6 +470,10 @@ class CPUMonitor:
             box=box.HEAVY,
             padding=(0, 1)
         )
+        
+        self._cached_fingerprint = fingerprint
+        self._cached_panel = panel
+        return panel
 
 
 def main() -> None:
@@ -254,13 +482,10 @@ def main() -> None:
     console.print("[bold green]CPU Monitor[/bold green]")
     console.print("Press Ctrl+C to exit")
     
+    monitor = None
     try:
         monitor = CPUMonitor(refresh_interval=1.0)
-        
-        # Run the live display asynchronously
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(monitor.display_live())
+        monitor.display_live()
     except KeyboardInterrupt:
         console.print("\n[yellow]CPU Monitor terminated by user[/yellow]")
     except Exception as e:
@@ -268,6 +493,9 @@ def main() -> None:
         if os.environ.get("NETDASH_DEBUG"):
             import traceback
             console.print(traceback.format_exc())
+    finally:
+        if monitor is not None:
+            monitor.stop()
 
 
 if __name__ == "__main__":
@@ -8,38 +8,203 @@ A modular TUI dashboard for:
 - System log monitoring with alerts
 """
 
+import importlib
+import io
 import os
 import sys
 import time
 import asyncio
-from rich.console import Console
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
+from typing import Callable, List, Optional, Tuple
+from rich.console import Console, Group
 from rich.layout import Layout
 from rich.panel import Panel
 from rich.live import Live
+from rich.text import Text
 from rich import box
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Header, Footer, Static
 
-# Import the individual components
-from netdash.network_stats import NetworkStats
-from netdash.login_tracker import LoginTracker
-from netdash.log_monitor import LogMonitor, LogMonitorConfig
-from netdash.cpu_monitor import CPUMonitor
-from netdash.memory_monitor import MemoryMonitor
-from netdash.disk_usage import DiskUsage
-from netdash.socket_tracker import SocketTracker
-from netdash.ports_monitor import PortsMonitor
-from netdash.system_health import SystemHealth
-from netdash.service_manager import ServiceManager
-from netdash.container_monitor import ContainerMonitor
-from netdash.vm_monitor import VMMonitor
-from netdash.security_monitor import SecurityMonitor
-from netdash.disk_usage import DiskUsage
+from netdash.procsnapshot import ProcSnapshot
 
 # Get current folder for potential relative logging
 HOME_DIR = os.path.expanduser("~")
 
+# Monitor classes are imported on first use to keep startup fast, but stay
+# reachable as netdash.dashboard.<Name> through the module __getattr__
+_MONITOR_MODULES = {
+    "NetworkStats": "netdash.network_stats",
+    "LoginTracker": "netdash.login_tracker",
+    "LogMonitor": "netdash.log_monitor",
+    "LogMonitorConfig": "netdash.log_monitor",
+    "CPUMonitor": "netdash.cpu_monitor",
+    "MemoryMonitor": "netdash.memory_monitor",
+    "DiskUsage": "netdash.disk_usage",
+    "SocketTracker": "netdash.socket_tracker",
+    "PortsMonitor": "netdash.ports_monitor",
+    "SystemHealth": "netdash.system_health",
+    "ServiceManager": "netdash.service_manager",
+    "ContainerMonitor": "netdash.container_monitor",
+    "VMMonitor": "netdash.vm_monitor",
+    "SecurityMonitor": "netdash.security_monitor",
+}
+
+
+def __getattr__(name: str):
+    """
+    Resolve a monitor class from its module on first access (PEP 562)
+    
+    Args:
+        name: Attribute name
+        
+    Returns:
+        The monitor class
+    """
+    module_path = _MONITOR_MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_path), name)
+
+
+
+def _select_panels(slots: List[str], panels: Optional[List[str]]) -> List[str]:
+    """
+    Pick the panel slots to show, in layout order
+    
+    Args:
+        slots: Every panel slot of the dashboard, in layout order
+        panels: Requested panel slots, all panels if not given
+        
+    Returns:
+        List of the slots to show
+        
+    Raises:
+        ValueError: If a requested panel doesn't exist
+    """
+    unknown = sorted(set(panels or ()) - set(slots))
+    if unknown:
+        raise ValueError(
+            f"Unknown panels: {', '.join(unknown)} (choose from {', '.join(slots)})"
+        )
+    return [slot for slot in slots if not panels or slot in panels]
+
+
+class MonitorRegistry:
+    """Lazily created monitors shared by the dashboard frontends"""
+    
+    def __init__(self, refresh_interval: float = 1.0, slow_refresh_interval: float = 2.0,
+                 custom_log_file: str = None):
+        """
+        Initialize the registry
+        
+        Args:
+            refresh_interval: Refresh interval for the fast monitors (CPU,
+                memory, disk, network, security, logs) in seconds
+            slow_refresh_interval: Refresh interval for the monitors backed
+                by subprocesses or larger scans in seconds
+            custom_log_file: Optional path to a custom log file
+        """
+        self.refresh_interval = refresh_interval
+        self.slow_refresh_interval = slow_refresh_interval
+        self.custom_log_file = custom_log_file
+    
+    @cached_property
+    def cpu_monitor(self) -> "CPUMonitor":
+        """CPU usage monitor"""
+        from netdash.cpu_monitor import CPUMonitor
+        return CPUMonitor(refresh_interval=self.refresh_interval)
+    
+    @cached_property
+    def memory_monitor(self) -> "MemoryMonitor":
+        """Memory usage monitor"""
+        from netdash.memory_monitor import MemoryMonitor
+        return MemoryMonitor(refresh_interval=self.refresh_interval)
+    
+    @cached_property
+    def disk_usage(self) -> "DiskUsage":
+        """Disk usage and I/O monitor"""
+        from netdash.disk_usage import DiskUsage
+        return DiskUsage(refresh_interval=self.refresh_interval)
+    
+    @cached_property
+    def system_health(self) -> "SystemHealth":
+        """System health monitor"""
+        from netdash.system_health import SystemHealth
+        return SystemHealth(refresh_interval=self.slow_refresh_interval)
+    
+    @cached_property
+    def network_stats(self) -> "NetworkStats":
+        """Network interface statistics"""
+        from netdash.network_stats import NetworkStats
+        return NetworkStats(refresh_interval=self.refresh_interval)
+    
+    @cached_property
+    def socket_tracker(self) -> "SocketTracker":
+        """Network connection tracker"""
+        from netdash.socket_tracker import SocketTracker
+        return SocketTracker(refresh_interval=self.slow_refresh_interval)
+    
+    @cached_property
+    def ports_monitor(self) -> "PortsMonitor":
+        """Listening ports monitor"""
+        from netdash.ports_monitor import PortsMonitor
+        return PortsMonitor(refresh_interval=self.slow_refresh_interval)
+    
+    @cached_property
+    def login_tracker(self) -> "LoginTracker":
+        """User login tracker"""
+        from netdash.login_tracker import LoginTracker
+        return LoginTracker()
+    
+    @cached_property
+    def container_monitor(self) -> "ContainerMonitor":
+        """Container monitor"""
+        from netdash.container_monitor import ContainerMonitor
+        return ContainerMonitor(refresh_interval=self.slow_refresh_interval)
+    
+    @cached_property
+    def vm_monitor(self) -> "VMMonitor":
+        """Virtual machine monitor"""
+        from netdash.vm_monitor import VMMonitor
+        return VMMonitor(refresh_interval=self.slow_refresh_interval)
+    
+    @cached_property
+    def security_monitor(self) -> "SecurityMonitor":
+        """Security alerts monitor"""
+        from netdash.security_monitor import SecurityMonitor
+        return SecurityMonitor(refresh_interval=self.refresh_interval)
+    
+    @cached_property
+    def service_manager(self) -> "ServiceManager":
+        """System service manager"""
+        from netdash.service_manager import ServiceManager
+        return ServiceManager(refresh_interval=self.slow_refresh_interval)
+    
+    @cached_property
+    def log_monitor(self) -> "LogMonitor":
+        """Security log monitor"""
+        from netdash.log_monitor import LogMonitor, LogMonitorConfig
+        # Use the custom log file if provided, then the environment, then the default
+        config = LogMonitorConfig(
+            log_file=(self.custom_log_file or os.environ.get("NETDASH_LOG_FILE")
+                      or "/var/log/auth.log"),
+            # Fallback to a sample log file if it exists
+            fallback_log_file=os.path.join(HOME_DIR, "sample_auth.log"),
+            refresh_interval=self.refresh_interval
+        )
+        return LogMonitor(config)
+    
+    def stop(self) -> None:
+        """Stop the background threads and processes of the monitors created so far"""
+        # Monitors are cached properties, so only the created ones are in the
+        # instance dict and none is created just to be stopped
+        for monitor in list(vars(self).values()):
+            stop = getattr(monitor, "stop", None)
+            if callable(stop):
+                stop()
+
 
 class DashboardPanel(Static):
     """Base panel for dashboard components"""
@@ -57,646 +222,596 @@ class DashboardPanel(Static):
         self.title = title
         self.component = component
         self.border_style = "blue"
+        
+        # Panels refresh no faster than their component does
+        self.min_interval = getattr(component, "refresh_interval", 1.0)
+        self.last_update = float("-inf")
+        
+        # Fingerprint of the content on screen, and the last fetched
+        # renderables with the fingerprint of each
+        self._last_hash = None
+        self._fetched = ((), ())
     
     def compose(self) -> ComposeResult:
         """Compose the panel with title and content area"""
         yield Static(self.title, classes="panel-title")
-        yield Static("Loading...", classes="panel-content", id=f"{self.id}-content")
+        # Kept so updates don't have to look the content widget up each tick
+        self._content_widget = Static("Loading...", classes="panel-content", id=f"{self.id}-content")
+        yield self._content_widget
+    
+    async def _fetch(self, *getters):
+        """
+        Run the component's blocking getters off the event loop
+        
+        The getters run in order on one worker thread, so a monitor never
+        refreshes concurrently with itself. The results are fingerprinted on
+        the same thread, for _show to compare.
+        
+        Args:
+            getters: Callables to run, defaults to the component's
+                get_table and get_summary
+            
+        Returns:
+            Tuple of the getters' results
+        """
+        if not getters:
+            getters = (self.component.get_table, self.component.get_summary)
+        # Sized like the widget, so the fingerprint matches what would be drawn
+        size = self._content_widget.size
+        
+        def fetch():
+            results = tuple(getter() for getter in getters)
+            return results, self._fingerprint(results, size)
+        
+        loop = asyncio.get_running_loop()
+        results, hashes = await loop.run_in_executor(None, fetch)
+        self._fetched = (results, hashes)
+        
+        # Components may back off while idle (see DiskUsage), keep pace with them
+        self.min_interval = getattr(self.component, "refresh_interval", self.min_interval)
+        return results
     
-    async def update_content(self):
-        """Update panel content - to be implemented by subclasses"""
+    def _fingerprint(self, results: tuple, size: Tuple[int, int]) -> tuple:
+        """
+        Hash the rendered output of each fetched renderable
+        
+        Runs on the worker thread. Monitors that cache their renderables
+        hand back the same object while their data is unchanged, so those
+        keep their previous hash without being rendered again.
+        
+        Args:
+            results: Renderables returned by the getters
+            size: Width and height of the content widget
+            
+        Returns:
+            Tuple of one hash per renderable
+        """
+        previous_results, previous_hashes = self._fetched
+        width, height = size
+        console = None
+        hashes = []
+        for i, renderable in enumerate(results):
+            if i < len(previous_results) and renderable is previous_results[i]:
+                hashes.append(previous_hashes[i])
+                continue
+            
+            # The ANSI output also picks up style changes, unlike str()
+            if console is None:
+                buffer = io.StringIO()
+                console = Console(
+                    file=buffer, width=width or 80, height=height or 25,
+                    force_terminal=True, color_system="truecolor"
+                )
+            console.print(renderable)
+            hashes.append(hash(buffer.getvalue()))
+            buffer.seek(0)
+            buffer.truncate()
+        return tuple(hashes)
+    
+    def _show(self, renderable) -> None:
+        """
+        Update the content widget unless the fetched content is unchanged
+        
+        Args:
+            renderable: Rich renderable built from the last fetched results
+        """
+        content_hash = self._fetched[1]
+        if content_hash == self._last_hash:
+            return
+        self._last_hash = content_hash
+        self._content_widget.update(renderable)
+    
+    async def update_content(self, snapshot: Optional[ProcSnapshot] = None):
+        """
+        Update panel content - to be implemented by subclasses
+        
+        Args:
+            snapshot: Counters shared by all panels updated in this tick
+        """
         pass
 
 
 class NetworkPanel(DashboardPanel):
     """Panel for network statistics"""
     
-    def __init__(self):
-        """Initialize network panel"""
-        self.net_stats = NetworkStats(refresh_interval=1.0)
+    def __init__(self, registry: MonitorRegistry):
+        """
+        Initialize network panel
+        
+        Args:
+            registry: Registry providing the shared monitor
+        """
+        self.net_stats = registry.network_stats
         super().__init__("NETWORK STATISTICS", self.net_stats, "network-panel")
     
-    async def update_content(self):
+    async def update_content(self, snapshot: Optional[ProcSnapshot] = None):
         """Update network statistics"""
-        table = self.net_stats.get_table()
-        content = self.query_one(f"#{self.id}-content", Static)
-        content.update(table)
+        (table,) = await self._fetch(self.net_stats.get_table)
+        self._show(table)
 
 
 class LoginPanel(DashboardPanel):
     """Panel for login tracking"""
     
-    def __init__(self):
-        """Initialize login panel"""
-        self.login_tracker = LoginTracker()
+    def __init__(self, registry: MonitorRegistry):
+        """
+        Initialize login panel
+        
+        Args:
+            registry: Registry providing the shared monitor
+        """
+        self.login_tracker = registry.login_tracker
         super().__init__("USER LOGIN INFORMATION", self.login_tracker, "login-panel")
     
-    async def update_content(self):
+    async def update_content(self, snapshot: Optional[ProcSnapshot] = None):
         """Update login information"""
-        active_table = self.login_tracker.get_active_logins_table()
-        history_table = self.login_tracker.get_login_history_table()
-        
-        # Combine the tables in a vertical layout
-        layout = Layout()
-        layout.split_column(
-            Layout(active_table, name="active", ratio=1),
-            Layout(history_table, name="history", ratio=1)
+        active_table, history_table = await self._fetch(
+            self.login_tracker.get_active_logins_table,
+            self.login_tracker.get_login_history_table
         )
         
-        content = self.query_one(f"#{self.id}-content", Static)
-        content.update(layout)
+        self._show(Group(active_table, history_table))
 
 
 class LogPanel(DashboardPanel):
     """Panel for log monitoring"""
     
-    def __init__(self):
-        """Initialize log panel"""
-        # Get custom log file from environment if set
-        custom_log_file = os.environ.get("NETDASH_LOG_FILE")
-        
-        # Create a custom configuration
-        config = LogMonitorConfig(
-            # Use custom log file if provided, otherwise default
-            log_file=custom_log_file or "/var/log/auth.log",
-            # Fallback to a sample log file if it exists
-            fallback_log_file=os.path.join(HOME_DIR, "sample_auth.log"),
-            # Refresh every second
-            refresh_interval=1.0
-        )
+    def __init__(self, registry: MonitorRegistry):
+        """
+        Initialize log panel
         
-        self.log_monitor = LogMonitor(config)
+        Args:
+            registry: Registry providing the shared monitor
+        """
+        self.log_monitor = registry.log_monitor
         super().__init__("SECURITY LOG MONITOR", self.log_monitor, "log-panel")
     
-    async def update_content(self):
+    def _refresh_panel(self) -> Optional[Panel]:
+        """
+        Refresh the log monitor and build its panel
+        
+        Returns:
+            Rich Panel from the log monitor, or None if the log was unchanged
+        """
+        if not self.log_monitor.update():
+            return None
+        return self.log_monitor.get_panel()
+    
+    async def update_content(self, snapshot: Optional[ProcSnapshot] = None):
         """Update log information"""
-        self.log_monitor.update()
-        panel = self.log_monitor.get_panel()
-        content = self.query_one(f"#{self.id}-content", Static)
-        content.update(panel)
+        (panel,) = await self._fetch(self._refresh_panel)
+        if panel is not None:
+            self._show(panel)
 
 
 class CPUPanel(DashboardPanel):
     """Panel for CPU monitoring"""
     
-    def __init__(self):
-        """Initialize CPU panel"""
-        self.cpu_monitor = CPUMonitor(refresh_interval=1.0)
+    def __init__(self, registry: MonitorRegistry):
+        """
+        Initialize CPU panel
+        
+        Args:
+            registry: Registry providing the shared monitor
+        """
+        self.cpu_monitor = registry.cpu_monitor
         super().__init__("CPU USAGE & LOAD", self.cpu_monitor, "cpu-panel")
     
-    async def update_content(self):
+    async def update_content(self, snapshot: Optional[ProcSnapshot] = None):
         """Update CPU statistics"""
-        table = self.cpu_monitor.get_table()
-        summary = self.cpu_monitor.get_summary()
-        
-        # Create a layout to combine summary and table
-        layout = Layout()
-        layout.split_column(
-            Layout(summary, name="summary", size=3),
-            Layout(table, name="table", ratio=1)
-        )
+        table, summary = await self._fetch()
         
-        content = self.query_one(f"#{self.id}-content", Static)
-        content.update(layout)
+        self._show(Group(summary, table))
 
 
 class MemoryPanel(DashboardPanel):
     """Panel for memory monitoring"""
     
-    def __init__(self):
-        """Initialize memory panel"""
-        self.memory_monitor = MemoryMonitor(refresh_interval=1.0)
+    def __init__(self, registry: MonitorRegistry):
+        """
+        Initialize memory panel
+        
+        Args:
+            registry: Registry providing the shared monitor
+        """
+        self.memory_monitor = registry.memory_monitor
         super().__init__("MEMORY USAGE", self.memory_monitor, "memory-panel")
     
-    async def update_content(self):
+    async def update_content(self, snapshot: Optional[ProcSnapshot] = None):
         """Update memory statistics"""
-        table = self.memory_monitor.get_table()
-        summary = self.memory_monitor.get_summary()
-        
-        # Create a layout to combine summary and table
-        layout = Layout()
-        layout.split_column(
-            Layout(summary, name="summary", size=2),
-            Layout(table, name="table", ratio=1)
+        # The table updates the memory statistics, the summary reuses them
+        table, summary = await self._fetch(
+            partial(self.memory_monitor.get_table, snapshot=snapshot),
+            partial(self.memory_monitor.get_summary, refresh=False)
         )
         
-        content = self.query_one(f"#{self.id}-content", Static)
-        content.update(layout)
+        self._show(Group(summary, table))
 
 
 class DiskPanel(DashboardPanel):
     """Panel for disk usage monitoring"""
     
-    def __init__(self):
-        """Initialize disk panel"""
-        self.disk_usage = DiskUsage(refresh_interval=1.0)
+    def __init__(self, registry: MonitorRegistry):
+        """
+        Initialize disk panel
+        
+        Args:
+            registry: Registry providing the shared monitor
+        """
+        self.disk_usage = registry.disk_usage
         super().__init__("DISK USAGE & I/O", self.disk_usage, "disk-panel")
     
-    async def update_content(self):
+    async def update_content(self, snapshot: Optional[ProcSnapshot] = None):
         """Update disk usage statistics"""
-        table = self.disk_usage.get_table()
-        summary = self.disk_usage.get_summary()
-        
-        # Create a layout to combine summary and table
-        layout = Layout()
-        layout.split_column(
-            Layout(summary, name="summary", size=2),
-            Layout(table, name="table", ratio=1)
+        table, summary = await self._fetch(
+            self.disk_usage.get_table, partial(self.disk_usage.get_summary, refresh=False)
         )
         
-        content = self.query_one(f"#{self.id}-content", Static)
-        content.update(layout)
+        self._show(Group(summary, table))
 
 
 class SocketPanel(DashboardPanel):
     """Panel for socket tracking"""
     
-    def __init__(self):
-        """Initialize socket panel"""
-        self.socket_tracker = SocketTracker(refresh_interval=2.0)
+    def __init__(self, registry: MonitorRegistry):
+        """
+        Initialize socket panel
+        
+        Args:
+            registry: Registry providing the shared monitor
+        """
+        self.socket_tracker = registry.socket_tracker
         super().__init__("NETWORK CONNECTIONS", self.socket_tracker, "socket-panel")
     
-    async def update_content(self):
+    async def update_content(self, snapshot: Optional[ProcSnapshot] = None):
         """Update socket information"""
-        table = self.socket_tracker.get_table()
-        summary = self.socket_tracker.get_summary()
-        
-        # Create a layout to combine summary and table
-        layout = Layout()
-        layout.split_column(
-            Layout(summary, name="summary", size=1),
-            Layout(table, name="table", ratio=1)
-        )
+        table, summary = await self._fetch()
         
-        content = self.query_one(f"#{self.id}-content", Static)
-        content.update(layout)
+        self._show(Group(summary, table))
 
 
 class PortsPanel(DashboardPanel):
     """Panel for ports and services monitoring"""
     
-    def __init__(self):
-        """Initialize ports panel"""
-        self.ports_monitor = PortsMonitor(refresh_interval=2.0)
+    def __init__(self, registry: MonitorRegistry):
+        """
+        Initialize ports panel
+        
+        Args:
+            registry: Registry providing the shared monitor
+        """
+        self.ports_monitor = registry.ports_monitor
         super().__init__("LISTENING PORTS", self.ports_monitor, "ports-panel")
     
-    async def update_content(self):
+    async def update_content(self, snapshot: Optional[ProcSnapshot] = None):
         """Update ports information"""
-        table = self.ports_monitor.get_table()
-        summary = self.ports_monitor.get_summary()
-        
-        # Create a layout to combine summary and table
-        layout = Layout()
-        layout.split_column(
-            Layout(summary, name="summary", size=1),
-            Layout(table, name="table", ratio=1)
-        )
+        table, summary = await self._fetch()
         
-        content = self.query_one(f"#{self.id}-content", Static)
-        content.update(layout)
+        self._show(Group(summary, table))
 
 
 class SystemHealthPanel(DashboardPanel):
     """Panel for system health monitoring"""
     
-    def __init__(self):
-        """Initialize system health panel"""
-        self.system_health = SystemHealth(refresh_interval=2.0)
+    def __init__(self, registry: MonitorRegistry):
+        """
+        Initialize system health panel
+        
+        Args:
+            registry: Registry providing the shared monitor
+        """
+        self.system_health = registry.system_health
         super().__init__("SYSTEM HEALTH", self.system_health, "system-health-panel")
     
-    async def update_content(self):
+    async def update_content(self, snapshot: Optional[ProcSnapshot] = None):
         """Update system health information"""
-        table = self.system_health.get_table()
-        summary = self.system_health.get_summary()
-        
-        # Create a layout to combine summary and table
-        layout = Layout()
-        layout.split_column(
-            Layout(summary, name="summary", size=1),
-            Layout(table, name="table", ratio=1)
+        table, summary = await self._fetch(
+            partial(self.system_health.get_table, snapshot=snapshot),
+            partial(self.system_health.get_summary, snapshot=snapshot)
         )
         
-        content = self.query_one(f"#{self.id}-content", Static)
-        content.update(layout)
+        self._show(Group(summary, table))
 
 
 class ContainerPanel(DashboardPanel):
     """Panel for container monitoring"""
     
-    def __init__(self):
-        """Initialize container panel"""
-        self.container_monitor = ContainerMonitor(refresh_interval=2.0)
+    def __init__(self, registry: MonitorRegistry):
+        """
+        Initialize container panel
+        
+        Args:
+            registry: Registry providing the shared monitor
+        """
+        self.container_monitor = registry.container_monitor
         super().__init__("CONTAINERS", self.container_monitor, "container-panel")
     
-    async def update_content(self):
+    async def update_content(self, snapshot: Optional[ProcSnapshot] = None):
         """Update container information"""
-        table = self.container_monitor.get_table()
-        summary = self.container_monitor.get_summary()
-        
-        # Create a layout to combine summary and table
-        layout = Layout()
-        layout.split_column(
-            Layout(summary, name="summary", size=1),
-            Layout(table, name="table", ratio=1)
-        )
+        table, summary = await self._fetch()
         
-        content = self.query_one(f"#{self.id}-content", Static)
-        content.update(layout)
+        self._show(Group(summary, table))
 
 
 class VMPanel(DashboardPanel):
     """Panel for VM monitoring"""
     
-    def __init__(self):
-        """Initialize VM panel"""
-        self.vm_monitor = VMMonitor(refresh_interval=2.0)
+    def __init__(self, registry: MonitorRegistry):
+        """
+        Initialize VM panel
+        
+        Args:
+            registry: Registry providing the shared monitor
+        """
+        self.vm_monitor = registry.vm_monitor
         super().__init__("VIRTUAL MACHINES", self.vm_monitor, "vm-panel")
     
-    async def update_content(self):
+    async def update_content(self, snapshot: Optional[ProcSnapshot] = None):
         """Update VM information"""
-        table = self.vm_monitor.get_table()
-        summary = self.vm_monitor.get_summary()
-        
-        # Create a layout to combine summary and table
-        layout = Layout()
-        layout.split_column(
-            Layout(summary, name="summary", size=1),
-            Layout(table, name="table", ratio=1)
-        )
+        table, summary = await self._fetch()
         
-        content = self.query_one(f"#{self.id}-content", Static)
-        content.update(layout)
+        self._show(Group(summary, table))
 
 
 class SecurityPanel(DashboardPanel):
     """Panel for security monitoring"""
     
-    def __init__(self):
-        """Initialize security panel"""
-        self.security_monitor = SecurityMonitor(refresh_interval=1.0)
+    def __init__(self, registry: MonitorRegistry):
+        """
+        Initialize security panel
+        
+        Args:
+            registry: Registry providing the shared monitor
+        """
+        self.security_monitor = registry.security_monitor
         super().__init__("SECURITY ALERTS", self.security_monitor, "security-panel")
     
-    async def update_content(self):
+    async def update_content(self, snapshot: Optional[ProcSnapshot] = None):
         """Update security information"""
-        table = self.security_monitor.get_alerts_table()
-        summary = self.security_monitor.get_summary()
-        
-        # Create a layout to combine summary and table
-        layout = Layout()
-        layout.split_column(
-            Layout(summary, name="summary", size=1),
-            Layout(table, name="table", ratio=1)
+        table, summary = await self._fetch(
+            self.security_monitor.get_alerts_table, self.security_monitor.get_summary
         )
         
-        content = self.query_one(f"#{self.id}-content", Static)
-        content.update(layout)
+        self._show(Group(summary, table))
 
 
 class ServiceManagerPanel(DashboardPanel):
     """Panel for service management"""
     
-    def __init__(self):
-        """Initialize service manager panel"""
-        self.service_manager = ServiceManager(refresh_interval=2.0)
+    def __init__(self, registry: MonitorRegistry):
+        """
+        Initialize service manager panel
+        
+        Args:
+            registry: Registry providing the shared monitor
+        """
+        self.service_manager = registry.service_manager
         super().__init__("SERVICES", self.service_manager, "service-manager-panel")
     
-    async def update_content(self):
+    async def update_content(self, snapshot: Optional[ProcSnapshot] = None):
         """Update service information"""
-        table = self.service_manager.get_table()
-        summary = self.service_manager.get_summary()
-        
-        # Create a layout to combine summary and table
-        layout = Layout()
-        layout.split_column(
-            Layout(summary, name="summary", size=1),
-            Layout(table, name="table", ratio=1)
-        )
-        
-        content = self.query_one(f"#{self.id}-content", Static)
-        content.update(layout)
-
-
-class DiskPanel(DashboardPanel):
-    """Panel for disk usage monitoring"""
-    
-    def __init__(self):
-        """Initialize disk usage panel"""
-        self.disk_usage = DiskUsage(refresh_interval=1.0)
-        super().__init__("DISK USAGE & I/O", self.disk_usage, "disk-panel")
-    
-    async def update_content(self):
-        """Update disk statistics"""
-        table = self.disk_usage.get_table()
-        summary = self.disk_usage.get_summary()
-        
-        # Create a layout to combine summary and table
-        layout = Layout()
-        layout.split_column(
-            Layout(summary, name="summary", size=2),
-            Layout(table, name="table", ratio=1)
-        )
+        table, summary = await self._fetch()
         
-        content = self.query_one(f"#{self.id}-content", Static)
-        content.update(layout)
+        self._show(Group(summary, table))
 
 
 class NetDashApp(App):
     """NetDash Textual App"""
     
-    CSS = """
-    Screen {
-        background: #121212;
-    }
-
-    #dashboard {
-        layout: grid;
-        grid-size: 6;
-        grid-rows: 1fr 1fr 1fr 1fr 1fr 1fr;
-        grid-columns: 1fr 1fr 1fr 1fr 1fr 1fr;
-        height: 100%;
-        padding: 0 1 0 1;
-    }
-
-    /* Resource Monitoring - Top Row */
-    #cpu-panel {
-        row-span: 1;
-        column-span: 2;
-        height: 100%;
-        border: heavy $primary-darken-2;
-        background: $surface-darken-1;
-        overflow: auto;
-    }
-
-    #memory-panel {
-        row-span: 1;
-        column-span: 2;
-        height: 100%;
-        border: heavy $primary-darken-2;
-        background: $surface-darken-1;
-        overflow: auto;
-    }
-    
-    #system-health-panel {
-        row-span: 1;
-        column-span: 2;
-        height: 100%;
-        border: heavy $primary-darken-2;
-        background: $surface-darken-1;
-        overflow: auto;
-    }
-    
-    /* Network Row */
-    #network-panel {
-        row-span: 1;
-        column-span: 2;
-        height: 100%;
-        border: heavy $primary-darken-2;
-        background: $surface-darken-1;
-        overflow: auto;
-    }
-    
-    #socket-panel {
-        row-span: 1;
-        column-span: 2;
-        height: 100%;
-        border: heavy $primary-darken-2;
-        background: $surface-darken-1;
-        overflow: auto;
-    }
-    
-    #ports-panel {
-        row-span: 1;
-        column-span: 2;
-        height: 100%;
-        border: heavy $primary-darken-2;
-        background: $surface-darken-1;
-        overflow: auto;
-    }
-
-    /* Storage Row */
-    #disk-panel {
-        row-span: 1;
-        column-span: 3;
-        height: 100%;
-        border: heavy $primary-darken-2;
-        background: $surface-darken-1;
-        overflow: auto;
-    }
-    
-    #container-panel {
-        row-span: 1;
-        column-span: 3;
-        height: 100%;
-        border: heavy $primary-darken-2;
-        background: $surface-darken-1;
-        overflow: auto;
-    }
-    
-    /* Virtual Row */
-    #vm-panel {
-        row-span: 1;
-        column-span: 3;
-        height: 100%;
-        border: heavy $primary-darken-2;
-        background: $surface-darken-1;
-        overflow: auto;
-    }
-    
-    #service-manager-panel {
-        row-span: 1;
-        column-span: 3;
-        height: 100%;
-        border: heavy $primary-darken-2;
-        background: $surface-darken-1;
-        overflow: auto;
-    }
-
-    /* Security and Users Row */
-    #login-panel {
-        row-span: 1;
-        column-span: 3;
-        height: 100%;
-        border: heavy $primary-darken-2;
-        background: $surface-darken-1;
-        overflow: auto;
-    }
-    
-    #security-panel {
-        row-span: 1;
-        column-span: 3;
-        height: 100%;
-        border: heavy $primary-darken-2;
-        background: $surface-darken-1;
-        overflow: auto;
-    }
-    
-    /* Log (Full Width) */
-    #log-panel {
-        row-span: 1;
-        column-span: 6;
-        height: 100%;
-        border: heavy $primary-darken-2;
-        background: $surface-darken-1;
-        overflow: auto;
-    }
-
-    Header {
-        background: $primary-darken-1;
-        color: $text;
-        padding: 0 1;
-    }
-
-    Footer {
-        background: $primary-darken-1;
-        color: $text;
-        padding: 0 1;
-    }
-    
-    .panel-title {
-        dock: top;
-        padding: 0 1;
-        height: 1;
-        background: $primary;
-        color: $text;
-        text-align: center;
-        text-style: bold;
-    }
-
-    .panel-content {
-        background: $surface;
-        height: 1fr;
-        overflow-y: auto;
-        padding: 0 1 0 0;
-    }
-    """
+    # Parsed once from the stylesheet file rather than an inline string
+    CSS_PATH = os.path.join(os.path.dirname(__file__), "dashboard.tcss")
     
     TITLE = "NETDASH"
     SUB_TITLE = "System Monitoring Dashboard"
     
-    def __init__(self, *args, **kwargs):
-        """Initialize the app"""
+    # Slot (as in RichDashboard.PANELS), attribute and class of every
+    # panel, in layout order
+    PANELS = [
+        ("cpu", "cpu_panel", CPUPanel),
+        ("memory", "memory_panel", MemoryPanel),
+        ("disk", "disk_panel", DiskPanel),
+        ("system_health", "system_health_panel", SystemHealthPanel),
+        ("network", "network_panel", NetworkPanel),
+        ("sockets", "socket_panel", SocketPanel),
+        ("ports", "ports_panel", PortsPanel),
+        ("logins", "login_panel", LoginPanel),
+        ("log_monitor", "log_panel", LogPanel),
+        ("security", "security_panel", SecurityPanel),
+        ("containers", "container_panel", ContainerPanel),
+        ("vms", "vm_panel", VMPanel),
+        ("services", "service_manager_panel", ServiceManagerPanel),
+    ]
+    
+    def __init__(self, *args, registry: MonitorRegistry = None,
+                 panels: Optional[List[str]] = None, **kwargs):
+        """
+        Initialize the app
+        
+        Args:
+            registry: Optional registry of monitors to share with another frontend
+            panels: Optional panel slots to show, all panels if not given
+        """
         super().__init__(*args, **kwargs)
+        self.panels = _select_panels([slot for slot, _, _ in self.PANELS], panels)
         self.update_interval = 1.0  # seconds
+        
+        # A registry passed in is shared, and stopped by whoever created it
+        self._owns_registry = registry is None
+        self.registry = registry or MonitorRegistry()
     
     def compose(self) -> ComposeResult:
         """Compose the app layout"""
         yield Header(show_clock=True)
         
+        # Shown panels, refreshed together on every tick. Unselected panels
+        # aren't built, so their monitors are never created.
+        self._panels = []
         with Container(id="dashboard"):
-            # CPU monitor panel
-            self.cpu_panel = CPUPanel()
-            yield self.cpu_panel
-            
-            # Memory monitor panel
-            self.memory_panel = MemoryPanel()
-            yield self.memory_panel
-            
-            # Disk usage panel
-            self.disk_panel = DiskPanel()
-            yield self.disk_panel
-            
-            # System health panel
-            self.system_health_panel = SystemHealthPanel()
-            yield self.system_health_panel
-            
-            # Network stats panel
-            self.network_panel = NetworkPanel()
-            yield self.network_panel
-            
-            # Socket tracker panel
-            self.socket_panel = SocketPanel()
-            yield self.socket_panel
-            
-            # Ports monitor panel
-            self.ports_panel = PortsPanel()
-            yield self.ports_panel
-            
-            # Login panel
-            self.login_panel = LoginPanel()
-            yield self.login_panel
-            
-            # Log monitor panel
-            self.log_panel = LogPanel()
-            yield self.log_panel
-            
-            # Security panel
-            self.security_panel = SecurityPanel()
-            yield self.security_panel
-            
-            # Container monitor panel
-            self.container_panel = ContainerPanel()
-            yield self.container_panel
-            
-            # VM monitor panel
-            self.vm_panel = VMPanel()
-            yield self.vm_panel
-            
-            # Service manager panel
-            self.service_manager_panel = ServiceManagerPanel()
-            yield self.service_manager_panel
+            for slot, attribute, panel_class in self.PANELS:
+                if slot not in self.panels:
+                    continue
+                panel = panel_class(self.registry)
+                setattr(self, attribute, panel)
+                self._panels.append(panel)
+                yield panel
         
         yield Footer()
     
     async def on_mount(self) -> None:
         """Set up regular updates for panels after app is mounted"""
+        # One worker per panel: every due panel can fetch at once, and the
+        # same threads are reused tick after tick
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self._panels)), thread_name_prefix="netdash"
+        )
+        asyncio.get_running_loop().set_default_executor(self._executor)
+        
+        # The timer awaits each tick before scheduling the next and skips
+        # ticks missed while one overran, so updates never overlap
         self.set_interval(self.update_interval, self.update_panels)
     
+    async def on_unmount(self) -> None:
+        """Release the panel worker threads and the monitors' background work"""
+        self._executor.shutdown(wait=False)
+        if self._owns_registry:
+            self.registry.stop()
+    
     async def update_panels(self) -> None:
-        """Update all dashboard panels"""
-        await self.cpu_panel.update_content()
-        await self.memory_panel.update_content()
-        await self.disk_panel.update_content()
-        await self.system_health_panel.update_content()
-        await self.network_panel.update_content()
-        await self.socket_panel.update_content()
-        await self.ports_panel.update_content()
-        await self.login_panel.update_content()
-        await self.log_panel.update_content()
-        await self.security_panel.update_content()
-        await self.container_panel.update_content()
-        await self.vm_panel.update_content()
-        await self.service_manager_panel.update_content()
+        """Update all due dashboard panels concurrently"""
+        now = time.monotonic()
+        
+        # Allow half a tick of slack so timer jitter doesn't push a 2 s
+        # panel out to every third tick
+        slack = self.update_interval / 2
+        
+        # Hidden or collapsed panels are skipped entirely, and refresh on the
+        # first tick after they are shown again
+        due = [
+            panel for panel in self._panels
+            if now - panel.last_update >= panel.min_interval - slack
+            and panel.display and panel.region.height > 1
+        ]
+        for panel in due:
+            panel.last_update = now
+        
+        # Counters several monitors read are fetched at most once per tick
+        snapshot = ProcSnapshot()
+        
+        # Hold repaints until every panel has updated, so the tick is
+        # composited once rather than once per panel
+        with self.batch_update():
+            results = await asyncio.gather(
+                *(panel.update_content(snapshot) for panel in due),
+                return_exceptions=True
+            )
         
+        # A failing panel is logged and skipped, it doesn't abort the tick
+        for panel, result in zip(due, results):
+            if isinstance(result, Exception):
+                self.log.error(f"Failed to update {panel.id}: {result!r}")
+
 
 class RichDashboard:
     """Rich-based dashboard as an alternative to Textual"""
     
-    def __init__(self, update_interval: float = 1.0, custom_log_file: str = None):
+    # Row, slot, title and border style of every panel
+    PANELS = [
+        ("resources", "cpu", "CPU USAGE & LOAD", "bright_green"),
+        ("resources", "memory", "MEMORY USAGE", "bright_magenta"),
+        ("resources", "system_health", "SYSTEM HEALTH", "bright_red"),
+        ("networking", "network", "NETWORK STATISTICS", "bright_blue"),
+        ("networking", "sockets", "NETWORK CONNECTIONS", "bright_cyan"),
+        ("networking", "ports", "LISTENING PORTS", "bright_blue"),
+        ("storage", "disk", "DISK USAGE & I/O", "bright_yellow"),
+        ("storage", "containers", "CONTAINERS", "bright_magenta"),
+        ("virt", "vms", "VIRTUAL MACHINES", "bright_green"),
+        ("virt", "services", "SERVICES", "bright_cyan"),
+        ("users", "logins", "USER LOGIN INFORMATION", "bright_blue"),
+        ("users", "security", "SECURITY ALERTS", "bright_red"),
+        ("logs", "log_monitor", "SECURITY LOG MONITOR", "bright_yellow"),
+    ]
+    
+    # Registry monitor behind each plain table-and-summary panel
+    SLOT_MONITORS = {
+        "cpu": "cpu_monitor",
+        "memory": "memory_monitor",
+        "system_health": "system_health",
+        "sockets": "socket_tracker",
+        "ports": "ports_monitor",
+        "containers": "container_monitor",
+        "vms": "vm_monitor",
+        "services": "service_manager",
+    }
+    
+    def __init__(self, update_interval: float = 1.0, custom_log_file: str = None,
+                 registry: MonitorRegistry = None, panels: Optional[List[str]] = None):
         """
         Initialize the dashboard
         
         Args:
             update_interval: Update interval in seconds
             custom_log_file: Optional path to a custom log file
+            registry: Optional registry of monitors to share with another frontend
+            panels: Optional panel slots to show, all panels if not given
         """
+        self.panels = _select_panels([slot for _, slot, _, _ in self.PANELS], panels)
+        
         self.console = Console(highlight=False)
         self.update_interval = update_interval
         self.layout = self._create_layout()
         
-        # Initialize components
-        self.cpu_monitor = CPUMonitor(refresh_interval=update_interval)
-        self.memory_monitor = MemoryMonitor(refresh_interval=update_interval)
-        self.disk_usage = DiskUsage(refresh_interval=update_interval)
-        self.system_health = SystemHealth(refresh_interval=update_interval)
-        self.network_stats = NetworkStats(refresh_interval=update_interval)
-        self.socket_tracker = SocketTracker(refresh_interval=update_interval)
-        self.ports_monitor = PortsMonitor(refresh_interval=update_interval)
-        self.login_tracker = LoginTracker()
-        self.container_monitor = ContainerMonitor(refresh_interval=update_interval)
-        self.vm_monitor = VMMonitor(refresh_interval=update_interval)
-        self.security_monitor = SecurityMonitor(refresh_interval=update_interval)
-        self.service_manager = ServiceManager(refresh_interval=update_interval)
-        
-        # Create a custom configuration for log monitor
-        log_config = LogMonitorConfig(
-            # Use custom log file if provided, otherwise default
-            log_file=custom_log_file or "/var/log/auth.log",
-            # Fallback to a sample log file if it exists
-            fallback_log_file=os.path.join(HOME_DIR, "sample_auth.log"),
-            # Refresh every second
-            refresh_interval=update_interval
-        )
-        self.log_monitor = LogMonitor(log_config)
+        # Panels are built and placed once, only their contents change on updates
+        self._panels = {}
+        for row, slot, title, border_style in self.PANELS:
+            panel = Panel(
+                Text("Loading..."),
+                title=f"[bold white]{title}[/bold white]",
+                border_style=border_style,
+                box=box.HEAVY,
+                padding=(0, 1)
+            )
+            self.layout[row][slot].update(panel)
+            self._panels[slot] = panel
+            
+            # Unselected panels are hidden, and so are rows left empty
+            self.layout[row][slot].visible = slot in self.panels
+        for row in self.layout.children:
+            row.visible = any(child.visible for child in row.children)
+        
+        # Initialize components. A registry passed in is shared, and stopped
+        # by whoever created it.
+        self._owns_registry = registry is None
+        if registry is None:
+            registry = MonitorRegistry(
+                refresh_interval=update_interval,
+                slow_refresh_interval=update_interval,
+                custom_log_file=custom_log_file
+            )
+        self.registry = registry
+        
+        # Getters feeding each shown panel, top to bottom. Only the monitors
+        # behind the shown panels are ever created.
+        self._sources = {slot: self._panel_sources(slot) for slot in self.panels}
     
     def _create_layout(self) -> Layout:
         """
@@ -750,285 +865,147 @@ class RichDashboard:
         )
         
         # Logs row (full width)
-        layout["logs"].update(Layout(name="log_monitor", ratio=1))
+        layout["logs"].split_column(Layout(name="log_monitor", ratio=1))
         
         return layout
     
-    def _update_layout(self) -> None:
-        """Update all panels in the layout"""
-        # Update CPU monitor
-        cpu_table = self.cpu_monitor.get_table()
-        cpu_summary = self.cpu_monitor.get_summary()
-        
-        cpu_layout = Layout()
-        cpu_layout.split_column(
-            Layout(cpu_summary, name="summary", size=3),
-            Layout(cpu_table, name="table", ratio=1)
-        )
-        
-        self.layout["resources"]["cpu"].update(
-            Panel(
-                cpu_layout,
-                title="[bold white]CPU USAGE & LOAD[/bold white]", 
-                border_style="bright_green", 
-                box=box.HEAVY,
-                padding=(0, 1)
-            )
-        )
-        
-        # Update memory monitor
-        memory_table = self.memory_monitor.get_table()
-        memory_summary = self.memory_monitor.get_summary()
-        
-        memory_layout = Layout()
-        memory_layout.split_column(
-            Layout(memory_summary, name="summary", size=2),
-            Layout(memory_table, name="table", ratio=1)
-        )
-        
-        self.layout["resources"]["memory"].update(
-            Panel(
-                memory_layout,
-                title="[bold white]MEMORY USAGE[/bold white]", 
-                border_style="bright_magenta", 
-                box=box.HEAVY,
-                padding=(0, 1)
-            )
-        )
-        
-        # Update system health
-        system_table = self.system_health.get_table()
-        system_summary = self.system_health.get_summary()
-        
-        system_layout = Layout()
-        system_layout.split_column(
-            Layout(system_summary, name="summary", size=1),
-            Layout(system_table, name="table", ratio=1)
-        )
-        
-        self.layout["resources"]["system_health"].update(
-            Panel(
-                system_layout,
-                title="[bold white]SYSTEM HEALTH[/bold white]", 
-                border_style="bright_red", 
-                box=box.HEAVY,
-                padding=(0, 1)
-            )
-        )
-        
-        # Update network stats
-        net_table = self.network_stats.get_table()
-        net_summary = self.network_stats.get_summary()
-        
-        net_layout = Layout()
-        net_layout.split_column(
-            Layout(net_summary, name="summary", size=1),
-            Layout(net_table, name="table", ratio=1)
-        )
-        
-        self.layout["networking"]["network"].update(
-            Panel(
-                net_layout,
-                title="[bold white]NETWORK STATISTICS[/bold white]", 
-                border_style="bright_blue", 
-                box=box.HEAVY,
-                padding=(0, 1)
-            )
-        )
-        
-        # Update socket tracker
-        socket_table = self.socket_tracker.get_table()
-        socket_summary = self.socket_tracker.get_summary()
-        
-        socket_layout = Layout()
-        socket_layout.split_column(
-            Layout(socket_summary, name="summary", size=1),
-            Layout(socket_table, name="table", ratio=1)
-        )
-        
-        self.layout["networking"]["sockets"].update(
-            Panel(
-                socket_layout,
-                title="[bold white]NETWORK CONNECTIONS[/bold white]", 
-                border_style="bright_cyan", 
-                box=box.HEAVY,
-                padding=(0, 1)
-            )
-        )
-        
-        # Update ports monitor
-        ports_table = self.ports_monitor.get_table()
-        ports_summary = self.ports_monitor.get_summary()
-        
-        ports_layout = Layout()
-        ports_layout.split_column(
-            Layout(ports_summary, name="summary", size=1),
-            Layout(ports_table, name="table", ratio=1)
-        )
-        
-        self.layout["networking"]["ports"].update(
-            Panel(
-                ports_layout,
-                title="[bold white]LISTENING PORTS[/bold white]", 
-                border_style="bright_blue", 
-                box=box.HEAVY,
-                padding=(0, 1)
-            )
-        )
-        
-        # Update disk usage
-        disk_table = self.disk_usage.get_table()
-        disk_summary = self.disk_usage.get_summary()
-        
-        disk_layout = Layout()
-        disk_layout.split_column(
-            Layout(disk_summary, name="summary", size=2),
-            Layout(disk_table, name="table", ratio=1)
-        )
-        
-        self.layout["storage"]["disk"].update(
-            Panel(
-                disk_layout,
-                title="[bold white]DISK USAGE & I/O[/bold white]", 
-                border_style="bright_yellow", 
-                box=box.HEAVY,
-                padding=(0, 1)
-            )
-        )
-        
-        # Update container monitor
-        container_table = self.container_monitor.get_table()
-        container_summary = self.container_monitor.get_summary()
-        
-        container_layout = Layout()
-        container_layout.split_column(
-            Layout(container_summary, name="summary", size=1),
-            Layout(container_table, name="table", ratio=1)
-        )
-        
-        self.layout["storage"]["containers"].update(
-            Panel(
-                container_layout,
-                title="[bold white]CONTAINERS[/bold white]", 
-                border_style="bright_magenta", 
-                box=box.HEAVY,
-                padding=(0, 1)
-            )
-        )
-        
-        # Update VM monitor
-        vm_table = self.vm_monitor.get_table()
-        vm_summary = self.vm_monitor.get_summary()
-        
-        vm_layout = Layout()
-        vm_layout.split_column(
-            Layout(vm_summary, name="summary", size=1),
-            Layout(vm_table, name="table", ratio=1)
-        )
-        
-        self.layout["virt"]["vms"].update(
-            Panel(
-                vm_layout,
-                title="[bold white]VIRTUAL MACHINES[/bold white]", 
-                border_style="bright_green", 
-                box=box.HEAVY,
-                padding=(0, 1)
-            )
-        )
-        
-        # Update services manager
-        service_table = self.service_manager.get_table()
-        service_summary = self.service_manager.get_summary()
-        
-        service_layout = Layout()
-        service_layout.split_column(
-            Layout(service_summary, name="summary", size=1),
-            Layout(service_table, name="table", ratio=1)
-        )
-        
-        self.layout["virt"]["services"].update(
-            Panel(
-                service_layout,
-                title="[bold white]SERVICES[/bold white]", 
-                border_style="bright_cyan", 
-                box=box.HEAVY,
-                padding=(0, 1)
-            )
-        )
-        
-        # Update login information
-        active_table = self.login_tracker.get_active_logins_table()
-        history_table = self.login_tracker.get_login_history_table()
+    def _fetch(self, *getters):
+        """
+        Call a monitor's blocking getters in order
         
-        login_layout = Layout()
-        login_layout.split_column(
-            Layout(active_table, name="active", ratio=1),
-            Layout(history_table, name="history", ratio=1)
-        )
+        Args:
+            getters: Callables returning renderables for one panel
+            
+        Returns:
+            Tuple of the getters' results, or error messages if one failed
+        """
+        try:
+            return tuple(getter() for getter in getters)
+        except Exception as e:
+            error = Text(f"Error: {e}", style="bold red")
+            return tuple(error if i == 0 else Text("") for i in range(len(getters)))
+    
+    def _panel_sources(self, slot: str) -> Tuple[Callable, ...]:
+        """
+        Map a panel slot to the monitor getters that fill it
         
-        self.layout["users"]["logins"].update(
-            Panel(
-                login_layout,
-                title="[bold white]USER LOGIN INFORMATION[/bold white]",
-                border_style="bright_blue",
-                box=box.HEAVY,
-                padding=(0, 1)
+        Args:
+            slot: Panel slot name
+            
+        Returns:
+            Tuple of getters whose results are stacked top to bottom
+        """
+        registry = self.registry
+        if slot == "network":
+            return (registry.network_stats.get_table,)
+        if slot == "log_monitor":
+            return (self._update_log_monitor,)
+        if slot == "logins":
+            return (
+                registry.login_tracker.get_active_logins_table,
+                registry.login_tracker.get_login_history_table,
             )
-        )
-        
-        # Update security monitor
-        security_table = self.security_monitor.get_alerts_table()
-        security_summary = self.security_monitor.get_summary()
+        if slot == "security":
+            monitor = registry.security_monitor
+            return (monitor.get_summary, monitor.get_alerts_table)
+        if slot == "disk":
+            # The summary updates the disk statistics, the table reuses them
+            monitor = registry.disk_usage
+            return (monitor.get_summary, partial(monitor.get_table, refresh=False))
+        
+        monitor = getattr(registry, self.SLOT_MONITORS[slot])
+        if slot == "memory":
+            # Likewise for the memory statistics
+            return (monitor.get_summary, partial(monitor.get_table, refresh=False))
+        return (monitor.get_summary, monitor.get_table)
+    
+    def _update_log_monitor(self):
+        """
+        Refresh the log monitor and return the content of its panel
         
-        security_layout = Layout()
-        security_layout.split_column(
-            Layout(security_summary, name="summary", size=1),
-            Layout(security_table, name="table", ratio=1)
-        )
+        Returns:
+            Rich renderable from inside the log monitor's panel
+        """
+        log_monitor = self.registry.log_monitor
+        log_monitor.update()
+        log_panel = log_monitor.get_panel()
+        return log_panel.renderable if isinstance(log_panel, Panel) else log_panel
+    
+    async def _sample(self) -> List[Tuple]:
+        """
+        Collect the renderables of every shown panel
         
-        self.layout["users"]["security"].update(
-            Panel(
-                security_layout,
-                title="[bold white]SECURITY ALERTS[/bold white]",
-                border_style="bright_red",
-                box=box.HEAVY,
-                padding=(0, 1)
-            )
-        )
+        Returns:
+            List of per-panel result tuples, in the order of self._sources
+        """
+        # Monitors read /proc, sockets and subprocess output, so each one is
+        # fetched on the default executor and all of them run concurrently
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(*(
+            loop.run_in_executor(None, self._fetch, *sources)
+            for sources in self._sources.values()
+        ))
+    
+    def _render(self, results: List[Tuple]) -> None:
+        """
+        Place freshly sampled renderables into the layout
         
-        # Update log monitor
-        self.log_monitor.update()
-        log_panel = self.log_monitor.get_panel()
+        This is the only place the layout is mutated, always from the event
+        loop and never while a refresh is rendering it.
         
-        # Extract the content from the panel and put it in our own panel
-        self.layout["logs"]["log_monitor"].update(
-            Panel(
-                log_panel.renderable,
-                title="[bold white]SECURITY LOG MONITOR[/bold white]",
-                border_style="bright_yellow",
-                box=box.HEAVY,
-                padding=(0, 1)
-            )
-        )
+        Args:
+            results: Per-panel result tuples returned by _sample()
+        """
+        # Stack each panel's renderables straight into its prebuilt Panel
+        for slot, values in zip(self._sources, results):
+            self._panels[slot].renderable = values[0] if len(values) == 1 else Group(*values)
+    
+    async def _update_layout(self) -> None:
+        """Update all shown panels in the layout"""
+        self._render(await self._sample())
     
     async def run(self) -> None:
         """Run the dashboard"""
-        with Live(self.layout, refresh_per_second=1/self.update_interval, screen=True) as live:
+        # One worker per shown panel, reused across ticks
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self._sources)), thread_name_prefix="netdash"
+        )
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(executor)
+        
+        # Repaint only after a tick has filled in every panel, rather than on
+        # Live's own timer thread midway through an update
+        with Live(self.layout, console=self.console, auto_refresh=False, screen=True) as live:
             try:
                 while True:
-                    self._update_layout()
-                    await asyncio.sleep(self.update_interval)
+                    started = time.monotonic()
+                    await self._update_layout()
+                    
+                    # Laying out and writing the whole screen is the slowest part
+                    # of a tick, so it runs off the event loop too. It's awaited
+                    # before the next sample, so monitors never change mid-render.
+                    await loop.run_in_executor(None, live.refresh)
+                    
+                    # Keep a steady cadence regardless of how long the tick took
+                    elapsed = time.monotonic() - started
+                    await asyncio.sleep(max(0.0, self.update_interval - elapsed))
             except KeyboardInterrupt:
                 pass
+            finally:
+                executor.shutdown(wait=False)
+                if self._owns_registry:
+                    self.registry.stop()
 
 
-def main(use_textual: bool = True, custom_log_file: str = None) -> None:
+def main(use_textual: bool = True, custom_log_file: str = None,
+         panels: Optional[List[str]] = None) -> None:
     """
     Main function to run the dashboard
     
     Args:
         use_textual: Whether to use the Textual-based or Rich-based dashboard
         custom_log_file: Optional path to a custom log file
+        panels: Optional panel slots to show
     """
     # Parse any command-line arguments
     debug_mode = "--debug" in sys.argv
@@ -1047,15 +1024,15 @@ def main(use_textual: bool = True, custom_log_file: str = None) -> None:
     try:
         if use_textual:
             # Run the Textual app
-            app = NetDashApp()
+            app = NetDashApp(panels=panels)
             app.run()
         else:
             # Run the Rich-based dashboard
-            dashboard = RichDashboard(update_interval=1.0, custom_log_file=custom_log_file)
+            dashboard = RichDashboard(
+                update_interval=1.0, custom_log_file=custom_log_file, panels=panels
+            )
             
-            # Get event loop
-            loop = asyncio.get_event_loop()
-            loop.run_until_complete(dashboard.run())
+            asyncio.run(dashboard.run())
     except KeyboardInterrupt:
         print("\nExiting NetDash...")
     except Exception as e:
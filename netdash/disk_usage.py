@@ -14,9 +14,14 @@ import time
 import asyncio
 import psutil
 import shutil
-from typing import Dict, List, Tuple, Optional, Set
+import re
+import math
+import bisect
+import operator
+import functools
+from typing import Dict, FrozenSet, List, NamedTuple, Tuple, Optional, Set
 from datetime import datetime, timedelta
-from rich.console import Console
+from rich.console import Console, Group
 from rich.live import Live
 from rich.table import Table
 from rich.panel import Panel
@@ -24,11 +29,233 @@ from rich.text import Text
 from rich.progress import BarColumn, Progress, TextColumn
 from rich import box
 
+from netdash._fastmath import load_numpy, rates
+
 # Color thresholds for disk utilization
 WARN_THRESHOLD = 70
 CRITICAL_THRESHOLD = 80
 DANGER_THRESHOLD = 90
 
+# Color for each threshold bucket, indexed by bisecting the thresholds
+_THRESHOLDS = (WARN_THRESHOLD, CRITICAL_THRESHOLD, DANGER_THRESHOLD)
+_COLOR_BUCKETS = ("green", "yellow", "dark_orange", "red")
+
+# Every possible usage bar, precomputed so rendering doesn't rebuild them
+_BAR_WIDTH = 30
+_BARS = tuple("█" * i + "░" * (_BAR_WIDTH - i) for i in range(_BAR_WIDTH + 1))
+
+# Header and options of each table column, applied to every new table
+_FILESYSTEM_COLUMNS = (
+    ("Filesystem", {"style": "cyan", "no_wrap": True}),
+    ("Type", {"style": "bright_black", "width": 8}),
+    ("Size", {"justify": "right", "width": 10}),
+    ("Used", {"justify": "right", "width": 10}),
+    ("Avail", {"justify": "right", "width": 10}),
+    ("Use%", {"justify": "right", "width": 6}),
+    ("Usage", {"ratio": 1}),
+)
+_IO_COLUMNS = (
+    ("Device", {"style": "cyan"}),
+    ("Read", {"justify": "right", "style": "green"}),
+    ("Write", {"justify": "right", "style": "yellow"}),
+    ("Read ops/s", {"justify": "right", "style": "green"}),
+    ("Write ops/s", {"justify": "right", "style": "yellow"}),
+)
+
+# Seconds a partition listing is reused before re-enumerating mounts
+PARTITIONS_TTL = 30.0
+
+# Idle backoff: after IDLE_UPDATES_BEFORE_BACKOFF updates with total I/O below
+# IDLE_IO_THRESHOLD bytes/s and no visible change in usage, the refresh
+# interval doubles on every further idle update, up to MAX_IDLE_REFRESH_INTERVAL
+IDLE_IO_THRESHOLD = 64 * 1024
+IDLE_UPDATES_BEFORE_BACKOFF = 3
+MAX_IDLE_REFRESH_INTERVAL = 10.0
+
+# Minimum number of disks before I/O rates are computed with numpy (if installed)
+NUMPY_MIN_DISKS = 16
+
+# Disk I/O counters converted to per-second rates on every update
+_IO_FIELDS = operator.attrgetter('read_count', 'write_count', 'read_bytes', 'write_bytes')
+_IO_RATE_KEYS = ('read_ops', 'write_ops', 'read_bytes', 'write_bytes')
+
+# Virtual block devices left out of the I/O table
+_SKIP_DISK_PREFIXES = ('loop', 'ram')
+
+# /proc/diskstats counts sectors in fixed 512-byte units, whatever the device's sector size
+_DISKSTATS_SECTOR_SIZE = 512
+
+
+
+class _Partition(NamedTuple):
+    """Mounted filesystem, with the same fields as psutil's partition entries"""
+    device: str
+    mountpoint: str
+    fstype: str
+    opts: str
+
+
+# Octal escapes used by the kernel for whitespace and backslashes in mountinfo paths
+_MOUNTINFO_ESCAPE = re.compile(r'\\([0-7]{3})')
+
+
+@functools.lru_cache(maxsize=1)
+def _physical_fstypes() -> FrozenSet[str]:
+    """
+    Get the filesystem types backed by a device (/proc/filesystems)
+    
+    Returns:
+        Set of filesystem types not flagged "nodev", plus zfs
+    """
+    fstypes = {"zfs"}
+    with open('/proc/filesystems') as f:
+        for line in f:
+            fields = line.split()
+            if fields and fields[0] != "nodev":
+                fstypes.add(fields[0])
+    return frozenset(fstypes)
+
+
+@functools.lru_cache(maxsize=4)
+def _disk_rows(names: Tuple[str, ...]) -> Tuple[int, ...]:
+    """
+    Get the rows of /proc/diskstats to report, in disk name order
+    
+    The set of disks rarely changes, so the order is only sorted again
+    when it does.
+    
+    Args:
+        names: Disk name of every row, in file order
+        
+    Returns:
+        Row numbers of the disks that aren't skipped, sorted by name
+    """
+    return tuple(sorted(
+        (row for row, name in enumerate(names) if not name.startswith(_SKIP_DISK_PREFIXES)),
+        key=names.__getitem__
+    ))
+
+
+def _parse_diskstats(text: str) -> Tuple[List[str], List[Tuple[int, ...]]]:
+    """
+    Parse the I/O counters of every disk out of /proc/diskstats
+    
+    Every line of the file has the same number of fields, so the whole file
+    is split once and each counter column is sliced out and converted in
+    bulk, rather than line by line.
+    
+    Args:
+        text: Contents of /proc/diskstats
+        
+    Returns:
+        Tuple of (sorted disk names, parallel list of
+        (read_count, write_count, read_bytes, write_bytes) tuples)
+    """
+    # "major minor name reads merged sectors ms writes merged sectors ..."
+    fields = text.split()
+    stride = len(text[:text.find('\n')].split())
+    
+    if stride < 10 or len(fields) != stride * text.count('\n'):
+        # Lines of differing lengths (old kernels list partitions with fewer
+        # counters), so parse them one by one
+        counters = {}
+        for line in text.splitlines():
+            line_fields = line.split()
+            if len(line_fields) < 10 or line_fields[2].startswith(_SKIP_DISK_PREFIXES):
+                continue
+            counters[line_fields[2]] = (
+                int(line_fields[3]),
+                int(line_fields[7]),
+                int(line_fields[5]) * _DISKSTATS_SECTOR_SIZE,
+                int(line_fields[9]) * _DISKSTATS_SECTOR_SIZE
+            )
+        disks = sorted(counters)
+        return disks, [counters[disk] for disk in disks]
+    
+    rows = _disk_rows(tuple(fields[2::stride]))
+    if not rows:
+        return [], []
+    
+    # itemgetter with a single index returns the item rather than a tuple
+    pick = operator.itemgetter(*rows) if len(rows) > 1 else lambda items: (items[rows[0]],)
+    
+    def column(offset: int) -> Tuple[str, ...]:
+        return pick(fields[offset::stride])
+    
+    sectors_to_bytes = _DISKSTATS_SECTOR_SIZE.__mul__
+    values = list(zip(
+        map(int, column(3)),
+        map(int, column(7)),
+        map(sectors_to_bytes, map(int, column(5))),
+        map(sectors_to_bytes, map(int, column(9)))
+    ))
+    return list(column(2)), values
+
+
+# Units for byte counts, each 1024 times the previous one
+_UNITS = ("B", "KB", "MB", "GB", "TB")
+_SCALES = tuple(1 << (10 * i) for i in range(len(_UNITS)))
+
+
+def _scale_bytes(bytes_value: float) -> str:
+    """
+    Scale bytes to the largest unit that keeps the value at or above 1
+    
+    Args:
+        bytes_value: Bytes to format
+        
+    Returns:
+        Formatted string (e.g., "4.2 GB")
+    """
+    # floor(log2(value)) // 10 picks the unit: bit_length for the integer
+    # sizes psutil reports, the float's binary exponent for rates
+    if bytes_value < 1024:
+        unit_index = 0
+    elif isinstance(bytes_value, int):
+        unit_index = min(len(_UNITS) - 1, (bytes_value.bit_length() - 1) // 10)
+    else:
+        unit_index = min(len(_UNITS) - 1, (math.frexp(bytes_value)[1] - 1) // 10)
+    
+    # Sizes are scaled in integer space, so the one rounding is in the final division
+    return f"{bytes_value / _SCALES[unit_index]:.1f} {_UNITS[unit_index]}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_bytes(bytes_value: int) -> str:
+    """
+    Format bytes to human-readable form
+    
+    Sizes are the same on every tick, so results are cached.
+    
+    Args:
+        bytes_value: Bytes to format
+        
+    Returns:
+        Formatted string (e.g., "4.2 GB")
+    """
+    return _scale_bytes(bytes_value)
+
+
+# Rate of an idle disk, the only rate that repeats from tick to tick
+_ZERO_RATE = "0.0 B/s"
+
+
+def _format_bytes_per_sec(bytes_value: float) -> str:
+    """
+    Format bytes/sec to human-readable form
+    
+    Busy disks report a new rate on every tick, so rates aren't cached.
+    
+    Args:
+        bytes_value: Bytes per second to format
+        
+    Returns:
+        Formatted string (e.g., "4.2 MB/s")
+    """
+    if bytes_value == 0:
+        return _ZERO_RATE
+    return f"{_scale_bytes(bytes_value)}/s"
+
 
 class DiskUsage:
     """Monitor and display disk usage information"""
@@ -42,45 +269,246 @@ class DiskUsage:
             ignore_mountpoints: Set of mountpoints to ignore
         """
         self.refresh_interval = refresh_interval
+        self.base_refresh_interval = refresh_interval
+        self._idle_updates = 0
         self.console = Console()
-        self._last_update = 0
-        self._last_io_counters = {}
-        self._io_rates = {}
+        self._last_update = float('-inf')  # time.monotonic() of the last update
+        self._last_io_disks = []   # sorted disk names of the previous sample
+        self._last_io_values = []  # _IO_FIELDS tuples, parallel to _last_io_disks
+        self._io_rate_disks = []   # disks with a computed rate, sorted by name
+        self._io_rates = {key: [] for key in _IO_RATE_KEYS}  # one column per rate, parallel to _io_rate_disks
+        self._diskstats_read_size = 65536
+        
+        # On Linux, /proc/diskstats is read directly through a persistent
+        # descriptor instead of going through psutil per sample
+        self._diskstats_fd = self._open_proc_file('/proc/diskstats')
         self.ignore_mountpoints = ignore_mountpoints or {'/proc', '/sys', '/run', '/dev', '/snap'}
+        self._partitions_cache = ()
+        self._partitions_cache_ts = float('-inf')
+        self._usage_cache = {}  # mountpoint -> (partition, usage), in mountpoint order
         self.update()
     
     def update(self) -> None:
-        """Update disk statistics"""
-        current_time = time.time()
+        """
+        Update disk statistics
+        
+        While the disks are idle, refresh_interval backs off from its base
+        value, and it drops straight back once there's activity again.
+        """
+        # Monotonic, so a wall clock adjustment can't produce a negative interval
+        current_time = time.monotonic()
         
         # Only update if refresh interval has elapsed
         if current_time - self._last_update >= self.refresh_interval:
             # Get disk I/O counters
-            current_io_counters = psutil.disk_io_counters(perdisk=True)
+            disks, values = self._read_io_counters()
             
             # Calculate I/O rates
-            if self._last_io_counters and (current_time - self._last_update > 0):
-                interval = current_time - self._last_update
-                
-                for disk in current_io_counters:
-                    if disk in self._last_io_counters:
-                        prev = self._last_io_counters[disk]
-                        curr = current_io_counters[disk]
-                        
-                        read_ops = (curr.read_count - prev.read_count) / interval
-                        write_ops = (curr.write_count - prev.write_count) / interval
-                        read_bytes = (curr.read_bytes - prev.read_bytes) / interval
-                        write_bytes = (curr.write_bytes - prev.write_bytes) / interval
-                        
-                        self._io_rates[disk] = {
-                            'read_ops': read_ops,
-                            'write_ops': write_ops,
-                            'read_bytes': read_bytes,
-                            'write_bytes': write_bytes
-                        }
+            if self._last_io_disks and (current_time - self._last_update > 0):
+                self._calculate_io_rates(disks, values, current_time - self._last_update)
             
-            self._last_io_counters = current_io_counters
+            self._last_io_disks = disks
+            self._last_io_values = values
             self._last_update = current_time
+            
+            # One statvfs per filesystem, shared by the summary and the table.
+            # Usage of a read-only mount can't change, so it's kept until the
+            # partition listing itself is refreshed.
+            previous_cache = self._usage_cache
+            usage_cache = {}
+            for part in self._get_partitions():
+                cached = previous_cache.get(part.mountpoint)
+                if cached is not None and cached[0] is part and 'ro' in part.opts.split(','):
+                    usage_cache[part.mountpoint] = cached
+                    continue
+                try:
+                    usage_cache[part.mountpoint] = (part, psutil.disk_usage(part.mountpoint))
+                except (PermissionError, FileNotFoundError):
+                    pass
+            self._adapt_refresh_interval(previous_cache, usage_cache)
+            self._usage_cache = usage_cache
+    
+    def _adapt_refresh_interval(self, previous_cache: Dict, usage_cache: Dict) -> None:
+        """
+        Back the refresh interval off while the disks are idle
+        
+        Args:
+            previous_cache: Usage per mountpoint from the previous update
+            usage_cache: Usage per mountpoint from this update
+        """
+        io_rates = self._io_rates
+        active = (
+            sum(io_rates['read_bytes']) + sum(io_rates['write_bytes']) >= IDLE_IO_THRESHOLD
+            or previous_cache.keys() != usage_cache.keys()
+            # A change that shows up in the table's one-decimal Use% column
+            or any(
+                round(usage.percent, 1) != round(previous_cache[mountpoint][1].percent, 1)
+                for mountpoint, (_, usage) in usage_cache.items()
+            )
+        )
+        
+        if active:
+            self._idle_updates = 0
+            self.refresh_interval = self.base_refresh_interval
+            return
+        
+        self._idle_updates += 1
+        if self._idle_updates >= IDLE_UPDATES_BEFORE_BACKOFF:
+            self.refresh_interval = min(
+                max(MAX_IDLE_REFRESH_INTERVAL, self.base_refresh_interval),
+                self.refresh_interval * 2
+            )
+    
+    def _open_proc_file(self, path: str) -> Optional[int]:
+        """
+        Open a /proc file for repeated reads
+        
+        Args:
+            path: Path of the file to open
+            
+        Returns:
+            File descriptor, or None if the file isn't available
+        """
+        try:
+            return os.open(path, os.O_RDONLY)
+        except (AttributeError, OSError):
+            return None
+    
+    def stop(self) -> None:
+        """Close the persistent /proc/diskstats descriptor"""
+        fd, self._diskstats_fd = self._diskstats_fd, None
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+    
+    def _read_io_counters(self) -> Tuple[List[str], List[Tuple[int, ...]]]:
+        """
+        Read the cumulative I/O counters of every disk
+        
+        Returns:
+            Tuple of (sorted disk names, parallel list of
+            (read_count, write_count, read_bytes, write_bytes) tuples)
+        """
+        if self._diskstats_fd is not None:
+            try:
+                data = os.pread(self._diskstats_fd, self._diskstats_read_size, 0)
+                # Grow the buffer until the whole file fits in one read
+                while len(data) == self._diskstats_read_size:
+                    self._diskstats_read_size *= 2
+                    data = os.pread(self._diskstats_fd, self._diskstats_read_size, 0)
+            except OSError:
+                # Later reads fall back to psutil
+                self.stop()
+            else:
+                return _parse_diskstats(data.decode())
+        
+        io_counters = psutil.disk_io_counters(perdisk=True) or {}
+        disks = sorted(disk for disk in io_counters if not disk.startswith(_SKIP_DISK_PREFIXES))
+        return disks, [_IO_FIELDS(io_counters[disk]) for disk in disks]
+    
+    def _calculate_io_rates(self, disks: List[str], values: List[Tuple[int, ...]], interval: float) -> None:
+        """
+        Convert two I/O counter samples into per-disk rate columns
+        
+        Args:
+            disks: Sorted disk names of the current sample
+            values: _IO_FIELDS tuples, parallel to disks
+            interval: Seconds elapsed since the previous sample
+        """
+        if disks == self._last_io_disks:
+            prev = self._last_io_values
+            curr = values
+        else:
+            # Disks were added or removed; keep only those present in both samples
+            index = {disk: i for i, disk in enumerate(self._last_io_disks)}
+            common = [i for i, disk in enumerate(disks) if disk in index]
+            prev = [self._last_io_values[index[disks[i]]] for i in common]
+            curr = [values[i] for i in common]
+            disks = [disks[i] for i in common]
+        
+        np = load_numpy() if len(disks) >= NUMPY_MIN_DISKS else None
+        
+        # A counter that went backwards (32-bit wraparound in /proc/diskstats,
+        # a device reset, or a reset Windows perf counter) reads as zero
+        # rather than a negative rate
+        if np is not None:
+            # Many disks: one subtraction over the whole counter matrix
+            delta = np.asarray(curr, dtype=np.int64) - np.asarray(prev, dtype=np.int64)
+            np.maximum(delta, 0, out=delta)
+            columns = (delta.T * (1.0 / interval)).tolist()
+        elif disks:
+            columns = [
+                [rate if rate > 0 else 0.0 for rate in column]
+                for column in zip(*(rates(p, c, interval) for p, c in zip(prev, curr)))
+            ]
+        else:
+            columns = [[] for _ in _IO_RATE_KEYS]
+        
+        self._io_rate_disks = disks
+        self._io_rates = dict(zip(_IO_RATE_KEYS, columns))
+    
+    def _get_partitions(self) -> Tuple:
+        """
+        Get the mounted partitions to report, sorted by mountpoint
+        
+        Mounts rarely change, so the filtered listing is reused for
+        PARTITIONS_TTL seconds.
+        
+        Returns:
+            Tuple of psutil partition entries, ignored mountpoints removed
+        """
+        now = time.monotonic()
+        if now - self._partitions_cache_ts >= PARTITIONS_TTL:
+            self._partitions_cache = tuple(sorted(
+                (part for part in self._read_partitions()
+                 if part.mountpoint not in self.ignore_mountpoints),
+                key=lambda part: part.mountpoint
+            ))
+            self._partitions_cache_ts = now
+        return self._partitions_cache
+    
+    def _read_partitions(self) -> List:
+        """
+        Read the mounted filesystems that are backed by a device
+        
+        On Linux, /proc/self/mountinfo is parsed directly, with the same
+        filtering as psutil.disk_partitions(all=False). Other platforms
+        go through psutil.
+        
+        Returns:
+            List of partition entries with device, mountpoint, fstype and opts
+        """
+        try:
+            with open('/proc/self/mountinfo', 'rb') as f:
+                data = f.read().decode(errors='surrogateescape')
+            fstypes = _physical_fstypes()
+        except OSError:
+            return psutil.disk_partitions(all=False)
+        
+        # "id parent major:minor root mountpoint opts [optional...] - fstype source superopts"
+        partitions = []
+        for line in data.splitlines():
+            fields = line.split()
+            try:
+                separator = fields.index('-', 6)
+                fstype, device = fields[separator + 1], fields[separator + 2]
+            except (ValueError, IndexError):
+                continue
+            if fstype not in fstypes or device in ('none', ''):
+                continue
+            mountpoint = fields[4]
+            if '\\' in mountpoint:
+                mountpoint = _MOUNTINFO_ESCAPE.sub(lambda m: chr(int(m.group(1), 8)), mountpoint)
+            # Per-mount options, followed by the superblock's own (as in /proc/mounts)
+            opts = fields[5]
+            if len(fields) > separator + 3:
+                extra = [opt for opt in fields[separator + 3].split(',') if opt not in ('rw', 'ro')]
+                if extra:
+                    opts += ',' + ','.join(extra)
+            partitions.append(_Partition(device, mountpoint, fstype, opts))
+        return partitions
     
     def _get_color_for_percentage(self, percent: float) -> str:
         """
@@ -92,14 +520,7 @@ class DiskUsage:
         Returns:
             Color string for rich
         """
-        if percent < WARN_THRESHOLD:
-            return "green"
-        elif percent < CRITICAL_THRESHOLD:
-            return "yellow"
-        elif percent < DANGER_THRESHOLD:
-            return "dark_orange"
-        else:
-            return "red"
+        return _COLOR_BUCKETS[bisect.bisect_right(_THRESHOLDS, percent)]
     
     def _format_bytes(self, bytes_value: int) -> str:
         """
@@ -111,28 +532,24 @@ class DiskUsage:
         Returns:
             Formatted string (e.g., "4.2 GB")
         """
-        units = ["B", "KB", "MB", "GB", "TB"]
-        unit_index = 0
-        value = float(bytes_value)
-        
-        while value >= 1024 and unit_index < len(units) - 1:
-            value /= 1024
-            unit_index += 1
-        
-        return f"{value:.1f} {units[unit_index]}"
+        return _format_bytes(bytes_value)
     
     def _format_bytes_per_sec(self, bytes_value: float) -> str:
         """Format bytes/sec to human-readable form"""
-        return f"{self._format_bytes(bytes_value)}/s"
+        return _format_bytes_per_sec(bytes_value)
     
-    def get_summary(self) -> Text:
+    def get_summary(self, refresh: bool = True) -> Text:
         """
         Get a summary of disk information
         
+        Args:
+            refresh: Whether to update the disk statistics first
+            
         Returns:
             Rich Text object with disk summary
         """
-        self.update()
+        if refresh:
+            self.update()
         
         text = Text()
         
@@ -140,16 +557,9 @@ class DiskUsage:
         total = 0
         used = 0
         
-        for part in psutil.disk_partitions(all=False):
-            if part.mountpoint in self.ignore_mountpoints:
-                continue
-                
-            try:
-                usage = psutil.disk_usage(part.mountpoint)
-                total += usage.total
-                used += usage.used
-            except (PermissionError, FileNotFoundError):
-                pass
+        for _, usage in self._usage_cache.values():
+            total += usage.total
+            used += usage.used
         
         if total > 0:
             overall_percent = (used / total) * 100
@@ -160,12 +570,8 @@ class DiskUsage:
             text.append(f"{overall_percent:.1f}%", style=f"bold {color}")
         
         # Add I/O summary
-        read_bytes_total = 0
-        write_bytes_total = 0
-        
-        for disk, rates in self._io_rates.items():
-            read_bytes_total += rates.get('read_bytes', 0)
-            write_bytes_total += rates.get('write_bytes', 0)
+        read_bytes_total = sum(self._io_rates['read_bytes'])
+        write_bytes_total = sum(self._io_rates['write_bytes'])
         
         if read_bytes_total > 0 or write_bytes_total > 0:
             text.append("\n")
@@ -174,14 +580,18 @@ class DiskUsage:
         
         return text
     
-    def get_filesystems_table(self) -> Table:
+    def get_filesystems_table(self, refresh: bool = True) -> Table:
         """
         Get a table of filesystem usage
         
+        Args:
+            refresh: Whether to update the disk statistics first
+            
         Returns:
             Rich Table object with filesystem usage
         """
-        self.update()
+        if refresh:
+            self.update()
         
         # Create table
         table = Table(
@@ -192,60 +602,47 @@ class DiskUsage:
         )
         
         # Add columns
-        table.add_column("Filesystem", style="cyan", no_wrap=True)
-        table.add_column("Type", style="bright_black", width=8)
-        table.add_column("Size", justify="right", width=10)
-        table.add_column("Used", justify="right", width=10)
-        table.add_column("Avail", justify="right", width=10)
-        table.add_column("Use%", justify="right", width=6)
-        table.add_column("Usage", ratio=1)
-        
-        # Get partition information
-        partitions = psutil.disk_partitions(all=False)
-        partitions.sort(key=lambda p: p.mountpoint)
-        
-        for part in partitions:
-            if part.mountpoint in self.ignore_mountpoints:
-                continue
+        for header, options in _FILESYSTEM_COLUMNS:
+            table.add_column(header, **options)
+        
+        # Add a row per filesystem
+        for part, usage in self._usage_cache.values():
+            percent = usage.percent
+            color = self._get_color_for_percentage(percent)
             
-            try:
-                usage = psutil.disk_usage(part.mountpoint)
-                percent = usage.percent
-                color = self._get_color_for_percentage(percent)
-                
-                # Create usage bar
-                bar_width = 30  # Fixed width for the bar
-                filled = int(percent / 100 * bar_width)
-                usage_bar = "█" * filled + "░" * (bar_width - filled)
-                
-                # Get filesystem type
-                fs_type = part.fstype
-                if len(fs_type) > 7:
-                    fs_type = fs_type[:7]
-                
-                # Add row
-                table.add_row(
-                    part.mountpoint,
-                    fs_type,
-                    self._format_bytes(usage.total),
-                    self._format_bytes(usage.used),
-                    self._format_bytes(usage.free),
-                    f"{percent:.1f}%",
-                    Text(usage_bar, style=color)
-                )
-            except (PermissionError, FileNotFoundError):
-                pass
+            # Look up the usage bar
+            usage_bar = _BARS[max(0, min(_BAR_WIDTH, int(percent * _BAR_WIDTH / 100)))]
+            
+            # Get filesystem type
+            fs_type = part.fstype
+            if len(fs_type) > 7:
+                fs_type = fs_type[:7]
+            
+            # Add row
+            table.add_row(
+                part.mountpoint,
+                fs_type,
+                self._format_bytes(usage.total),
+                self._format_bytes(usage.used),
+                self._format_bytes(usage.free),
+                f"{percent:.1f}%",
+                Text(usage_bar, style=color)
+            )
         
         return table
     
-    def get_io_table(self) -> Table:
+    def get_io_table(self, refresh: bool = True) -> Table:
         """
         Get a table of disk I/O statistics
         
+        Args:
+            refresh: Whether to update the disk statistics first
+            
         Returns:
             Rich Table object with disk I/O statistics
         """
-        self.update()
+        if refresh:
+            self.update()
         
         # Create table
         table = Table(
@@ -256,41 +653,43 @@ class DiskUsage:
         )
         
         # Add columns
-        table.add_column("Device", style="cyan")
-        table.add_column("Read", justify="right", style="green")
-        table.add_column("Write", justify="right", style="yellow")
-        table.add_column("Read ops/s", justify="right", style="green")
-        table.add_column("Write ops/s", justify="right", style="yellow")
+        for header, options in _IO_COLUMNS:
+            table.add_column(header, **options)
         
         # Add rows for each disk
-        for disk, rates in sorted(self._io_rates.items()):
+        io_rates = self._io_rates
+        for disk, read_ops, write_ops, read_bytes, write_bytes in zip(
+            self._io_rate_disks, *(io_rates[key] for key in _IO_RATE_KEYS)
+        ):
             table.add_row(
                 disk,
-                self._format_bytes_per_sec(rates.get('read_bytes', 0)),
-                self._format_bytes_per_sec(rates.get('write_bytes', 0)),
-                f"{rates.get('read_ops', 0):.1f}",
-                f"{rates.get('write_ops', 0):.1f}"
+                self._format_bytes_per_sec(read_bytes),
+                self._format_bytes_per_sec(write_bytes),
+                f"{read_ops:.1f}",
+                f"{write_ops:.1f}"
             )
         
         return table
     
-    def get_table(self) -> Table:
+    def get_table(self, refresh: bool = True) -> Group:
         """
         Get combined disk usage and I/O tables
         
+        Args:
+            refresh: Whether to update the disk statistics first
+            
         Returns:
-            Rich Table object
+            Rich Group stacking the filesystem and I/O tables
         """
-        # Create layout with filesystem and I/O tables
-        filesystems_table = self.get_filesystems_table()
-        io_table = self.get_io_table()
-        
-        # Create a table to hold both
-        main_table = Table.grid(expand=True, padding=(0, 1))
-        main_table.add_row(filesystems_table)
-        main_table.add_row(io_table)
-        
-        return main_table
+        if refresh:
+            self.update()
+        
+        # Stacked rather than nested in a grid, which would measure both
+        # tables once more just to lay out its single column
+        return Group(
+            self.get_filesystems_table(refresh=False),
+            self.get_io_table(refresh=False)
+        )
     
     def get_rich_panel(self) -> Panel:
         """
@@ -299,9 +698,10 @@ class DiskUsage:
         Returns:
             Rich Panel containing disk information
         """
-        # Create layout with summary and table
-        summary = self.get_summary()
-        table = self.get_table()
+        # Create layout with summary and table, updating only once
+        self.update()
+        summary = self.get_summary(refresh=False)
+        table = self.get_table(refresh=False)
         
         return Panel(
             table,
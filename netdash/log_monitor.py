@@ -12,8 +12,14 @@ Monitors system logs for security events:
 import os
 import re
 import time
+import functools
+import heapq
+import json
+import shutil
 import subprocess
-from typing import List, Dict, Optional, Tuple, Callable
+import sys
+from collections import deque
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple, Callable
 from pathlib import Path
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
@@ -36,7 +42,234 @@ logging.basicConfig(
 )
 logger = logging.getLogger("log_monitor")
 
-@dataclass
+# Timestamp formats recognized at the start of (or within) a log line
+_SYSLOG_TIMESTAMP = re.compile(r'^([A-Z][a-z]{2}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})')  # Jun 26 09:30:01
+_ISO_TIMESTAMP = re.compile(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})')  # 2023-06-26T09:30:01
+_SPACED_TIMESTAMP = re.compile(r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})')  # 2023-06-26 09:30:01
+
+# The same three in one pattern, so a line is scanned once for any of them
+_TIMESTAMP = re.compile(
+    r'^(?P<syslog>[A-Z][a-z]{2}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})'
+    r'|(?P<iso>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})'
+    r'|(?P<spaced>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})'
+)
+# Month abbreviations of syslog timestamps
+_MONTHS = {
+    name: number for number, name in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), 1
+    )
+}
+
+# Program name in front of the message, e.g. "sshd[1234]: "
+_SOURCE = re.compile(r'(\w+)(\[\d+\])?: ')
+
+# Whether journalctl is installed, looked up once rather than per query
+_HAS_JOURNALCTL = shutil.which("journalctl") is not None
+
+# Block size for reading a log file (backwards to find its last lines, then
+# forwards as it grows), and the most appended data read incrementally
+# before re-reading just the tail
+_TAIL_BLOCK_SIZE = 64 * 1024
+_TAIL_MAX_APPEND = 1024 * 1024
+
+# Only the start of longer lines is searched for timestamps, sources and
+# alerts, so a flood of huge lines can't make a refresh arbitrarily slow
+_MAX_SCAN_LENGTH = 2048
+
+# Log levels of journal entry priorities, from 0 (emerg) to 7 (debug)
+_JOURNAL_PRIORITY_LEVELS = ("ERROR",) * 4 + ("WARNING",) + ("INFO",) * 3
+
+# Events are kept by the hundred, so they get __slots__ where dataclasses
+# support it (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Alert patterns used unless the configuration overrides them
+_DEFAULT_ALERT_PATTERNS = {
+    "failed_login": r"authentication failure|failed password|invalid user|Failed password",
+    "sudo_usage": r"sudo:.*COMMAND=",
+    "ssh_login": r"sshd.*Accepted",
+    "authentication": r"PAM:.*authentication",
+    "suspicious_ip": r"(\b25[0-5]|\b2[0-4][0-9]|\b[01]?[0-9][0-9]?)(\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)){3}"
+}
+
+# Lowercase substrings a line must contain (any one of them) for the default
+# pattern of each alert type to possibly match
+_DEFAULT_ALERT_HINTS = {
+    "failed_login": ("authentication failure", "failed password", "invalid user"),
+    "sudo_usage": ("sudo:",),
+    "ssh_login": ("sshd",),
+    "authentication": ("pam:",),
+    "suspicious_ip": (".",),
+}
+
+@functools.lru_cache(maxsize=None)
+def _load_re2():
+    """
+    Import google-re2 on first use
+    
+    Returns:
+        The re2 module, or None if it isn't installed
+    """
+    try:
+        import re2
+    except ImportError:
+        return None
+    return re2
+
+
+@functools.lru_cache(maxsize=None)
+def _load_hyperscan():
+    """
+    Import hyperscan on first use
+    
+    Returns:
+        The hyperscan module, or None if it isn't installed
+    """
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+    return hyperscan
+
+
+def _to_datetime(kind: str, timestamp_str: str, year: int) -> datetime:
+    """
+    Convert a timestamp matched by one of the _TIMESTAMP groups
+    
+    The fields sit at fixed offsets (the time of day always ends the match),
+    so they are sliced out directly instead of going through strptime.
+    
+    Args:
+        kind: Name of the group that matched
+        timestamp_str: Matched text
+        year: Year to use for syslog timestamps, which omit it
+        
+    Returns:
+        Timestamp
+        
+    Raises:
+        ValueError: If the fields don't make a valid date and time
+    """
+    if kind == "syslog":
+        month, day = timestamp_str[:-8].split()
+        if month not in _MONTHS:
+            raise ValueError(f"unknown month: {month}")
+        date = (year, _MONTHS[month], int(day))
+    else:
+        date = (int(timestamp_str[0:4]), int(timestamp_str[5:7]), int(timestamp_str[8:10]))
+    return datetime(
+        *date,
+        int(timestamp_str[-8:-6]),
+        int(timestamp_str[-5:-3]),
+        int(timestamp_str[-2:])
+    )
+
+
+def _find_timestamp(line: str, year: int) -> Tuple[Optional[datetime], int]:
+    """
+    Find the timestamp of a log line
+    
+    A syslog timestamp at the start of the line is preferred, then an ISO
+    one anywhere in it, then a space-separated one.
+    
+    Args:
+        line: Raw log line
+        year: Year to use for syslog timestamps, which omit it
+        
+    Returns:
+        Tuple of (timestamp, or None if there is none, and the offset where
+        it ends)
+    """
+    match = _TIMESTAMP.search(line)
+    if match is None:
+        return None, 0
+    
+    # An ISO timestamp further on outranks the space-separated one found first
+    if not (match.lastgroup == "spaced" and _ISO_TIMESTAMP.search(line, match.start() + 1)):
+        try:
+            return _to_datetime(match.lastgroup, match.group(), year), match.end()
+        except ValueError:
+            pass
+    
+    # Otherwise try each format in turn, skipping those that don't parse
+    for kind, pattern in (("syslog", _SYSLOG_TIMESTAMP), ("iso", _ISO_TIMESTAMP), ("spaced", _SPACED_TIMESTAMP)):
+        match = pattern.search(line)
+        if match:
+            try:
+                return _to_datetime(kind, match.group(1), year), match.end()
+            except ValueError:
+                pass
+    return None, 0
+
+
+def _journal_field(entry: Dict, *names: str) -> str:
+    """
+    Get the first present field of a journal entry as text
+    
+    Args:
+        entry: Journal entry decoded from `journalctl -o json`
+        names: Field names, in order of preference
+        
+    Returns:
+        Field value, or "" if none of the fields is present
+    """
+    for name in names:
+        value = entry.get(name)
+        if isinstance(value, str):
+            return value
+        if isinstance(value, list):
+            # Fields that aren't valid UTF-8 are given as arrays of bytes
+            try:
+                return bytes(value).decode(errors="replace")
+            except (TypeError, ValueError):
+                continue
+    return ""
+
+
+def _journal_cursor(line: str) -> Optional[str]:
+    """
+    Get the cursor of a journal entry printed by `journalctl -o json`
+    
+    Args:
+        line: Journal entry as a JSON object
+        
+    Returns:
+        The entry's cursor, or None if the line isn't a journal entry
+    """
+    try:
+        cursor = json.loads(line).get("__CURSOR")
+    except (ValueError, AttributeError):
+        return None
+    return cursor if isinstance(cursor, str) else None
+
+
+def _message_style(message: str, level: str, alert: bool) -> str:
+    """
+    Choose the display style of a log message
+    
+    Args:
+        message: Log message
+        level: Log level
+        alert: Whether the message matched an alert pattern
+        
+    Returns:
+        Rich style name
+    """
+    if alert:
+        low = message.lower()
+        if "failed" in low or "invalid" in low:
+            return "bold red"
+        if "sudo" in low:
+            return "bold yellow"
+        return "bold magenta"
+    if level == "ERROR":
+        return "red"
+    if level == "WARNING":
+        return "yellow"
+    return "white"
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class LogEvent:
     """Class to store log event information"""
     timestamp: datetime
@@ -45,6 +278,15 @@ class LogEvent:
     level: str = "INFO"
     raw_line: str = ""
     alert: bool = False
+    style: str = ""  # Display style of the message, derived if not given
+    time_str: str = ""  # Displayed time of day, derived if not given
+    
+    def __post_init__(self):
+        """Derive the message's display style and time once, rather than per render"""
+        if not self.style:
+            self.style = _message_style(self.message, self.level, self.alert)
+        if not self.time_str and self.timestamp:
+            self.time_str = self.timestamp.strftime("%H:%M:%S")
     
 
 @dataclass
@@ -55,14 +297,7 @@ class LogMonitorConfig:
     fallback_log_file: str = ""
     max_lines: int = 100
     refresh_interval: float = 1.0
-    alert_patterns: Dict[str, str] = field(default_factory=lambda: {
-        "failed_login": r"authentication failure|failed password|invalid user|Failed password",
-        "sudo_usage": r"sudo:.*COMMAND=",
-        "ssh_login": r"sshd.*Accepted",
-        "authentication": r"PAM:.*authentication",
-        "suspicious_ip": r"(\b25[0-5]|\b2[0-4][0-9]|\b[01]?[0-9][0-9]?)(\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)){3}"
-    })
-
+    alert_patterns: Dict[str, str] = field(default_factory=lambda: dict(_DEFAULT_ALERT_PATTERNS))
 
 class LogMonitor:
     """Monitor and display system logs with alert detection"""
@@ -77,31 +312,55 @@ class LogMonitor:
         self.config = config or LogMonitorConfig()
         self.console = Console()
         self.events: List[LogEvent] = []
-        self._cmd_available_cache = {}  # Cache command availability
-        self._initialize_log_source()
+        self._file_signature = None  # Log file state at the last read
+        self._log_stat = None  # os.stat() of the log file taken by update()
+        self._parsed_lines: Dict[str, Optional[LogEvent]] = {}  # Events by raw line, last read
         
-        # If specified log file doesn't exist and we have a fallback, use it
-        if (not os.path.exists(self.config.log_file) and 
-            self.config.fallback_log_file and 
-            os.path.exists(self.config.fallback_log_file)):
-            self.config.log_file = self.config.fallback_log_file
+        # Incremental tail of the log file: the open file, its inode and the
+        # offset read up to, the last complete lines and any unterminated one
+        self._tail_file_obj = None
+        self._tail_inode = None
+        self._tail_offset = 0
+        self._tail_lines = deque(maxlen=0)
+        self._tail_partial = bytearray()
+        self._tail_buffer = bytearray(_TAIL_BLOCK_SIZE)  # Reused for every read
+        self._journal_proc = None  # journalctl --follow process, once started
+        
+        # Alert patterns compiled once, in priority order
+        self._alert_patterns = [
+            (alert_type, re.compile(pattern, re.IGNORECASE))
+            for alert_type, pattern in self.config.alert_patterns.items()
+        ]
+        
+        # Substring hints for the patterns left at their defaults (None for
+        # custom patterns, which always get the full regex scan)
+        self._alert_hints = [
+            _DEFAULT_ALERT_HINTS.get(alert_type)
+            if pattern == _DEFAULT_ALERT_PATTERNS.get(alert_type) else None
+            for alert_type, pattern in self.config.alert_patterns.items()
+        ]
+        
+        # With hyperscan or google-re2 installed, the default patterns are
+        # matched in a single pass instead
+        self._alert_set_match, self._alert_set_indices = self._compile_alert_set()
+        self._initialize_log_source()
             
     def _initialize_log_source(self) -> None:
         """Determine the best log source based on available system commands and files"""
-        # Check if the specified log file exists
-        if os.path.exists(self.config.log_file) and os.access(self.config.log_file, os.R_OK):
+        # Log files are checked by opening them, and kept open for the tailer
+        if self._try_open_tail(self.config.log_file):
             self.log_source = "file"
             logger.info(f"Using log file: {self.config.log_file}")
             return
             
         # Check if journalctl is available
-        if self._is_command_available("journalctl"):
+        if _HAS_JOURNALCTL:
             self.log_source = "journalctl"
             logger.info(f"Using journalctl with unit: {self.config.journal_unit}")
             return
             
         # Check if a fallback log file was specified
-        if self.config.fallback_log_file and os.path.exists(self.config.fallback_log_file):
+        if self._try_open_tail(self.config.fallback_log_file):
             self.log_source = "file"
             self.config.log_file = self.config.fallback_log_file
             logger.info(f"Using fallback log file: {self.config.log_file}")
@@ -111,33 +370,23 @@ class LogMonitor:
         self.log_source = "dummy"
         logger.warning("No log source available. Creating a dummy source.")
     
-    def _is_command_available(self, command: str) -> bool:
+    def _try_open_tail(self, path: str) -> bool:
         """
-        Check if a command is available in the system
+        Open a log file for the tailer, if it can be read
         
         Args:
-            command: Command name to check
+            path: Path of the log file, or "" for none
             
         Returns:
-            True if command exists, False otherwise
+            True if the file was opened, False otherwise
         """
-        if command in self._cmd_available_cache:
-            return self._cmd_available_cache[command]
-        
+        if not path:
+            return False
         try:
-            result = subprocess.run(
-                ["which", command],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=False
-            )
-            available = result.returncode == 0
-            self._cmd_available_cache[command] = available
-            return available
-        except Exception:
-            self._cmd_available_cache[command] = False
+            self._open_tail(path)
+        except OSError:
             return False
+        return True
     
     def _run_command(self, command: List[str]) -> Tuple[bool, str]:
         """
@@ -169,113 +418,405 @@ class LogMonitor:
         """
         Get the last N lines from a file
         
+        The file is kept open between calls and only the bytes appended since
+        the previous call are read. It is reopened when it's rotated (new
+        inode) or truncated, and re-read from its tail when it has grown by
+        more than _TAIL_MAX_APPEND bytes or more lines are asked for.
+        
         Args:
             num_lines: Number of lines to retrieve
             
         Returns:
             List of lines from the file
         """
-        if not os.path.exists(self.config.log_file):
-            return []
-            
         try:
-            if self._is_command_available("tail"):
-                # Use the tail command if available
-                success, output = self._run_command(["tail", "-n", str(num_lines), self.config.log_file])
-                if success:
-                    return output.splitlines()
+            # Reuse the stat update() has just taken, saving a syscall
+            stat, self._log_stat = self._log_stat, None
+            if stat is None:
+                stat = os.stat(self.config.log_file)
             
-            # Fallback to reading the file with Python
-            with open(self.config.log_file, 'r') as f:
-                return f.readlines()[-num_lines:]
-                
-        except Exception as e:
-            logger.error(f"Error tailing file: {str(e)}")
+            if (self._tail_file_obj is None
+                    or stat.st_ino != self._tail_inode
+                    or stat.st_size < self._tail_offset):
+                self._open_tail(self.config.log_file)
+                self._read_tail(num_lines)
+            elif (stat.st_size - self._tail_offset > _TAIL_MAX_APPEND
+                    or num_lines > self._tail_lines.maxlen):
+                self._read_tail(num_lines)
+            else:
+                self._read_appended(stat.st_size)
+        except OSError as e:
+            if not isinstance(e, FileNotFoundError):
+                logger.error(f"Error tailing file: {str(e)}")
+            self._close_tail()
             return []
+        
+        lines = list(self._tail_lines)
+        if self._tail_partial:
+            lines.append(self._tail_partial.decode(errors="replace"))
+        return lines[-num_lines:] if num_lines > 0 else []
+    
+    def _open_tail(self, path: str) -> None:
+        """
+        Open a log file for tailing, in place of any file open before
+        
+        Args:
+            path: Path of the log file
+            
+        Raises:
+            OSError: If the file can't be opened
+        """
+        self._close_tail()
+        # Unbuffered, so reads go straight into the caller's buffer
+        file_obj = open(path, 'rb', buffering=0)
+        try:
+            self._tail_inode = os.fstat(file_obj.fileno()).st_ino
+        except OSError:
+            file_obj.close()
+            raise
+        self._tail_file_obj = file_obj
+    
+    def _read_tail(self, num_lines: int) -> None:
+        """
+        Read the last lines of the open log file
+        
+        Args:
+            num_lines: Number of lines to keep
+        """
+        file_obj = self._tail_file_obj
+        size = os.fstat(file_obj.fileno()).st_size
+        
+        # Read whole blocks backwards until they hold enough lines
+        start = size
+        data = b""
+        while start > 0 and data.count(b"\n") <= num_lines:
+            block_start = max(0, start - _TAIL_BLOCK_SIZE)
+            file_obj.seek(block_start)
+            data = file_obj.read(start - block_start) + data
+            start = block_start
+        
+        # Unless at the start of the file, the first line is cut off
+        if start > 0:
+            data = data[data.find(b"\n") + 1:]
+        file_obj.seek(size)
+        
+        self._tail_offset = size
+        self._tail_lines = deque(maxlen=num_lines)
+        self._tail_partial = bytearray()
+        self._append_tail(data)
+    
+    def _read_appended(self, size: int) -> None:
+        """
+        Read the data appended to the log file since the previous read
+        
+        Args:
+            size: Current size of the file
+        """
+        view = memoryview(self._tail_buffer)
+        while self._tail_offset < size:
+            count = self._tail_file_obj.readinto(view[:size - self._tail_offset])
+            if not count:
+                break
+            self._tail_offset += count
+            self._append_tail(view[:count])
+    
+    def _append_tail(self, data) -> None:
+        """
+        Add newly read bytes to the tailed lines
+        
+        Args:
+            data: Bytes-like object read from the end of the file
+        """
+        partial = self._tail_partial
+        partial += data
+        end = partial.rfind(b"\n") + 1
+        if end:
+            self._tail_lines.extend(partial[:end].decode(errors="replace").splitlines())
+            del partial[:end]
+    
+    def _close_tail(self) -> None:
+        """Close the tailed log file"""
+        if self._tail_file_obj is not None:
+            try:
+                self._tail_file_obj.close()
+            except OSError:
+                pass
+        self._tail_file_obj = None
+        self._tail_inode = None
+        self._tail_offset = 0
+        self._tail_lines = deque(maxlen=0)
+        self._tail_partial = bytearray()
     
     def _get_journalctl_logs(self, num_lines: int = 10) -> List[str]:
         """
         Get logs from journalctl
         
+        The last entries are read once, after which a `journalctl --follow`
+        process picks up from the last entry read, and each call only drains
+        the entries it has written since. Entries are read as JSON, which
+        _parse_journal_entry() turns into events.
+        
         Args:
             num_lines: Number of lines to retrieve
             
         Returns:
-            List of lines from journalctl
+            List of journal entries, one JSON object per line
         """
-        if not self._is_command_available("journalctl"):
+        if not _HAS_JOURNALCTL:
             return []
+        
+        if self._journal_proc is None or num_lines > self._tail_lines.maxlen:
+            if not self._start_journal_follower(num_lines):
+                return []
+        else:
+            self._drain_journal_follower()
+        
+        lines = list(self._tail_lines)
+        return lines[-num_lines:] if num_lines > 0 else []
+    
+    def _start_journal_follower(self, num_lines: int) -> bool:
+        """
+        Read the last journal lines and follow the journal from there
+        
+        Args:
+            num_lines: Number of lines to keep
             
-        command = ["journalctl", "-n", str(num_lines), "--no-pager"]
+        Returns:
+            True if the last lines were read, False otherwise
+        """
+        self._stop_journal_follower()
+        unit = ["-u", self.config.journal_unit] if self.config.journal_unit else []
         
-        # Add unit filter if specified
-        if self.config.journal_unit:
-            command.extend(["-u", self.config.journal_unit])
+        success, output = self._run_command(
+            ["journalctl", "-n", str(num_lines), "--no-pager", "-o", "json"] + unit
+        )
+        if not success:
+            logger.error(f"Error getting journalctl logs: {output}")
+            return False
+        
+        # Follow from the cursor of the last entry read, so none is missed or
+        # repeated in between (there is no cursor if there were no entries)
+        lines = output.splitlines()
+        follow = ["journalctl", "--follow", "--no-pager", "-o", "json"] + unit
+        cursor = _journal_cursor(lines[-1]) if lines else None
+        if cursor:
+            follow.append("--after-cursor=" + cursor)
+        else:
+            follow.extend(["-n", "0"])
+        self._tail_lines = deque(lines, maxlen=num_lines)
+        self._tail_partial = bytearray()
+        
+        try:
+            self._journal_proc = subprocess.Popen(
+                follow,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0
+            )
+            os.set_blocking(self._journal_proc.stdout.fileno(), False)
+        except OSError as e:
+            # The lines are read afresh next time instead
+            logger.error(f"Error following journalctl: {str(e)}")
+            self._stop_journal_follower()
+        return True
+    
+    def _drain_journal_follower(self) -> None:
+        """Read whatever the journalctl follower has written without blocking"""
+        stdout = self._journal_proc.stdout
+        view = memoryview(self._tail_buffer)
+        while True:
+            try:
+                count = stdout.readinto(view)
+            except OSError as e:
+                logger.error(f"Error reading journalctl output: {str(e)}")
+                count = 0
+            if count is None:
+                return  # Nothing more written yet
+            if not count:
+                # The follower exited, so start over on the next call
+                self._stop_journal_follower()
+                return
+            self._append_tail(view[:count])
+    
+    def _stop_journal_follower(self) -> None:
+        """Terminate the journalctl follower process, if any"""
+        proc, self._journal_proc = self._journal_proc, None
+        if proc is None:
+            return
+        if proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+        if proc.stdout is not None:
+            proc.stdout.close()
+    
+    def stop(self) -> None:
+        """Release the tailed log file and any journalctl follower process"""
+        self._stop_journal_follower()
+        self._close_tail()
+    
+    def _compile_alert_set(self) -> Tuple[Optional[Callable[[bytes], Iterable[int]]], List[int]]:
+        """
+        Compile the alert patterns left at their defaults into one multi-pattern matcher
+        
+        Hyperscan is preferred, then RE2. Custom patterns stay with re, as
+        both reject some of its syntax and differ on details such as "$"
+        before a trailing newline.
+        
+        Returns:
+            Tuple of (function giving the positions in the set of the
+            patterns matching an encoded line, or None if neither engine is
+            installed, and the index in _alert_patterns of each pattern in
+            the set)
+        """
+        indices = [i for i, hints in enumerate(self._alert_hints) if hints is not None]
+        if not indices:
+            return None, []
+        
+        patterns = [self._alert_patterns[i][1].pattern for i in indices]
+        match = self._compile_hyperscan_set(patterns) or self._compile_re2_set(patterns)
+        if match is None:
+            return None, []
+        return match, indices
+    
+    def _compile_hyperscan_set(self, patterns: List[str]) -> Optional[Callable[[bytes], Iterable[int]]]:
+        """
+        Compile patterns into a Hyperscan database
+        
+        Args:
+            patterns: Regular expressions, matched case-insensitively
+            
+        Returns:
+            Function giving the positions of the patterns matching an encoded
+            line, or None if hyperscan isn't installed or can't compile them
+        """
+        hyperscan = _load_hyperscan()
+        if hyperscan is None:
+            return None
+        
+        database = hyperscan.Database()
+        try:
+            database.compile(
+                expressions=[pattern.encode() for pattern in patterns],
+                ids=list(range(len(patterns))),
+                elements=len(patterns),
+                # Report each pattern once, at its first match
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns)
+            )
+        except hyperscan.error as e:
+            logger.debug(f"Not using hyperscan for alert patterns: {e}")
+            return None
+        
+        def match(data: bytes) -> List[int]:
+            matched = []
+            database.scan(data, match_event_handler=lambda id_, start, end, flags, context: matched.append(id_))
+            return matched
+        
+        return match
+    
+    def _compile_re2_set(self, patterns: List[str]) -> Optional[Callable[[bytes], Iterable[int]]]:
+        """
+        Compile patterns into an RE2 set
+        
+        Args:
+            patterns: Regular expressions, matched case-insensitively
             
-        success, output = self._run_command(command)
-        if success:
-            return output.splitlines()
+        Returns:
+            Function giving the positions of the patterns matching an encoded
+            line, or None if re2 isn't installed or can't compile them
+        """
+        re2 = _load_re2()
+        if re2 is None:
+            return None
+        
+        options = re2.Options()
+        options.case_sensitive = False
+        alert_set = re2.Set.SearchSet(options)
+        try:
+            for pattern in patterns:
+                alert_set.Add(pattern)
+            alert_set.Compile()
+        except re2.error as e:
+            logger.debug(f"Not using re2 for alert patterns: {e}")
+            return None
+        
+        return lambda data: alert_set.Match(data) or ()
+    
+    def _match_alert_types(self, line: str) -> Iterator[str]:
+        """
+        Find the alert types whose pattern matches a line
+        
+        Only the first _MAX_SCAN_LENGTH characters of the line are searched.
+        
+        Args:
+            line: Raw log line
+            
+        Yields:
+            Matching alert types, in configuration order
+        """
+        line = line[:_MAX_SCAN_LENGTH]
+        
+        # The pattern set and the substring hints are only trusted for ASCII
+        # lines: \b is ASCII-only in RE2 and Hyperscan, and IGNORECASE folds
+        # some non-ASCII characters (e.g. "İ" to "i") that str.lower() doesn't
+        if line.isascii() and self._alert_set_match is not None:
+            matched = {
+                self._alert_set_indices[i]
+                for i in self._alert_set_match(line.encode())
+            }
+            for i, (alert_type, pattern) in enumerate(self._alert_patterns):
+                if i in matched or (self._alert_hints[i] is None and pattern.search(line)):
+                    yield alert_type
+            return
+        
+        # Substring hints rule most patterns out without a regex scan
+        if line.isascii():
+            low = line.lower()
+            candidates = [
+                entry for entry, hints in zip(self._alert_patterns, self._alert_hints)
+                if hints is None or any(hint in low for hint in hints)
+            ]
         else:
-            logger.error(f"Error getting journalctl logs: {output}")
-            return []
+            candidates = self._alert_patterns
+        
+        for alert_type, pattern in candidates:
+            if pattern.search(line):
+                yield alert_type
     
-    def _parse_log_line(self, line: str) -> Optional[LogEvent]:
+    def _parse_log_line(self, line: str, now: Optional[datetime] = None) -> Optional[LogEvent]:
         """
         Parse a log line into a LogEvent
         
         Args:
             line: Log line to parse
+            now: Time of the read, for the year of syslog timestamps and
+                 lines without one (default: the current time)
             
         Returns:
             LogEvent object or None if the line couldn't be parsed
         """
+        # NUL bytes, e.g. from a log file zero-filled after a crash, are junk
+        if "\x00" in line:
+            line = line.replace("\x00", "")
         if not line or len(line) < 10:
             return None
+        if now is None:
+            now = datetime.now()
             
         try:
-            # Try to extract timestamp with different patterns
-            timestamp = None
-            message = line
             source = "system"
             
-            # Pattern 1: Standard syslog format (Jun 26 09:30:01)
-            match = re.search(r'^([A-Z][a-z]{2}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})', line)
-            if match:
-                try:
-                    timestamp_str = match.group(1)
-                    timestamp = datetime.strptime(f"{datetime.now().year} {timestamp_str}", "%Y %b %d %H:%M:%S")
-                    message = line[match.end():].strip()
-                except ValueError:
-                    pass
-            
-            # Pattern 2: ISO format timestamp (2023-06-26T09:30:01)
-            if not timestamp:
-                match = re.search(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})', line)
-                if match:
-                    try:
-                        timestamp_str = match.group(1)
-                        timestamp = datetime.strptime(timestamp_str, "%Y-%m-%dT%H:%M:%S")
-                        message = line[match.end():].strip()
-                    except ValueError:
-                        pass
-            
-            # Pattern 3: Another common format (2023-06-26 09:30:01)
-            if not timestamp:
-                match = re.search(r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})', line)
-                if match:
-                    try:
-                        timestamp_str = match.group(1)
-                        timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
-                        message = line[match.end():].strip()
-                    except ValueError:
-                        pass
-            
-            # If we couldn't extract a timestamp, use current time
+            # Extract the timestamp, using the current time if there is none
+            timestamp, end = _find_timestamp(line[:_MAX_SCAN_LENGTH], now.year)
+            message = line[end:].strip() if timestamp else line
             if not timestamp:
-                timestamp = datetime.now()
+                timestamp = now
             
             # Try to extract the source
-            source_match = re.search(r'(\w+)(\[\d+\])?: ', message)
+            source_match = _SOURCE.search(message, 0, _MAX_SCAN_LENGTH)
             if source_match:
                 source = source_match.group(1)
                 
@@ -283,11 +824,11 @@ class LogMonitor:
             alert = False
             level = "INFO"
             
-            for alert_type, pattern in self.config.alert_patterns.items():
-                if re.search(pattern, line, re.IGNORECASE):
-                    alert = True
-                    level = "WARNING" if "sudo" in alert_type else "ERROR"
-                    break
+            # The first matching type, in configuration order, sets the level
+            alert_type = next(self._match_alert_types(line), None)
+            if alert_type is not None:
+                alert = True
+                level = "WARNING" if "sudo" in alert_type else "ERROR"
             
             return LogEvent(
                 timestamp=timestamp,
@@ -301,7 +842,7 @@ class LogMonitor:
         except Exception as e:
             logger.error(f"Error parsing log line: {str(e)}")
             return LogEvent(
-                timestamp=datetime.now(),
+                timestamp=now,
                 source="parser",
                 message=f"Error parsing log: {line[:50]}...",
                 level="ERROR",
@@ -309,6 +850,55 @@ class LogMonitor:
                 alert=False
             )
     
+    def _parse_journal_entry(self, line: str, now: Optional[datetime] = None) -> Optional[LogEvent]:
+        """
+        Parse a journal entry, as printed by `journalctl -o json`, into a LogEvent
+        
+        The timestamp, source and priority are read from the entry's fields
+        instead of being recovered from formatted text. Alerts are matched
+        against the entry laid out as in journalctl's default output.
+        
+        Args:
+            line: Journal entry as a JSON object
+            now: Time of the read, as for _parse_log_line
+            
+        Returns:
+            LogEvent object, or as for _parse_log_line if the line isn't a
+            journal entry
+        """
+        try:
+            entry = json.loads(line)
+            timestamp = datetime.fromtimestamp(int(entry["__REALTIME_TIMESTAMP"]) / 1e6)
+        except (ValueError, TypeError, KeyError, OverflowError, OSError):
+            return self._parse_log_line(line, now)
+        
+        source = _journal_field(entry, "SYSLOG_IDENTIFIER", "_COMM") or "system"
+        pid = _journal_field(entry, "SYSLOG_PID", "_PID")
+        message = (
+            f"{_journal_field(entry, '_HOSTNAME')} {source}{f'[{pid}]' if pid else ''}: "
+            f"{_journal_field(entry, 'MESSAGE')}"
+        )
+        raw_line = f"{timestamp.strftime('%b %d %H:%M:%S')} {message}"
+        
+        try:
+            level = _JOURNAL_PRIORITY_LEVELS[int(_journal_field(entry, "PRIORITY"))]
+        except (ValueError, IndexError):
+            level = "INFO"
+        
+        # An alert sets the level, as for plain log lines
+        alert_type = next(self._match_alert_types(raw_line), None)
+        if alert_type is not None:
+            level = "WARNING" if "sudo" in alert_type else "ERROR"
+        
+        return LogEvent(
+            timestamp=timestamp,
+            source=source,
+            message=message,
+            level=level,
+            raw_line=raw_line,
+            alert=alert_type is not None
+        )
+    
     def get_recent_logs(self, num_lines: int = None) -> List[LogEvent]:
         """
         Get recent log events
@@ -338,18 +928,49 @@ class LogMonitor:
                 else:
                     raw_lines.append(f"{fake_time.strftime('%b %d %H:%M:%S')} sshd[123]: Failed password for invalid user from 192.168.1.101")
         
-        # Parse log lines into events
-        events = []
-        for line in raw_lines:
-            event = self._parse_log_line(line)
-            if event:
-                events.append(event)
+        # Parse log lines into events, reusing those of lines already read
+        # on the previous call so only new lines are parsed
+        now = datetime.now()
+        previous = self._parsed_lines
+        parse = self._parse_journal_entry if self.log_source == "journalctl" else self._parse_log_line
+        parsed = {line: previous.get(line) or parse(line, now) for line in dict.fromkeys(raw_lines)}
+        self._parsed_lines = parsed
         
-        return events
+        return [event for event in map(parsed.__getitem__, raw_lines) if event]
+    
+    def _stat_log_file(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Get a cheap signature of the log file's current state
+        
+        Returns:
+            Tuple of (inode, size, mtime in ns), or None if it can't be stat'ed
+        """
+        try:
+            stat = os.stat(self.config.log_file)
+        except OSError:
+            return None
+        self._log_stat = stat  # For the tailer, if the file is read next
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
     
-    def update(self) -> None:
-        """Update the log events"""
+    def update(self) -> bool:
+        """
+        Update the log events
+        
+        A log file that hasn't changed since the last update, going by its
+        inode, size and mtime, is not re-read.
+        
+        Returns:
+            True if the events were refreshed, False if the log file was unchanged
+        """
+        if self.log_source == "file":
+            signature = self._stat_log_file()
+            if signature is not None and signature == self._file_signature:
+                self._log_stat = None
+                return False
+            self._file_signature = signature
+        
         self.events = self.get_recent_logs()
+        return True
     
     def get_alert_count(self) -> Dict[str, int]:
         """
@@ -370,9 +991,8 @@ class LogMonitor:
             if not event.alert:
                 continue
                 
-            for alert_type, pattern in self.config.alert_patterns.items():
-                if re.search(pattern, event.raw_line, re.IGNORECASE):
-                    counts[alert_type] += 1
+            for alert_type in self._match_alert_types(event.raw_line):
+                counts[alert_type] += 1
         
         return counts
     
@@ -389,38 +1009,25 @@ class LogMonitor:
         if max_events is None:
             max_events = self.config.max_lines
             
-        # Show events from newest to oldest
-        sorted_events = sorted(
-            self.events, 
-            key=lambda e: e.timestamp if e.timestamp else datetime.now(),
-            reverse=True
-        )[:max_events]
+        # Show the newest events first, selecting them without sorting all
+        # (ties keep their log order, as with a stable sort)
+        sorted_events = heapq.nlargest(
+            max_events,
+            self.events,
+            key=lambda e: e.timestamp if e.timestamp else datetime.now()
+        )
         
         # Format events
         text = Text()
         for event in sorted_events:
-            time_str = event.timestamp.strftime("%H:%M:%S")
-            
             # Add timestamp
-            text.append(f"[{time_str}] ", "bright_black")
+            text.append(f"[{event.time_str}] ", "bright_black")
             
             # Add source
             text.append(f"{event.source}: ", "blue")
             
-            # Add message with appropriate color based on content and level
-            if event.alert:
-                if "failed" in event.message.lower() or "invalid" in event.message.lower():
-                    text.append(f"{event.message}\n", "bold red")
-                elif "sudo" in event.message.lower():
-                    text.append(f"{event.message}\n", "bold yellow")
-                else:
-                    text.append(f"{event.message}\n", "bold magenta")
-            elif event.level == "ERROR":
-                text.append(f"{event.message}\n", "red")
-            elif event.level == "WARNING":
-                text.append(f"{event.message}\n", "yellow")
-            else:
-                text.append(f"{event.message}\n", "white")
+            # Add message in the style derived when it was parsed
+            text.append(f"{event.message}\n", event.style)
                 
         return text
     
@@ -461,22 +1068,26 @@ class LogMonitor:
                      If None, will run until Ctrl+C
         """
         start_time = time.time()
+        loop = asyncio.get_running_loop()
         
         try:
-            with Live(self.get_panel(), refresh_per_second=1/self.config.refresh_interval) as live:
+            # Redrawn only when the events change, instead of on a timer
+            with Live(self.get_panel(), auto_refresh=False) as live:
                 while True:
                     # Check if duration has elapsed
                     if duration and (time.time() - start_time) > duration:
                         break
                         
-                    # Update logs and panel
-                    self.update()
-                    live.update(self.get_panel())
+                    # Update logs off the event loop, then the panel if they changed
+                    if await loop.run_in_executor(None, self.update):
+                        live.update(self.get_panel(), refresh=True)
                     
                     # Wait for next refresh
                     await asyncio.sleep(self.config.refresh_interval)
         except KeyboardInterrupt:
             self.console.print("[yellow]Monitoring stopped by user[/yellow]")
+        finally:
+            self.stop()
 
 
 def main(custom_log_file: str = None) -> None:
@@ -507,8 +1118,7 @@ def main(custom_log_file: str = None) -> None:
         monitor = LogMonitor(config)
         
         # Run the live display asynchronously
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(monitor.display_live())
+        asyncio.run(monitor.display_live())
     except PermissionError:
         console.print("[bold red]Error: Insufficient permissions to access log files[/bold red]")
         console.print("Try running with sudo privileges")
@@ -9,8 +9,12 @@ Displays information about current logins and recent login history:
 
 import os
 import pwd
+import re
+import time
+import shutil
+import functools
 import subprocess
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
@@ -19,6 +23,93 @@ from rich.table import Table
 from rich.panel import Panel
 from rich import box
 
+# Seconds the parsed output of 'who' and 'last' is reused before running
+# them again (logins change far more slowly than the dashboard refreshes)
+ACTIVE_LOGINS_TTL = 2.0
+LOGIN_HISTORY_TTL = 30.0
+
+
+# Lines of 'who' output: user, tty, login time (as "2023-06-26 09:30" or,
+# in some locales, "Jun 26 09:30") and, for remote logins, "(host)"
+_WHO_ISO = re.compile(
+    r'\s*(\S+)\s+(\S+)\s+(\d{4})-(\d{2})-(\d{2})\s+(\d{2}):(\d{2})(?::(\d{2}))?(?:.*\(([^)]*)\))?'
+)
+_WHO_MONTH = re.compile(
+    r'\s*(\S+)\s+(\S+)\s+([A-Z][a-z]{2})\s+(\d{1,2})\s+(\d{2}):(\d{2})(?:.*\(([^)]*)\))?'
+)
+_MONTHS = {
+    name: number for number, name in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), 1
+    )
+}
+
+# Lines of 'last' output that aren't user logins
+_LAST_SKIPPED_PREFIXES = ("wtmp begins", "btmp begins", "reboot ", "shutdown ")
+
+_WEEKDAYS = frozenset(("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"))
+
+
+def _parse_last_time(fields: List[str], year: int) -> Optional[datetime]:
+    """
+    Parse a time printed by 'last', like "Mon Jun 26 09:30" or, with
+    --fulltimes, "Mon Jun 26 09:30:00 2023"
+    
+    Args:
+        fields: Whitespace-separated fields starting with the time's
+        year: Year to assume if the time doesn't include one
+        
+    Returns:
+        Parsed time, or None if the fields don't start with one
+    """
+    try:
+        weekday, month, day, clock = fields[:4]
+        if weekday not in _WEEKDAYS:
+            return None
+        if len(fields) > 4 and len(fields[4]) == 4 and fields[4].isdigit():
+            year = int(fields[4])
+        hms = clock.split(":")
+        if len(hms) not in (2, 3):
+            return None
+        return datetime(year, _MONTHS[month], int(day), *map(int, hms))
+    except (KeyError, ValueError):
+        return None
+
+
+# Shells that don't allow logging in, by basename
+_NOLOGIN_SHELLS = frozenset(("nologin", "false", "sync"))
+
+
+@functools.lru_cache(maxsize=1)
+def _shell_users() -> Tuple[str, ...]:
+    """
+    List the users with a login shell, once
+    
+    The user database rarely changes, and enumerating it can be slow when
+    it is backed by LDAP or NIS.
+    
+    Returns:
+        Tuple of usernames
+    """
+    return tuple(
+        user_info.pw_name for user_info in pwd.getpwall()
+        if user_info.pw_shell and user_info.pw_shell.rsplit("/", 1)[-1] not in _NOLOGIN_SHELLS
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _cmd_exists(command: str) -> bool:
+    """
+    Check if a command is on the PATH, once per command
+    
+    Args:
+        command: Command name to check
+        
+    Returns:
+        True if command exists, False otherwise
+    """
+    return shutil.which(command) is not None
+
+
 @dataclass
 class UserLogin:
     """Class to store user login information"""
@@ -36,7 +127,12 @@ class LoginTracker:
     def __init__(self):
         """Initialize the login tracker"""
         self.console = Console()
-        self._cmd_available_cache = {}  # Cache command availability
+        self.clear_cache()
+    
+    def clear_cache(self) -> None:
+        """Forget cached logins, so the next calls read them afresh"""
+        self._active_cache: Tuple[float, List[UserLogin]] = (float('-inf'), [])
+        self._history_cache: Dict[int, Tuple[float, List[UserLogin]]] = {}  # By max_entries
     
     def _is_command_available(self, command: str) -> bool:
         """
@@ -48,23 +144,7 @@ class LoginTracker:
         Returns:
             True if command exists, False otherwise
         """
-        if command in self._cmd_available_cache:
-            return self._cmd_available_cache[command]
-        
-        try:
-            result = subprocess.run(
-                ["which", command],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=False
-            )
-            available = result.returncode == 0
-            self._cmd_available_cache[command] = available
-            return available
-        except Exception:
-            self._cmd_available_cache[command] = False
-            return False
+        return _cmd_exists(command)
     
     def _run_command(self, command: List[str]) -> Tuple[bool, str]:
         """
@@ -103,40 +183,36 @@ class LoginTracker:
             List of UserLogin objects
         """
         logins = []
+        year = datetime.now().year
         
-        for line in output.strip().split('\n'):
-            if not line.strip():
-                continue
-                
-            parts = line.split()
-            if len(parts) < 5:
-                continue
-                
-            username = parts[0]
-            tty = parts[1]
-            
-            # Try to parse the date and time
-            date_str = ' '.join(parts[2:5])
+        for line in output.splitlines():
             login_time = None
-            try:
-                # Format like: 2023-06-26 09:30:00
-                login_time = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-            except ValueError:
+            match = _WHO_ISO.match(line)
+            if match:
+                username, tty, y, mo, d, h, mi, sec, host = match.groups()
                 try:
-                    # Format like: Jun 26 09:30
-                    login_time = datetime.strptime(f"{datetime.now().year} {date_str}", "%Y %b %d %H:%M")
+                    login_time = datetime(int(y), int(mo), int(d), int(h), int(mi), int(sec or 0))
                 except ValueError:
                     pass
-            
-            # Extract the host/IP if available
-            host = ""
-            if len(parts) >= 6 and '(' in parts[5] and ')' in parts[5]:
-                host = parts[5].strip('()')
+            else:
+                match = _WHO_MONTH.match(line)
+                if match:
+                    username, tty, mon, d, h, mi, host = match.groups()
+                    try:
+                        login_time = datetime(year, _MONTHS[mon], int(d), int(h), int(mi))
+                    except (KeyError, ValueError):
+                        pass
+                else:
+                    # Unknown time format: keep the user, without a login time
+                    parts = line.split()
+                    if len(parts) < 5:
+                        continue
+                    username, tty, host = parts[0], parts[1], None
             
             logins.append(UserLogin(
                 username=username,
                 tty=tty,
-                host=host,
+                host=host or "",
                 login_time=login_time,
                 is_active=True
             ))
@@ -155,9 +231,12 @@ class LoginTracker:
             List of UserLogin objects
         """
         logins = []
+        year = datetime.now().year
         
         for line in output.strip().split('\n')[:max_entries]:
-            if not line.strip() or "wtmp begins" in line:
+            # Skip lines without a time (blank ones) and the footer and
+            # reboot/shutdown pseudo-entries before splitting anything
+            if ':' not in line or line.lstrip().startswith(_LAST_SKIPPED_PREFIXES):
                 continue
                 
             parts = line.split()
@@ -167,19 +246,14 @@ class LoginTracker:
             username = parts[0]
             tty = parts[1]
             
-            # Extract host if available
+            # Extract host if available (local logins go straight on to the time)
             host = ""
-            if len(parts) >= 3 and parts[2] != ":" and parts[2] != "system" and ":" not in parts[2]:
+            if (len(parts) >= 3 and parts[2] != ":" and parts[2] != "system" and ":" not in parts[2]
+                    and parts[2] not in _WEEKDAYS):
                 host = parts[2]
             
-            # Try to parse the login date and time
-            try:
-                # Find the index where date starts (typically after tty and possibly host)
-                date_start_idx = 2 if not host else 3
-                date_str = ' '.join(parts[date_start_idx:date_start_idx+5])
-                login_time = datetime.strptime(date_str, "%a %b %d %H:%M:%S %Y")
-            except (ValueError, IndexError):
-                login_time = None
+            # Parse the login date and time, which follow tty and possibly host
+            login_time = _parse_last_time(parts[3 if host else 2:], year)
             
             # Parse logout time if available
             logout_time = None
@@ -187,20 +261,21 @@ class LoginTracker:
             if " still logged in" in line:
                 is_active = True
             else:
-                try:
-                    # Try to find the logout time after "- "
-                    logout_idx = line.find(" - ")
-                    if logout_idx != -1:
-                        logout_part = line[logout_idx + 3:].strip().split('(')[0].strip()
-                        if "gone" not in logout_part and "crash" not in logout_part:
-                            logout_time_parts = logout_part.split()
-                            if len(logout_time_parts) >= 2:
-                                logout_time = datetime.strptime(
-                                    f"{datetime.now().year} {logout_time_parts[0]} {logout_time_parts[1]}", 
-                                    "%Y %b %d %H:%M"
-                                )
-                except (ValueError, IndexError):
-                    pass
+                # The logout time follows " - ", as a full time or, by
+                # default, just the time of day (then on the login's day)
+                logout_idx = line.find(" - ")
+                if logout_idx != -1:
+                    logout_fields = line[logout_idx + 3:].split('(')[0].split()
+                    logout_time = _parse_last_time(logout_fields, year)
+                    if logout_time is None and login_time and len(logout_fields) == 1:
+                        try:
+                            hour, minute = map(int, logout_fields[0].split(":"))
+                            logout_time = login_time.replace(hour=hour, minute=minute, second=0)
+                        except ValueError:
+                            pass
+                        else:
+                            if logout_time < login_time:
+                                logout_time += timedelta(days=1)
             
             logins.append(UserLogin(
                 username=username,
@@ -217,6 +292,22 @@ class LoginTracker:
         """
         Get a list of currently active user logins
         
+        The list is reused for ACTIVE_LOGINS_TTL seconds.
+        
+        Returns:
+            List of UserLogin objects
+        """
+        now = time.monotonic()
+        cached_ts, logins = self._active_cache
+        if now - cached_ts >= ACTIVE_LOGINS_TTL:
+            logins = self._read_active_logins()
+            self._active_cache = (now, logins)
+        return logins
+    
+    def _read_active_logins(self) -> List[UserLogin]:
+        """
+        Read the currently active user logins
+        
         Returns:
             List of UserLogin objects
         """
@@ -225,18 +316,16 @@ class LoginTracker:
             if success:
                 return self._parse_who_output(output)
         
-        # Fallback: Try to get login info from system files
+        # Fallback: list the users who might be able to login
         try:
-            active_logins = []
-            for user_info in pwd.getpwall():
-                if user_info.pw_shell and not user_info.pw_shell.endswith("nologin"):
-                    # This user might be able to login
-                    active_logins.append(UserLogin(
-                        username=user_info.pw_name,
-                        tty="system",
-                        is_active=False  # We can't confirm activity this way
-                    ))
-            return active_logins
+            return [
+                UserLogin(
+                    username=username,
+                    tty="system",
+                    is_active=False  # We can't confirm activity this way
+                )
+                for username in _shell_users()
+            ]
         except Exception:
             return []
     
@@ -244,6 +333,25 @@ class LoginTracker:
         """
         Get recent login history
         
+        The history is reused for LOGIN_HISTORY_TTL seconds.
+        
+        Args:
+            max_entries: Maximum number of entries to retrieve
+            
+        Returns:
+            List of UserLogin objects
+        """
+        now = time.monotonic()
+        cached_ts, logins = self._history_cache.get(max_entries, (float('-inf'), []))
+        if now - cached_ts >= LOGIN_HISTORY_TTL:
+            logins = self._read_login_history(max_entries)
+            self._history_cache[max_entries] = (now, logins)
+        return logins
+    
+    def _read_login_history(self, max_entries: int) -> List[UserLogin]:
+        """
+        Read the recent login history
+        
         Args:
             max_entries: Maximum number of entries to retrieve
             
@@ -12,6 +12,7 @@ import os
 import sys
 import time
 import asyncio
+import bisect
 import psutil
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
@@ -23,11 +24,38 @@ from rich.text import Text
 from rich.progress import BarColumn, Progress, TextColumn
 from rich import box
 
+from netdash.procsnapshot import ProcSnapshot
+
 # Color thresholds for memory utilization
 LOW_THRESHOLD = 50
 MEDIUM_THRESHOLD = 75
 HIGH_THRESHOLD = 90
 
+# Color for each threshold bucket, indexed by bisecting the thresholds
+_THRESHOLDS = (LOW_THRESHOLD, MEDIUM_THRESHOLD, HIGH_THRESHOLD)
+_COLOR_BUCKETS = ("green", "yellow", "dark_orange", "red")
+
+# Units for byte counts, each 1024 times the previous one
+_UNITS = ("B", "KB", "MB", "GB", "TB")
+_SCALES = tuple(1 << (10 * i) for i in range(len(_UNITS)))
+
+# Every possible usage bar, precomputed so rendering doesn't rebuild them
+_BAR_WIDTH = 30
+_BARS = tuple("█" * i + "░" * (_BAR_WIDTH - i) for i in range(_BAR_WIDTH + 1))
+
+
+def _usage_bar(percent: float) -> str:
+    """
+    Get the usage bar for a percentage
+    
+    Args:
+        percent: Usage percentage, clamped to 0-100
+        
+    Returns:
+        Bar string of _BAR_WIDTH characters
+    """
+    return _BARS[max(0, min(_BAR_WIDTH, int(percent / 100 * _BAR_WIDTH)))]
+
 
 class MemoryMonitor:
     """Monitor and display memory usage information"""
@@ -41,20 +69,31 @@ class MemoryMonitor:
         """
         self.refresh_interval = refresh_interval
         self.console = Console()
-        self._last_update = 0
+        self._last_update = float('-inf')
         self._memory_stats = {}
         self._swap_stats = {}
+        self._table_cache: Optional[Table] = None
+        self._table_key: Optional[tuple] = None
         self.update()
     
-    def update(self) -> None:
-        """Update memory statistics"""
-        current_time = time.time()
+    def update(self, snapshot: Optional[ProcSnapshot] = None) -> None:
+        """
+        Update memory statistics
+        
+        Args:
+            snapshot: Optional per-tick snapshot to read memory counters from
+        """
+        current_time = time.monotonic()
         
         # Only update if refresh interval has elapsed
         if current_time - self._last_update >= self.refresh_interval:
             # Get memory info
-            mem = psutil.virtual_memory()
-            swap = psutil.swap_memory()
+            if snapshot is not None:
+                mem = snapshot.virtual_memory
+                swap = snapshot.swap_memory
+            else:
+                mem = psutil.virtual_memory()
+                swap = psutil.swap_memory()
             
             # Store memory stats
             self._memory_stats = {
@@ -90,14 +129,7 @@ class MemoryMonitor:
         Returns:
             Color string for rich
         """
-        if percent < LOW_THRESHOLD:
-            return "green"
-        elif percent < MEDIUM_THRESHOLD:
-            return "yellow"
-        elif percent < HIGH_THRESHOLD:
-            return "dark_orange"
-        else:
-            return "red"
+        return _COLOR_BUCKETS[bisect.bisect_right(_THRESHOLDS, percent)]
     
     def _format_bytes(self, bytes_value: int) -> str:
         """
@@ -109,24 +141,27 @@ class MemoryMonitor:
         Returns:
             Formatted string (e.g., "4.2 GB")
         """
-        units = ["B", "KB", "MB", "GB", "TB"]
-        unit_index = 0
-        value = bytes_value
-        
-        while value >= 1024 and unit_index < len(units) - 1:
-            value /= 1024
-            unit_index += 1
+        # floor(log2(value)) // 10 picks the unit directly instead of dividing in a loop
+        if bytes_value < 1024:
+            unit_index = 0
+        else:
+            unit_index = min(len(_UNITS) - 1, (int(bytes_value).bit_length() - 1) // 10)
         
-        return f"{value:.1f} {units[unit_index]}"
+        return f"{bytes_value / _SCALES[unit_index]:.1f} {_UNITS[unit_index]}"
     
-    def get_summary(self) -> Text:
+    def get_summary(self, snapshot: Optional[ProcSnapshot] = None, refresh: bool = True) -> Text:
         """
         Get a summary of memory information
         
+        Args:
+            snapshot: Optional per-tick snapshot to read memory counters from
+            refresh: Whether to update the memory statistics first
+            
         Returns:
             Rich Text object with memory summary
         """
-        self.update()
+        if refresh:
+            self.update(snapshot)
         
         text = Text()
         
@@ -150,14 +185,25 @@ class MemoryMonitor:
         
         return text
     
-    def get_table(self) -> Table:
+    def get_table(self, snapshot: Optional[ProcSnapshot] = None, refresh: bool = True) -> Table:
         """
         Get a table of memory usage with bars
         
+        Args:
+            snapshot: Optional per-tick snapshot to read memory counters from
+            refresh: Whether to update the memory statistics first
+            
         Returns:
             Rich Table object with memory usage
         """
-        self.update()
+        if refresh:
+            self.update(snapshot)
+        
+        # Every row is derived from the stored stats, so reuse the last
+        # table until one of them changes
+        key = (tuple(self._memory_stats.values()), tuple(self._swap_stats.values()))
+        if key == self._table_key and self._table_cache is not None:
+            return self._table_cache
         
         # Create table
         table = Table(
@@ -178,9 +224,7 @@ class MemoryMonitor:
         mem_color = self._get_color_for_percentage(mem_percent)
         
         # Create bar for memory usage
-        bar_width = 30  # Fixed width for the bar
-        filled = int(mem_percent / 100 * bar_width)
-        mem_bar = "█" * filled + "░" * (bar_width - filled)
+        mem_bar = _usage_bar(mem_percent)
         
         # Add memory rows
         table.add_row(
@@ -195,8 +239,7 @@ class MemoryMonitor:
         used_percent = (used_without_cache / self._memory_stats['total']) * 100 if self._memory_stats['total'] > 0 else 0
         
         # App Memory (Used - Cached - Buffers)
-        filled = int(used_percent / 100 * bar_width)
-        used_bar = "█" * filled + "░" * (bar_width - filled)
+        used_bar = _usage_bar(used_percent)
         used_color = self._get_color_for_percentage(used_percent)
         
         table.add_row(
@@ -210,8 +253,7 @@ class MemoryMonitor:
         if self._memory_stats.get('cached', 0) > 0:
             cached = self._memory_stats['cached']
             cached_percent = (cached / self._memory_stats['total']) * 100 if self._memory_stats['total'] > 0 else 0
-            filled = int(cached_percent / 100 * bar_width)
-            cached_bar = "█" * filled + "░" * (bar_width - filled)
+            cached_bar = _usage_bar(cached_percent)
             
             table.add_row(
                 "├─ Cached",
@@ -224,8 +266,7 @@ class MemoryMonitor:
         if self._memory_stats.get('buffers', 0) > 0:
             buffers = self._memory_stats['buffers']
             buffers_percent = (buffers / self._memory_stats['total']) * 100 if self._memory_stats['total'] > 0 else 0
-            filled = int(buffers_percent / 100 * bar_width)
-            buffers_bar = "█" * filled + "░" * (bar_width - filled)
+            buffers_bar = _usage_bar(buffers_percent)
             
             table.add_row(
                 "├─ Buffers",
@@ -237,8 +278,7 @@ class MemoryMonitor:
         # Free memory
         free = self._memory_stats['free']
         free_percent = (free / self._memory_stats['total']) * 100 if self._memory_stats['total'] > 0 else 0
-        filled = int(free_percent / 100 * bar_width)
-        free_bar = "█" * filled + "░" * (bar_width - filled)
+        free_bar = _usage_bar(free_percent)
         
         table.add_row(
             "└─ Free",
@@ -253,8 +293,7 @@ class MemoryMonitor:
             swap_color = self._get_color_for_percentage(swap_percent)
             
             # Create bar for swap usage
-            filled = int(swap_percent / 100 * bar_width)
-            swap_bar = "█" * filled + "░" * (bar_width - filled)
+            swap_bar = _usage_bar(swap_percent)
             
             table.add_section()
             table.add_row(
@@ -284,6 +323,8 @@ class MemoryMonitor:
                     Text(swap_pressure, style=pressure_color)
                 )
         
+        self._table_cache = table
+        self._table_key = key
         return table
     
     def get_rich_panel(self) -> Panel:
@@ -293,9 +334,10 @@ class MemoryMonitor:
         Returns:
             Rich Panel containing memory information
         """
-        # Create layout with summary and table
-        summary = self.get_summary()
-        table = self.get_table()
+        # Create layout with summary and table, from a single update
+        self.update()
+        summary = self.get_summary(refresh=False)
+        table = self.get_table(refresh=False)
         
         return Panel(
             table,
@@ -9,6 +9,7 @@ Displays real-time network interface statistics including:
 """
 
 import time
+import operator
 import psutil
 from typing import Dict, Optional, Tuple, List
 from rich.console import Console
@@ -16,6 +17,12 @@ from rich.table import Table
 from rich.live import Live
 from rich import box
 
+from netdash._fastmath import rates
+
+# Interface counters converted to upload/download speeds
+_BYTE_FIELDS = operator.attrgetter('bytes_sent', 'bytes_recv')
+
+
 class NetworkStats:
     """Network statistics collector and formatter"""
     
@@ -51,15 +58,12 @@ class NetworkStats:
         if not self.previous_counters or interface not in self.previous_counters:
             return 0.0, 0.0
         
-        current = self.current_counters[interface]
-        previous = self.previous_counters[interface]
-        
         # Calculate bytes sent/received per second
-        bytes_sent = current.bytes_sent - previous.bytes_sent
-        bytes_recv = current.bytes_recv - previous.bytes_recv
-        
-        upload_speed = bytes_sent / self.refresh_interval
-        download_speed = bytes_recv / self.refresh_interval
+        upload_speed, download_speed = rates(
+            _BYTE_FIELDS(self.previous_counters[interface]),
+            _BYTE_FIELDS(self.current_counters[interface]),
+            self.refresh_interval
+        )
         
         return upload_speed, download_speed
     
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Per-tick snapshot of system-wide counters
+
+Several monitors read the same /proc files (load average, memory and
+swap) within one dashboard tick. A ProcSnapshot is created once per tick
+and handed to each of them, so every file is read and parsed at most
+once per tick, and only if some monitor actually asks for it.
+"""
+
+import time
+from typing import Tuple
+
+import psutil
+
+
+class ProcSnapshot:
+    """Lazily read, memoized system counters for one dashboard tick"""
+    
+    __slots__ = ("ts", "_loadavg", "_virtual_memory", "_swap_memory")
+    
+    def __init__(self):
+        """Initialize an empty snapshot stamped with the current time"""
+        self.ts = time.monotonic()
+        self._loadavg = None
+        self._virtual_memory = None
+        self._swap_memory = None
+    
+    @property
+    def loadavg(self) -> Tuple[float, float, float]:
+        """1, 5 and 15 minute load averages (/proc/loadavg)"""
+        if self._loadavg is None:
+            self._loadavg = psutil.getloadavg()
+        return self._loadavg
+    
+    @property
+    def virtual_memory(self):
+        """psutil.virtual_memory() result (/proc/meminfo)"""
+        if self._virtual_memory is None:
+            self._virtual_memory = psutil.virtual_memory()
+        return self._virtual_memory
+    
+    @property
+    def swap_memory(self):
+        """psutil.swap_memory() result (/proc/meminfo and /proc/vmstat)"""
+        if self._swap_memory is None:
+            self._swap_memory = psutil.swap_memory()
+        return self._swap_memory
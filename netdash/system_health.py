@@ -26,6 +26,8 @@ from rich.text import Text
 from rich.progress import BarColumn, Progress, TextColumn
 from rich import box
 
+from netdash.procsnapshot import ProcSnapshot
+
 # Temperature thresholds (°C)
 TEMP_OK = 60
 TEMP_WARN = 75
@@ -230,10 +232,13 @@ class SystemHealth:
             
         return formatted
     
-    def get_table(self) -> Table:
+    def get_table(self, snapshot: Optional[ProcSnapshot] = None) -> Table:
         """
         Generate a rich table with system health information
         
+        Args:
+            snapshot: Optional per-tick snapshot to read the load average from
+            
         Returns:
             Rich Table object with health data
         """
@@ -276,7 +281,7 @@ class SystemHealth:
         
         # System load
         try:
-            load1, load5, load15 = psutil.getloadavg()
+            load1, load5, load15 = snapshot.loadavg if snapshot else psutil.getloadavg()
             
             # Determine load status colors
             load1_color = "green"
@@ -369,10 +374,13 @@ class SystemHealth:
         
         return table
     
-    def get_summary(self) -> Text:
+    def get_summary(self, snapshot: Optional[ProcSnapshot] = None) -> Text:
         """
         Generate a summary of system health
         
+        Args:
+            snapshot: Optional per-tick snapshot to read the load average from
+            
         Returns:
             Rich Text object with health summary
         """
@@ -385,7 +393,7 @@ class SystemHealth:
         
         # Get load averages
         try:
-            load1, load5, load15 = psutil.getloadavg()
+            load1, load5, load15 = snapshot.loadavg if snapshot else psutil.getloadavg()
             load_str = f"{load1:.2f}, {load5:.2f}, {load15:.2f}"
             
             # Color based on 1-min load
@@ -53,3 +53,45 @@ def test_cpu_monitor_summary():
     assert summary is not None
     assert "CPU:" in str(summary)
     assert "Cores:" in str(summary)
+
+
+def test_cpu_monitor_sampler_stop():
+    """Test the background sampler publishes a snapshot and stops cleanly"""
+    monitor = CPUMonitor(refresh_interval=0.05)
+    assert set(monitor._snapshot) == {'cpu', 'load', 'freq_line'}
+    
+    monitor.stop()
+    monitor._sampler_thread.join(timeout=1.0)
+    assert not monitor._sampler_thread.is_alive()
+
+
+def test_cpu_monitor_panel_cache():
+    """Test the rich panel is reused until the CPU data changes"""
+    monitor = CPUMonitor()
+    monitor.stop()
+    
+    panel = monitor.get_rich_panel()
+    assert monitor.get_rich_panel() is panel
+    
+    snapshot = dict(monitor._snapshot)
+    snapshot['cpu'] = [p + 5 for p in snapshot['cpu']] or [5.0]
+    monitor._snapshot = snapshot
+    assert monitor.get_rich_panel() is not panel
+    
+    # Changes smaller than a whole percent are displayed too
+    monitor._snapshot = dict(snapshot, cpu=[23.1])
+    panel = monitor.get_rich_panel()
+    monitor._snapshot = dict(snapshot, cpu=[23.9])
+    assert monitor.get_rich_panel() is not panel
+
+
+def test_cpu_monitor_new_table_per_call():
+    """Test every call builds a new table with the same columns"""
+    monitor = CPUMonitor()
+    monitor.stop()
+    
+    table = monitor.get_table()
+    again = monitor.get_table(refresh=False)
+    assert again is not table
+    assert [column.header for column in again.columns] == ["Core", "Usage %", "Usage"]
+    assert again.row_count == table.row_count
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for the dashboard module
+"""
+
+import asyncio
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+import pytest
+from netdash.dashboard import DashboardPanel, MonitorRegistry, NetDashApp, RichDashboard
+
+
+def test_registry_stop_reaps_background_work(tmp_path):
+    """Test stopping the registry releases the monitors' processes, threads and fds"""
+    log_file = tmp_path / "auth.log"
+    log_file.write_text("")
+    registry = MonitorRegistry(custom_log_file=str(log_file))
+    
+    log_monitor = registry.log_monitor
+    follower = subprocess.Popen(["sleep", "60"], stdout=subprocess.PIPE)
+    log_monitor._journal_proc = follower
+    cpu_monitor = registry.cpu_monitor
+    disk_usage = registry.disk_usage
+    container_monitor = registry.container_monitor
+    stats_executor = container_monitor._stats_executor = ThreadPoolExecutor(max_workers=1)
+    stats_executor.submit(lambda: None).result()
+    docker_conn = MagicMock()
+    container_monitor._docker_conns.append(docker_conn)
+    
+    registry.stop()
+    assert follower.poll() is not None
+    assert log_monitor._journal_proc is None
+    assert not cpu_monitor._sampler_thread.is_alive()
+    assert disk_usage._diskstats_fd is None
+    docker_conn.close.assert_called_once()
+    assert container_monitor._stats_executor is None
+    with pytest.raises(RuntimeError):
+        stats_executor.submit(lambda: None)
+    
+    # Monitors never created aren't created just to be stopped
+    assert "network_stats" not in vars(registry)
+
+
+def test_rich_dashboard_stops_registry_on_exit(tmp_path):
+    """Test the Rich dashboard stops the monitors it created when it exits"""
+    log_file = tmp_path / "auth.log"
+    log_file.write_text("")
+    dashboard = RichDashboard(custom_log_file=str(log_file), panels=["log_monitor"])
+    follower = subprocess.Popen(["sleep", "60"], stdout=subprocess.PIPE)
+    dashboard.registry.log_monitor._journal_proc = follower
+    
+    async def interrupt():
+        raise KeyboardInterrupt
+    
+    with patch.object(dashboard, "_update_layout", interrupt):
+        asyncio.run(dashboard.run())
+    assert follower.poll() is not None
+
+
+def test_panel_selection_matches_between_frontends():
+    """Test both dashboards accept the same panel names and reject others"""
+    rich_slots = [slot for _, slot, _, _ in RichDashboard.PANELS]
+    assert sorted(slot for slot, _, _ in NetDashApp.PANELS) == sorted(rich_slots)
+    
+    with pytest.raises(ValueError):
+        NetDashApp(panels=["cpu", "bogus"])
+    with pytest.raises(ValueError):
+        RichDashboard(panels=["bogus"])
+
+
+def test_textual_dashboard_shows_selected_panels():
+    """Test the Textual dashboard only builds the selected panels"""
+    app = NetDashApp(panels=["memory"])
+    
+    async def run():
+        async with app.run_test(size=(120, 40)) as pilot:
+            await pilot.pause()
+            return [panel.id for panel in app.query(DashboardPanel)]
+    
+    assert asyncio.run(run()) == ["memory-panel"]
+    assert "cpu_monitor" not in vars(app.registry)
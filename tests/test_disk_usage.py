@@ -3,8 +3,10 @@
 Test Disk Usage Monitor Module
 """
 
+import os
 import pytest
-from netdash.disk_usage import DiskUsage
+from unittest.mock import patch, MagicMock, mock_open
+from netdash.disk_usage import DiskUsage, _parse_diskstats
 
 
 def test_disk_usage_init():
@@ -34,6 +36,11 @@ def test_disk_usage_format_bytes():
     assert monitor._format_bytes(1048576) == "1.0 MB"
     assert monitor._format_bytes(1073741824) == "1.0 GB"
     assert monitor._format_bytes(1099511627776) == "1.0 TB"
+    
+    # Rates aren't cached, and an idle disk's zero rate is a constant
+    assert monitor._format_bytes_per_sec(0.0) == "0.0 B/s"
+    assert monitor._format_bytes_per_sec(1536.0) == "1.5 KB/s"
+    assert monitor._format_bytes_per_sec(1023.9) == "1023.9 B/s"
 
 
 def test_disk_usage_tables():
@@ -60,3 +67,166 @@ def test_disk_usage_summary():
     summary = monitor.get_summary()
     assert summary is not None
     assert "Total Storage:" in str(summary) or "Overall Usage:" in str(summary)
+
+
+def test_disk_usage_partitions_cached():
+    """Test partitions and their usage are read once per update"""
+    monitor = DiskUsage()
+    part = MagicMock(mountpoint="/data", fstype="ext4", opts="rw,relatime")
+    usage = MagicMock(total=100, used=40, free=60, percent=40.0)
+    
+    with patch.object(DiskUsage, '_read_partitions', return_value=[part]) as mock_parts, \
+         patch('netdash.disk_usage.psutil.disk_usage', return_value=usage) as mock_usage:
+        monitor._partitions_cache_ts = float('-inf')
+        monitor._last_update = 0
+        monitor.update()
+        summary = monitor.get_summary(refresh=False)
+        table = monitor.get_filesystems_table(refresh=False)
+        
+        assert mock_parts.call_count == 1
+        assert mock_usage.call_count == 1
+        assert "40.0%" in str(summary)
+        assert len(table.rows) == 1
+
+
+def test_disk_usage_io_rates():
+    """Test I/O rates are computed only for disks present in both samples"""
+    monitor = DiskUsage()
+    monitor._last_io_disks = ['sda']
+    monitor._last_io_values = [(10, 20, 1000, 2000)]
+    
+    monitor._calculate_io_rates(['sda', 'sdb'], [(20, 40, 3000, 6000), (5, 5, 5, 5)], 2.0)
+    
+    assert monitor._io_rate_disks == ['sda']
+    assert monitor._io_rates['read_ops'] == [5.0]
+    assert monitor._io_rates['write_ops'] == [10.0]
+    assert monitor._io_rates['read_bytes'] == [1000.0]
+    assert monitor._io_rates['write_bytes'] == [2000.0]
+    
+    # Counters that went backwards yield zero rather than negative rates
+    monitor._last_io_disks = ['sda']
+    monitor._last_io_values = [(20, 40, 3000, 6000)]
+    monitor._calculate_io_rates(['sda'], [(30, 10, 5000, 0)], 1.0)
+    assert monitor._io_rates['read_ops'] == [10.0]
+    assert monitor._io_rates['write_ops'] == [0.0]
+    assert monitor._io_rates['write_bytes'] == [0.0]
+
+
+def test_disk_usage_read_diskstats(tmp_path):
+    """Test I/O counters are parsed from /proc/diskstats"""
+    diskstats = tmp_path / "diskstats"
+    diskstats.write_text(
+        "   7       0 loop0 10 0 20 0 0 0 0 0 0 0 0\n"
+        " 253       0 vda 100 5 200 30 40 6 80 90 0 50 120\n"
+    )
+    monitor = DiskUsage()
+    monitor.stop()
+    monitor._diskstats_fd = os.open(str(diskstats), os.O_RDONLY)
+    try:
+        disks, values = monitor._read_io_counters()
+    finally:
+        monitor.stop()
+    
+    assert disks == ['vda']
+    assert values == [(100, 40, 200 * 512, 80 * 512)]
+
+
+def test_disk_usage_stop_closes_diskstats():
+    """Test stop() closes the /proc/diskstats descriptor, and can be repeated"""
+    monitor = DiskUsage()
+    fd = monitor._diskstats_fd
+    monitor.stop()
+    monitor.stop()
+    
+    assert monitor._diskstats_fd is None
+    if fd is not None:
+        with pytest.raises(OSError):
+            os.fstat(fd)
+
+
+def test_disk_usage_new_tables_per_call():
+    """Test every call builds new tables with the same columns"""
+    monitor = DiskUsage()
+    filesystems_table, io_table = monitor.get_table().renderables
+    again_filesystems, again_io = monitor.get_table(refresh=False).renderables
+    
+    assert again_filesystems is not filesystems_table
+    assert again_io is not io_table
+    assert again_filesystems.row_count == filesystems_table.row_count
+    assert [column.header for column in again_io.columns] == [
+        "Device", "Read", "Write", "Read ops/s", "Write ops/s"
+    ]
+
+
+def test_disk_usage_read_only_cached():
+    """Test usage of read-only filesystems isn't re-read on every update"""
+    monitor = DiskUsage()
+    ro_part = MagicMock(mountpoint="/snap/core", fstype="squashfs", opts="ro,nodev")
+    rw_part = MagicMock(mountpoint="/data", fstype="ext4", opts="rw,relatime")
+    usage = MagicMock(total=100, used=40, free=60, percent=40.0)
+    
+    with patch.object(DiskUsage, '_read_partitions', return_value=[ro_part, rw_part]), \
+         patch('netdash.disk_usage.psutil.disk_usage', return_value=usage) as mock_usage:
+        monitor._partitions_cache_ts = float('-inf')
+        monitor._last_update = 0
+        monitor.update()
+        monitor._last_update = 0
+        monitor.update()
+        
+        assert [call.args[0] for call in mock_usage.call_args_list] == ["/data", "/snap/core", "/data"]
+        assert list(monitor._usage_cache) == ["/data", "/snap/core"]
+
+
+def test_disk_usage_read_mountinfo():
+    """Test device-backed mounts are parsed from /proc/self/mountinfo"""
+    mountinfo = (
+        b"23 28 0:22 / /proc rw,relatime - proc proc rw\n"
+        b"28 1 253:0 / / rw,relatime shared:1 - ext4 /dev/vda rw,discard\n"
+        b"40 28 253:16 / /mnt/my\\040disk ro,nodev - ext4 /dev/vdb ro\n"
+    )
+    monitor = DiskUsage()
+    
+    with patch('builtins.open', mock_open(read_data=mountinfo)), \
+         patch('netdash.disk_usage._physical_fstypes', return_value=frozenset({'ext4'})):
+        partitions = monitor._read_partitions()
+    
+    assert [(p.device, p.mountpoint, p.fstype, p.opts) for p in partitions] == [
+        ("/dev/vda", "/", "ext4", "rw,relatime,discard"),
+        ("/dev/vdb", "/mnt/my disk", "ext4", "ro,nodev"),
+    ]
+
+
+def test_parse_diskstats_mixed_line_lengths():
+    """Test /proc/diskstats lines with differing field counts are still parsed"""
+    disks, values = _parse_diskstats(
+        "   8       0 sdb 100 5 200 30 40 6 80 90 0 50 120 0 0 0 0\n"
+        "   8       1 sdb1 7 14 21 28\n"
+        "   8      16 sda 1 0 2 0 3 0 4 0 0 0 0 0 0 0 0\n"
+    )
+    
+    assert disks == ['sda', 'sdb']
+    assert values == [(1, 3, 2 * 512, 4 * 512), (100, 40, 200 * 512, 80 * 512)]
+
+
+def test_disk_usage_idle_backoff():
+    """Test the refresh interval backs off while idle and resets on activity"""
+    monitor = DiskUsage()
+    part = MagicMock(mountpoint="/data", fstype="ext4", opts="rw,relatime")
+    usage = MagicMock(total=100, used=40, free=60, percent=40.0)
+    
+    with patch.object(DiskUsage, '_read_partitions', return_value=[part]), \
+         patch.object(DiskUsage, '_read_io_counters', return_value=(['sda'], [(0, 0, 0, 0)])), \
+         patch('netdash.disk_usage.psutil.disk_usage', return_value=usage) as mock_usage:
+        monitor._partitions_cache_ts = float('-inf')
+        intervals = []
+        for _ in range(6):
+            monitor._last_update = float('-inf')
+            monitor.update()
+            intervals.append(monitor.refresh_interval)
+        
+        assert intervals == [1.0, 1.0, 1.0, 2.0, 4.0, 8.0]
+        
+        mock_usage.return_value = MagicMock(total=100, used=41, free=59, percent=41.0)
+        monitor._last_update = float('-inf')
+        monitor.update()
+        assert monitor.refresh_interval == 1.0
@@ -4,6 +4,7 @@ Tests for the log_monitor module
 import pytest
 from unittest.mock import patch, MagicMock, mock_open
 import os
+import json
 from datetime import datetime
 from netdash.log_monitor import LogMonitor, LogEvent, LogMonitorConfig
 
@@ -17,25 +18,36 @@ class TestLogMonitor:
             monitor = LogMonitor()
             assert monitor.log_source == "dummy"
     
-    def test_initialize_with_existing_log_file(self):
+    def test_initialize_with_existing_log_file(self, tmp_path):
         """Test initialization with valid log file"""
-        with patch('os.path.exists') as mock_exists, \
-             patch('os.access') as mock_access:
-            mock_exists.return_value = True
-            mock_access.return_value = True
-            
-            config = LogMonitorConfig(log_file="/test/log/file")
+        log_file = tmp_path / "auth.log"
+        log_file.write_text("line1\n")
+        
+        config = LogMonitorConfig(log_file=str(log_file))
+        monitor = LogMonitor(config)
+        
+        assert monitor.log_source == "file"
+        assert monitor.config.log_file == str(log_file)
+        assert monitor._tail_file_obj is not None
+    
+    def test_initialize_with_fallback_log_file(self, tmp_path):
+        """Test initialization falls back to the fallback log file"""
+        fallback = tmp_path / "sample_auth.log"
+        fallback.write_text("line1\n")
+        
+        with patch('netdash.log_monitor._HAS_JOURNALCTL', False):
+            config = LogMonitorConfig(log_file=str(tmp_path / "missing.log"), fallback_log_file=str(fallback))
             monitor = LogMonitor(config)
-            
-            assert monitor.log_source == "file"
-            assert monitor.config.log_file == "/test/log/file"
+        
+        assert monitor.log_source == "file"
+        assert monitor.config.log_file == str(fallback)
+        assert monitor._tail_file(1) == ["line1"]
     
     def test_initialize_with_journalctl(self):
         """Test initialization with journalctl"""
         with patch('os.path.exists') as mock_exists, \
-             patch('netdash.log_monitor.LogMonitor._is_command_available') as mock_cmd_available:
+             patch('netdash.log_monitor._HAS_JOURNALCTL', True):
             mock_exists.return_value = False
-            mock_cmd_available.return_value = True
             
             config = LogMonitorConfig(log_file="/nonexistent/file", journal_unit="test.service")
             monitor = LogMonitor(config)
@@ -43,41 +55,122 @@ class TestLogMonitor:
             assert monitor.log_source == "journalctl"
             assert monitor.config.journal_unit == "test.service"
     
-    @patch('netdash.log_monitor.LogMonitor._is_command_available')
-    @patch('netdash.log_monitor.LogMonitor._run_command')
-    def test_tail_file(self, mock_run_command, mock_cmd_available):
+    def test_tail_file(self, tmp_path):
         """Test file tailing functionality"""
-        mock_cmd_available.return_value = True
-        mock_run_command.return_value = (True, "line1\nline2\nline3")
+        log_file = tmp_path / "auth.log"
+        log_file.write_text("line1\nline2\nline3\n")
         
-        with patch('os.path.exists') as mock_exists:
-            mock_exists.return_value = True
-            
-            config = LogMonitorConfig(log_file="/test/log/file")
-            monitor = LogMonitor(config)
-            
-            lines = monitor._tail_file(3)
-            assert len(lines) == 3
-            assert lines[0] == "line1"
+        config = LogMonitorConfig(log_file=str(log_file))
+        monitor = LogMonitor(config)
+        
+        lines = monitor._tail_file(3)
+        assert len(lines) == 3
+        assert lines[0] == "line1"
+        
+        # Only appended data is read, an unterminated last line included
+        with open(log_file, 'a') as f:
+            f.write("line4\nline5")
+        assert monitor._tail_file(3) == ["line3", "line4", "line5"]
+        
+        with open(log_file, 'a') as f:
+            f.write(" done\n")
+        assert monitor._tail_file(2) == ["line4", "line5 done"]
     
-    @patch('netdash.log_monitor.LogMonitor._is_command_available')
+    def test_tail_file_rotated(self, tmp_path):
+        """Test a rotated or truncated log file is read again from its tail"""
+        log_file = tmp_path / "auth.log"
+        log_file.write_text("".join(f"old{i}\n" for i in range(100)))
+        
+        monitor = LogMonitor(LogMonitorConfig(log_file=str(log_file)))
+        assert monitor._tail_file(2) == ["old98", "old99"]
+        
+        log_file.rename(tmp_path / "auth.log.1")
+        log_file.write_text("new1\nnew2\n")
+        assert monitor._tail_file(3) == ["new1", "new2"]
+        
+        log_file.write_text("x\n")
+        assert monitor._tail_file(3) == ["x"]
+    
+    @patch('netdash.log_monitor._HAS_JOURNALCTL', True)
+    @patch('netdash.log_monitor.subprocess.Popen')
     @patch('netdash.log_monitor.LogMonitor._run_command')
-    def test_get_journalctl_logs(self, mock_run_command, mock_cmd_available):
+    def test_get_journalctl_logs(self, mock_run_command, mock_popen):
         """Test journalctl log retrieval"""
-        mock_cmd_available.return_value = True
-        mock_run_command.return_value = (True, "line1\nline2\nline3")
+        entries = [json.dumps({"MESSAGE": f"line{i}", "__CURSOR": f"s={i}"}) for i in range(6)]
+        mock_run_command.return_value = (True, "\n".join(entries[:3]))
+        read_fd, write_fd = os.pipe()
+        mock_popen.return_value.stdout = os.fdopen(read_fd, 'rb', buffering=0)
         
         config = LogMonitorConfig(journal_unit="test.service")
         monitor = LogMonitor(config)
         
         lines = monitor._get_journalctl_logs(3)
-        assert len(lines) == 3
-        assert lines[0] == "line1"
+        assert lines == entries[:3]
         
         # Verify journalctl command parameters
         mock_run_command.assert_called_with(
-            ["journalctl", "-n", "3", "--no-pager", "-u", "test.service"]
+            ["journalctl", "-n", "3", "--no-pager", "-o", "json", "-u", "test.service"]
         )
+        assert mock_popen.call_args[0][0] == [
+            "journalctl", "--follow", "--no-pager", "-o", "json", "-u", "test.service",
+            "--after-cursor=s=2"
+        ]
+        
+        # Later calls only drain the follower, without blocking
+        assert monitor._get_journalctl_logs(3) == entries[:3]
+        os.write(write_fd, ("\n".join(entries[3:5]) + "\n").encode())
+        assert monitor._get_journalctl_logs(3) == entries[2:5]
+        assert mock_run_command.call_count == 1
+        
+        os.close(write_fd)
+        monitor.stop()
+    
+    def test_parse_journal_entry(self):
+        """Test parsing a journal entry printed as JSON"""
+        monitor = LogMonitor()
+        timestamp = datetime(2023, 6, 26, 9, 30, 1)
+        entry = {
+            "__REALTIME_TIMESTAMP": str(int(timestamp.timestamp() * 1e6)),
+            "_HOSTNAME": "hostname",
+            "SYSLOG_IDENTIFIER": "sshd",
+            "_PID": "1234",
+            "PRIORITY": "6",
+            "MESSAGE": "Failed password for invalid user admin"
+        }
+        
+        event = monitor._parse_journal_entry(json.dumps(entry))
+        assert event.timestamp == timestamp
+        assert event.source == "sshd"
+        assert event.message == "hostname sshd[1234]: Failed password for invalid user admin"
+        assert event.alert is True
+        assert event.level == "ERROR"
+        
+        entry.update(PRIORITY="4", MESSAGE="Connection reset", _PID=None)
+        event = monitor._parse_journal_entry(json.dumps(entry))
+        assert event.message == "hostname sshd: Connection reset"
+        assert event.alert is False
+        assert event.level == "WARNING"
+        
+        # Anything else is parsed as a plain log line
+        event = monitor._parse_journal_entry("Jun 26 09:30:01 hostname cron[1]: job started")
+        assert event.source == "cron"
+    
+    def test_get_recent_logs_parses_new_lines_only(self, tmp_path):
+        """Test lines already read keep their events instead of being re-parsed"""
+        log_file = tmp_path / "auth.log"
+        log_file.write_text("".join(f"Jun 26 09:30:0{i} hostname sshd[1234]: line {i}\n" for i in range(3)))
+        monitor = LogMonitor(LogMonitorConfig(log_file=str(log_file)))
+        
+        first = monitor.get_recent_logs(3)
+        with open(log_file, 'a') as f:
+            f.write("Jun 26 09:30:03 hostname sshd[1234]: Failed password for invalid user\n")
+        
+        with patch.object(monitor, '_parse_log_line', wraps=monitor._parse_log_line) as mock_parse:
+            second = monitor.get_recent_logs(3)
+            mock_parse.assert_called_once()
+        
+        assert second[:2] == first[1:]
+        assert second[2].alert is True
     
     def test_parse_log_line_syslog_format(self):
         """Test parsing standard syslog formatted line"""
@@ -132,6 +225,30 @@ class TestLogMonitor:
         assert event.alert is False
         assert event.level == "INFO"
     
+    def test_parse_long_and_binary_lines(self):
+        """Test only the start of long lines is scanned and NUL bytes are dropped"""
+        monitor = LogMonitor()
+        
+        line = "Jun 26 09:30:01 hostname sshd[1234]: " + "x" * 5000 + " Failed password"
+        event = monitor._parse_log_line(line)
+        assert event.source == "sshd"
+        assert event.alert is False
+        assert event.raw_line == line
+        
+        event = monitor._parse_log_line("\x00" * 100 + "Jun 26 09:30:01 hostname cron[1]: job started")
+        assert event.timestamp.hour == 9
+        assert event.source == "cron"
+        assert monitor._parse_log_line("\x00" * 100) is None
+    
+    def test_event_style(self):
+        """Test the message style is derived once when an event is created"""
+        now = datetime.now()
+        assert LogEvent(now, "sshd", "Failed password for root", alert=True).style == "bold red"
+        assert LogEvent(now, "sudo", "user : COMMAND=/bin/ls", alert=True).style == "bold magenta"
+        assert LogEvent(now, "kernel", "oops", level="ERROR").style == "red"
+        assert LogEvent(now, "cron", "job started").style == "white"
+        assert LogEvent(now, "cron", "job started", style="green").style == "green"
+    
     def test_get_alert_count(self):
         """Test alert counting by type"""
         monitor = LogMonitor()
@@ -176,3 +293,20 @@ class TestLogMonitor:
         assert counts["failed_login"] == 2
         assert counts["sudo_usage"] == 1
         assert counts["ssh_login"] == 0
+    
+    def test_update_skips_unchanged_file(self, tmp_path):
+        """Test that an unchanged log file is not re-read"""
+        log_file = tmp_path / "auth.log"
+        log_file.write_text("Jun 26 09:30:01 hostname sshd[1234]: Accepted password for user\n")
+        monitor = LogMonitor(LogMonitorConfig(log_file=str(log_file)))
+        assert monitor.log_source == "file"
+        
+        with patch.object(monitor, 'get_recent_logs', wraps=monitor.get_recent_logs) as mock_get:
+            assert monitor.update() is True
+            assert monitor.update() is False
+            assert mock_get.call_count == 1
+            
+            with open(log_file, 'a') as f:
+                f.write("Jun 26 09:30:02 hostname sshd[1234]: Failed password for invalid user\n")
+            assert monitor.update() is True
+            assert mock_get.call_count == 2
@@ -3,7 +3,7 @@ Tests for the login_tracker module
 """
 import pytest
 from unittest.mock import patch, MagicMock
-from netdash.login_tracker import LoginTracker, UserLogin
+from netdash.login_tracker import LoginTracker, UserLogin, _cmd_exists
 from datetime import datetime
 
 class TestLoginTracker:
@@ -14,20 +14,25 @@ class TestLoginTracker:
         tracker = LoginTracker()
         assert hasattr(tracker, "console")
     
-    @patch('subprocess.run')
-    def test_is_command_available(self, mock_run):
+    @patch('shutil.which')
+    def test_is_command_available(self, mock_which):
         """Test command availability check"""
+        _cmd_exists.cache_clear()
+        
         # Mock a successful command check
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_run.return_value = mock_process
+        mock_which.return_value = "/usr/bin/who"
         
         tracker = LoginTracker()
         assert tracker._is_command_available("who") is True
         
         # Mock a failed command check
-        mock_process.returncode = 1
+        mock_which.return_value = None
         assert tracker._is_command_available("nonexistent_command") is False
+        
+        # Results are cached across trackers
+        assert LoginTracker()._is_command_available("who") is True
+        assert mock_which.call_count == 2
+        _cmd_exists.cache_clear()
     
     @patch('subprocess.run')
     def test_run_command(self, mock_run):
@@ -89,14 +94,53 @@ class TestLoginTracker:
         assert len(logins) == 3
         assert logins[0].username == "user1"
         assert logins[0].is_active is True
+        assert logins[0].host == ""
+        assert logins[0].login_time == datetime(2023, 6, 26, 9, 30)
         
         assert logins[1].username == "user2"
         assert logins[1].is_active is False
         assert logins[1].host == "192.168.1.100"
+        assert logins[1].logout_time == datetime(2023, 6, 26, 11, 20)
         
         assert logins[2].username == "user3"
         assert logins[2].is_active is False
         assert logins[2].host == "192.168.1.101"
+        assert logins[2].logout_time is None
+    
+    def test_parse_last_output_default_times(self):
+        """Test parsing of 'last' times without seconds or year, skipping reboots"""
+        sample_output = (
+            "user1    pts/0    192.168.1.100  Mon Jan  5 22:11 - 01:02  (02:51)\n"
+            "reboot   system boot  6.1.0      Mon Jan  5 20:00   still running\n"
+        )
+        
+        tracker = LoginTracker()
+        (login,) = tracker._parse_last_output(sample_output)
+        
+        year = datetime.now().year
+        assert login.login_time == datetime(year, 1, 5, 22, 11)
+        assert login.logout_time == datetime(year, 1, 6, 1, 2)
+    
+    @patch('netdash.login_tracker.LoginTracker._run_command')
+    @patch('netdash.login_tracker.LoginTracker._is_command_available', return_value=True)
+    def test_logins_cached(self, mock_available, mock_run_command):
+        """Test 'who' and 'last' output is reused within its TTL"""
+        mock_run_command.return_value = (True, "user1    pts/0        2023-06-26 09:30\n")
+        
+        tracker = LoginTracker()
+        first = tracker.get_active_logins()
+        assert tracker.get_active_logins() is first
+        tracker.get_login_history(5)
+        tracker.get_login_history(5)
+        assert mock_run_command.call_count == 2
+        
+        # Another history length is cached separately
+        tracker.get_login_history(10)
+        assert mock_run_command.call_count == 3
+        
+        tracker.clear_cache()
+        tracker.get_active_logins()
+        assert mock_run_command.call_count == 4
     
     @patch('netdash.login_tracker.LoginTracker.get_active_logins')
     def test_get_active_logins_table(self, mock_get_active_logins):
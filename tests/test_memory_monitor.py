@@ -4,6 +4,10 @@ Test Memory Monitor Module
 """
 
 import pytest
+from unittest.mock import patch
+
+import psutil
+
 from netdash.memory_monitor import MemoryMonitor
 
 
@@ -25,6 +29,11 @@ def test_memory_monitor_colors():
     assert monitor._get_color_for_percentage(60) == "yellow"
     assert monitor._get_color_for_percentage(80) == "dark_orange"
     assert monitor._get_color_for_percentage(95) == "red"
+    
+    # Thresholds belong to the higher bucket
+    assert monitor._get_color_for_percentage(50) == "yellow"
+    assert monitor._get_color_for_percentage(75) == "dark_orange"
+    assert monitor._get_color_for_percentage(90) == "red"
 
 
 def test_memory_monitor_format_bytes():
@@ -35,6 +44,12 @@ def test_memory_monitor_format_bytes():
     assert monitor._format_bytes(1048576) == "1.0 MB"
     assert monitor._format_bytes(1073741824) == "1.0 GB"
     assert monitor._format_bytes(1099511627776) == "1.0 TB"
+    
+    # Unit boundaries and values beyond the largest unit
+    assert monitor._format_bytes(0) == "0.0 B"
+    assert monitor._format_bytes(1023) == "1023.0 B"
+    assert monitor._format_bytes(1048575) == "1024.0 KB"
+    assert monitor._format_bytes(1 << 50) == "1024.0 TB"
 
 
 def test_memory_monitor_table():
@@ -58,3 +73,27 @@ def test_memory_monitor_summary():
     assert summary is not None
     assert "Total RAM" in str(summary)
     assert "Memory Usage" in str(summary)
+
+
+def test_memory_monitor_panel_single_update():
+    """Test the rich panel reads the memory counters once"""
+    monitor = MemoryMonitor(refresh_interval=0)
+    with patch('psutil.virtual_memory', wraps=psutil.virtual_memory) as mock_memory:
+        monitor.get_rich_panel()
+        assert mock_memory.call_count == 1
+        
+        # refresh=False reuses the statistics read last
+        monitor.get_table(refresh=False)
+        monitor.get_summary(refresh=False)
+        assert mock_memory.call_count == 1
+
+
+def test_memory_monitor_table_reused_until_stats_change():
+    """Test the table is only rebuilt when the memory statistics change"""
+    monitor = MemoryMonitor()
+    table = monitor.get_table(refresh=False)
+    assert monitor.get_table(refresh=False) is table
+    
+    # Any stored value is shown somewhere, not just the usage percentages
+    monitor._memory_stats = dict(monitor._memory_stats, free=monitor._memory_stats['free'] + 1)
+    assert monitor.get_table(refresh=False) is not table
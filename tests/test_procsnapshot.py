@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Tests for the procsnapshot module
+"""
+
+from unittest.mock import patch
+from netdash.procsnapshot import ProcSnapshot
+
+
+def test_snapshot_reads_each_counter_once():
+    """Test counters are read lazily and memoized for the snapshot's lifetime"""
+    with patch('netdash.procsnapshot.psutil.getloadavg', return_value=(1.0, 0.5, 0.25)) as mock_load:
+        snapshot = ProcSnapshot()
+        mock_load.assert_not_called()
+        
+        assert snapshot.loadavg == (1.0, 0.5, 0.25)
+        assert snapshot.loadavg == (1.0, 0.5, 0.25)
+        assert mock_load.call_count == 1